@@ -0,0 +1,168 @@
+"""Benchmark subtitleLocator drawing over simulated playback.
+
+Runs the draw override against the fake Maya API in plain CPython.
+
+Usage:
+    python benchmarks/bench_locator.py
+    python benchmarks/bench_locator.py --cues 10000 --frames 5000
+    python benchmarks/bench_locator.py --save-baseline
+    python benchmarks/bench_locator.py --compare
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import harness
+from harness import OpenMaya
+
+BENCHMARK_NAME = "bench_locator"
+
+# positionX/Y offsets of the copies in the offset-locator outline (about a
+# pixel in an HD viewport)
+OUTLINE_OFFSETS = ((-0.001, -0.002), (-0.001, 0.002), (0.001, -0.002), (0.001, 0.002))
+
+
+def make_scene(
+    module, srt_path, count, wrap=True, word_wrap=True, highlight=False, styled=False
+):
+    """Create ``count`` locators showing the same subtitle file.
+
+    ``styled`` turns on the outline and the background box.
+    """
+    nodes = []
+    for i in range(count):
+        node = OpenMaya.create_node(
+            "subtitleLocator", f"subtitleLocator{i + 1}Shape", f"subtitleLocator{i + 1}"
+        )
+        node.values["subtitleFile"] = str(srt_path)
+        node.values["wrapText"] = wrap
+        node.values["wordWrap"] = word_wrap
+        node.values["maxCharsPerLine"] = 40
+        node.values["highlightWords"] = highlight
+        if styled:
+            node.values["textEffect"] = 2  # Outline
+            node.values["backgroundBox"] = True
+        nodes.append(node)
+    return nodes
+
+
+def run_scenarios(
+    srt_path, ja_srt_path, words_srt_path, cue_count, frame_count, seed=0
+):
+    """Run every scenario and return a dict of scenario -> metrics.
+
+    ``words_srt_path`` has a word timing sidecar (highlight scenario).
+    """
+    last_frame = cue_count * 60  # 2.5 s per cue at 24 fps
+    linear = list(range(frame_count))
+    rng = random.Random(seed)
+    scrub = [rng.randrange(last_frame) for _ in range(frame_count)]
+    # Scrubbing back and forth through dense dialogue (about a cue every
+    # 5 frames drawn), mostly backwards
+    jog = []
+    frame = last_frame // 2
+    while len(jog) < frame_count:
+        step = 12 if rng.random() < 0.3 else -12
+        jog.extend(range(frame, frame + step * 10, step))
+        frame += step * 10
+    jog = [min(max(frame, 0), last_frame) for frame in jog[:frame_count]]
+
+    scenarios = {
+        "linear_1": (srt_path, 1, True, True, linear, False),
+        "scrub_1": (srt_path, 1, True, True, scrub, False),
+        "linear_1_nowrap": (srt_path, 1, False, True, linear, False),
+        "linear_1_charwrap_ja": (ja_srt_path, 1, True, False, linear, False),
+        "linear_20": (srt_path, 20, True, True, linear, False),
+        "scrub_20": (srt_path, 20, True, True, scrub, False),
+        "linear_1_baked": (srt_path, 1, True, True, linear, True),
+        "jog_1": (srt_path, 1, True, True, jog, False),
+        "jog_1_idle": (srt_path, 1, True, True, jog, False),
+        "linear_1_highlight": (words_srt_path, 1, True, True, linear, False),
+        "linear_1_styled": (srt_path, 1, True, True, linear, False),
+        # The outline faked with four offset copies of the locator
+        "linear_5_offset": (srt_path, 5, True, True, linear, False),
+    }
+
+    results = {}
+    for name, (path, count, wrap, word_wrap, frames, baked) in scenarios.items():
+        # Let timer callbacks (idle-time cue prefetch) run between frames
+        idle = name.endswith("_idle")
+        highlight = name.endswith("_highlight")
+        styled = name.endswith("_styled")
+        module = harness.load_plugin()
+        nodes = make_scene(module, path, count, wrap, word_wrap, highlight, styled)
+        if name.endswith("_offset"):
+            for node, (dx, dy) in zip(nodes[1:], OUTLINE_OFFSETS):
+                node.values["positionX"] = dx
+                node.values["positionY"] = module.DEFAULT_POSITION_Y + dy
+        viewport = harness.Viewport(module, nodes)
+        if baked:
+            # Playblast mode: every frame precomputed by subtitleLocatorBake
+            names = [node.name for node in nodes]
+            OpenMaya.run_command(
+                "subtitleLocatorBake", *names, "-sf", min(frames), "-ef", max(frames)
+            )
+
+        # First frame loads the subtitle file; measure it separately
+        harness.set_frame(frames[0])
+        load = harness.measure(viewport, frames[:1], alloc_frames=0)
+
+        metrics = harness.measure(viewport, frames, idle_between=idle)
+        metrics["first_frame_ms"] = load["ms_per_frame"]
+        results[name] = metrics
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, default=10000, help="Cues in the SRT")
+    parser.add_argument("--frames", type=int, default=2000, help="Frames per run")
+    parser.add_argument("--json", type=Path, help="Write results to a JSON file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Save results as baseline"
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="Compare with the saved baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed fps slowdown against the baseline (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        srt_path = harness.write_srt(Path(tmp) / "en.srt", args.cues)
+        ja_srt_path = harness.write_srt(Path(tmp) / "ja.srt", args.cues, "ja")
+        words_srt_path = harness.write_srt(
+            Path(tmp) / "words.srt", args.cues, words=True
+        )
+        results = run_scenarios(
+            srt_path, ja_srt_path, words_srt_path, args.cues, args.frames
+        )
+
+    harness.print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        print(f"Saved baseline: {harness.save_baseline(BENCHMARK_NAME, results)}")
+
+    if args.compare:
+        regressions = harness.compare_baseline(BENCHMARK_NAME, results, args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
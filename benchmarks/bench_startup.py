@@ -0,0 +1,138 @@
+"""Benchmark maya_subtitler startup: package import, plug-in load and UI.
+
+Each run starts a fresh interpreter with the fake Maya (``maya.cmds`` and
+``maya.api`` already imported, as in a Maya session) and times the steps
+a user goes through, in order.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --json result.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import harness
+
+# load_plugins calls timed after the first one (a UI action each)
+REPEATS = 1000
+
+STEPS = (
+    ("import", "import maya_subtitler"),
+    ("load_plugins", "first load_plugins() (imports and initializes plug-ins)"),
+    ("load_plugins_again", f"mean of {REPEATS} more load_plugins() calls"),
+    ("show_ui", "first show_ui() (imports the UI)"),
+    ("show_ui_again", "second show_ui()"),
+)
+
+
+def _child():
+    """Run the steps once and print their metrics as JSON."""
+    sys.path.insert(0, str(harness.REPO_ROOT / "scripts"))
+    import maya.cmds as cmds
+    import maya.utils  # noqa: F401
+
+    results = {}
+
+    def step(name, function, repeats=1):
+        calls = cmds.calls["pluginInfo"]
+        modules = len(sys.modules)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            function()
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "ms": elapsed * 1000.0 / repeats,
+            "plugin_info": (cmds.calls["pluginInfo"] - calls) / repeats,
+            "modules": len(sys.modules) - modules,
+        }
+
+    package = {}
+
+    def import_package():
+        import maya_subtitler
+
+        package["module"] = maya_subtitler
+
+    step("import", import_package)
+    step("load_plugins", lambda: package["module"].load_plugins())
+    step("load_plugins_again", lambda: package["module"].load_plugins(), REPEATS)
+    step("show_ui", lambda: package["module"].show_ui())
+    step("show_ui_again", lambda: package["module"].show_ui())
+    print(json.dumps(results))
+
+
+def run(runs, dev=False):
+    """Run the steps in ``runs`` fresh interpreters.
+
+    Returns:
+        Dict of step -> metrics (median time over the runs)
+    """
+    env = dict(os.environ)
+    env["MAYA_PLUG_IN_PATH"] = str(harness.REPO_ROOT / "plug-ins")
+    env["PYTHONPATH"] = str(harness.REPO_ROOT)
+    env["MAYA_SUBTITLER_DEV"] = "1" if dev else "0"
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child"],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output.splitlines()[-1]))
+
+    results = {}
+    for name, _ in STEPS:
+        metrics = dict(samples[0][name])
+        times = [sample[name]["ms"] for sample in samples]
+        metrics["ms"] = statistics.median(times)
+        metrics["max_ms"] = max(times)
+        results[name] = metrics
+    return results
+
+
+def print_results(results):
+    print(
+        f"{'mode':<6} {'step':<20} {'ms':>9} {'max ms':>9} "
+        f"{'pluginInfo':>11} {'modules':>8}"
+    )
+    for mode, steps in results.items():
+        for name, metrics in steps.items():
+            print(
+                f"{mode:<6} {name:<20} {metrics['ms']:>9.3f} "
+                f"{metrics['max_ms']:>9.3f} {metrics['plugin_info']:>11.1f} "
+                f"{metrics['modules']:>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters")
+    parser.add_argument("--json", type=Path, help="Write results to a JSON file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return
+
+    results = {
+        "prod": run(args.runs),
+        "dev": run(args.runs, dev=True),
+    }
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
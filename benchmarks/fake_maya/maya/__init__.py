@@ -0,0 +1 @@
+"""Headless stand-in for the parts of Maya used by maya-subtitler."""
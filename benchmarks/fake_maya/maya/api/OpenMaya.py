@@ -0,0 +1,738 @@
+"""Minimal stand-in for maya.api.OpenMaya.
+
+Only the pieces used by the subtitle plug-ins are implemented. Nodes are
+plain Python objects holding attribute values in a dict, so plug reads cost
+roughly what a dict lookup plus a wrapper object costs.
+"""
+
+import sys
+from typing import ClassVar
+
+# Counters read by the benchmarks
+counters = {"plug_reads": 0}
+
+
+class MTypeId:
+    def __init__(self, value):
+        self.value = value
+
+
+class MObject:
+    """Fake dependency node."""
+
+    kNullObj = None
+
+    def __init__(self, type_name="", name=""):
+        self.type_name = type_name
+        self.name = name
+        self.values = {}
+        self.connections = {}
+        self.parent = None
+        self.user_node = None
+
+    def isNull(self):
+        return False
+
+    def hasFn(self, fn):
+        return fn == MFn.kTransform and self.type_name == "transform"
+
+
+MObject.kNullObj = MObject("null")
+
+
+class MObjectHandle:
+    def __init__(self, obj):
+        self._obj = obj
+
+    def object(self):
+        return self._obj
+
+    def hashCode(self):
+        return id(self._obj)
+
+    def isValid(self):
+        return True
+
+    def isAlive(self):
+        return True
+
+
+class MDagPath:
+    def __init__(self, node=None):
+        self._node = node
+
+    @staticmethod
+    def getAPathTo(node):
+        return MDagPath(node)
+
+    def node(self):
+        return self._node
+
+    def fullPathName(self):
+        parts = []
+        node = self._node
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "|" + "|".join(reversed(parts))
+
+    def partialPathName(self):
+        return self._node.name
+
+    def extendToShape(self):
+        for obj in MSelectionList.registry.values():
+            if obj.parent is self._node:
+                self._node = obj
+                return self
+        raise RuntimeError(f"No shape below {self._node.name}")
+
+
+class MColor:
+    def __init__(self, value=(0.0, 0.0, 0.0), alpha=1.0):
+        value = tuple(value)
+        self.r, self.g, self.b = value[:3]
+        self.a = value[3] if len(value) > 3 else alpha
+
+    def __iter__(self):
+        return iter((self.r, self.g, self.b, self.a))
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+
+class MPoint:
+    def __init__(self, x=0.0, y=0.0, z=0.0, w=1.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+
+
+class MVector:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class MTime:
+    kInvalid = 0
+    kHours = 1
+    kMinutes = 2
+    kSeconds = 3
+    kMilliseconds = 4
+    kFilm = 6
+    kPALFrame = 7
+    kNTSCFrame = 8
+
+    _UNIT_SECONDS: ClassVar[dict] = {
+        kHours: 3600.0,
+        kMinutes: 60.0,
+        kSeconds: 1.0,
+        kMilliseconds: 0.001,
+        kFilm: 1.0 / 24.0,
+        kPALFrame: 1.0 / 25.0,
+        kNTSCFrame: 1.0 / 30.0,
+    }
+
+    def __init__(self, value=0.0, unit=kFilm):
+        self.value = value
+        self.unit = unit
+
+    def asUnits(self, unit):
+        seconds = self.value * self._UNIT_SECONDS[self.unit]
+        return seconds / self._UNIT_SECONDS[unit]
+
+
+class MDataHandle:
+    def __init__(self, value):
+        self._value = value
+
+    def asFloat3(self):
+        return tuple(self._value)
+
+
+class MPlug:
+    def __init__(self, node=None, attribute=None):
+        counters["plug_reads"] += 1
+        self._node = node
+        self._attr = attribute
+
+    def _value(self):
+        return self._node.values.get(self._attr.name, self._attr.default)
+
+    def node(self):
+        return self._node
+
+    def attribute(self):
+        return self._attr
+
+    def child(self, index):
+        return MPlug(
+            self._node, _Attribute(self._attr.name + "RGB"[index], "", "float")
+        )
+
+    def name(self):
+        return f"{self._node.name}.{self._attr.name}"
+
+    def asInt(self):
+        return int(self._value())
+
+    def asShort(self):
+        return int(self._value())
+
+    def asFloat(self):
+        return float(self._value())
+
+    def asDouble(self):
+        return float(self._value())
+
+    def asBool(self):
+        return bool(self._value())
+
+    def asString(self):
+        return str(self._value() or "")
+
+    def asMDataHandle(self):
+        return MDataHandle(self._value())
+
+    def setInt(self, value):
+        self._node.values[self._attr.name] = int(value)
+
+    def setShort(self, value):
+        self._node.values[self._attr.name] = int(value)
+
+    def setFloat(self, value):
+        self._node.values[self._attr.name] = float(value)
+
+    def setDouble(self, value):
+        self._node.values[self._attr.name] = float(value)
+
+    def setBool(self, value):
+        self._node.values[self._attr.name] = bool(value)
+
+    def setString(self, value):
+        self._node.values[self._attr.name] = str(value)
+
+    @property
+    def isConnected(self):
+        return bool(self._node.connections.get(self._attr.name))
+
+    def connectedTo(self, asDst, asSrc):
+        return list(self._node.connections.get(self._attr.name, []))
+
+
+class MFnData:
+    kString = "string"
+
+
+class MFnNumericData:
+    kBoolean = "bool"
+    kShort = "short"
+    kInt = "int"
+    kFloat = "float"
+    kDouble = "double"
+    k3Float = "float3"
+
+
+class _Attribute:
+    def __init__(self, name, short_name, data_type, default=None):
+        self.name = name
+        self.short_name = short_name
+        self.data_type = data_type
+        self.default = default
+
+    def hasFn(self, fn):
+        return fn == MFn.kTimeAttribute and self.data_type == "time"
+
+
+class MFnAttribute:
+    def __init__(self):
+        self._attr = None
+        self.keyable = False
+        self.storable = True
+        self.writable = True
+        self.readable = True
+        self.hidden = False
+        self.internal = False
+
+    @property
+    def default(self):
+        return self._attr.default
+
+    @default.setter
+    def default(self, value):
+        self._attr.default = value
+
+    def setMin(self, value):
+        pass
+
+    def setMax(self, value):
+        pass
+
+    def setSoftMin(self, value):
+        pass
+
+    def setSoftMax(self, value):
+        pass
+
+
+class MFnTypedAttribute(MFnAttribute):
+    def create(self, name, short_name, data_type, default=None):
+        self._attr = _Attribute(name, short_name, data_type, default)
+        return self._attr
+
+
+class MFnNumericAttribute(MFnAttribute):
+    def create(self, name, short_name, data_type, default=0):
+        self._attr = _Attribute(name, short_name, data_type, default)
+        return self._attr
+
+    def createColor(self, name, short_name):
+        self._attr = _Attribute(name, short_name, MFnNumericData.k3Float, (0, 0, 0))
+        return self._attr
+
+
+class MFnMessageAttribute(MFnAttribute):
+    def create(self, name, short_name):
+        self._attr = _Attribute(name, short_name, "message")
+        return self._attr
+
+
+class MFnEnumAttribute(MFnAttribute):
+    def create(self, name, short_name, default=0):
+        self._attr = _Attribute(name, short_name, "enum", default)
+        return self._attr
+
+    def addField(self, name, value):
+        pass
+
+
+class MFnDependencyNode:
+    def __init__(self, obj=None):
+        self._obj = obj
+
+    def setObject(self, obj):
+        self._obj = obj
+
+    def setName(self, name):
+        self._obj.name = name.replace("#", "1")
+        return self._obj.name
+
+    def name(self):
+        return self._obj.name
+
+    @property
+    def typeName(self):
+        return self._obj.type_name
+
+    def findPlug(self, name, want_networked):
+        for attr in _node_attributes(self._obj):
+            if name in (attr.name, attr.short_name):
+                return MPlug(self._obj, attr)
+        raise RuntimeError(f"No plug named {name}")
+
+
+# Attribute lists per node type, filled by MPxNode.addAttribute and
+# preset for the Maya node types the plug-ins create
+_NODE_ATTRIBUTES = {
+    "timeSliderBookmark": [
+        _Attribute("name", "n", "string"),
+        _Attribute("timeRangeStart", "trs", "time", 0.0),
+        _Attribute("timeRangeStop", "tre", "time", 0.0),
+        _Attribute("color", "c", "float3", (0.0, 0.0, 0.0)),
+    ]
+}
+
+
+def _node_attributes(obj):
+    return _NODE_ATTRIBUTES.get(obj.type_name, [])
+
+
+class MPxNode:
+    kLocatorNode = 1
+    kDependNode = 0
+
+    _type_name = ""
+
+    def __init__(self):
+        self._this = MObject(self._type_name)
+        self._this.user_node = self
+
+    def thisMObject(self):
+        return self._this
+
+    @classmethod
+    def addAttribute(cls, attribute):
+        _NODE_ATTRIBUTES.setdefault(cls._type_name, []).append(attribute)
+
+    @classmethod
+    def attributeAffects(cls, source, destination):
+        pass
+
+
+class MPxCommand:
+    def __init__(self):
+        self._result = None
+
+    def setResult(self, value):
+        self._result = value
+
+    def appendToResult(self, value):
+        if self._result is None:
+            self._result = []
+        self._result.append(value)
+
+    @staticmethod
+    def setResultStatic(value):
+        pass
+
+    def syntax(self):
+        return self._syntax
+
+
+class MSyntax:
+    kNoArg = 0
+    kBoolean = 1
+    kLong = 2
+    kDouble = 3
+    kString = 4
+    kSelectionItem = 5
+    kTime = 6
+    kNone = 0
+    kStringObjects = 1
+
+    def __init__(self):
+        self.flags = {}
+
+    def addFlag(self, short_name, long_name, *arg_types):
+        self.flags[short_name] = (long_name, arg_types)
+
+    def setObjectType(self, object_type, minimum=0, maximum=None):
+        pass
+
+    def useSelectionAsDefault(self, value):
+        pass
+
+    def enableQuery(self, value=True):
+        pass
+
+    def enableEdit(self, value=True):
+        pass
+
+
+class MArgList:
+    def __init__(self, args=None):
+        self._args = list(args or [])
+
+
+class MArgParser:
+    """Parses a flat list like ["-name", "foo", "-fs", 24, "node1"]."""
+
+    def __init__(self, syntax, args):
+        self._flags = {}
+        self._objects = []
+        aliases = {}
+        for short_name, (long_name, arg_types) in syntax.flags.items():
+            aliases[short_name] = (short_name, len(arg_types))
+            aliases[long_name] = (short_name, len(arg_types))
+
+        tokens = list(args._args)
+        while tokens:
+            token = tokens.pop(0)
+            if isinstance(token, str) and token in aliases:
+                short_name, count = aliases[token]
+                self._flags[short_name] = [tokens.pop(0) for _ in range(count)]
+            else:
+                self._objects.append(token)
+
+    def isFlagSet(self, flag):
+        return flag in self._flags
+
+    def flagArgumentString(self, flag, index):
+        return str(self._flags[flag][index])
+
+    def flagArgumentInt(self, flag, index):
+        return int(self._flags[flag][index])
+
+    def flagArgumentDouble(self, flag, index):
+        return float(self._flags[flag][index])
+
+    def flagArgumentBool(self, flag, index):
+        return bool(self._flags[flag][index])
+
+    def getObjectStrings(self):
+        return [str(obj) for obj in self._objects]
+
+    @property
+    def isQuery(self):
+        return False
+
+    @property
+    def isEdit(self):
+        return False
+
+
+class MUserData:
+    def __init__(self, deleteAfterUse=False):
+        self.deleteAfterUse = deleteAfterUse
+
+
+class MGlobal:
+    messages: ClassVar[list] = []
+
+    @staticmethod
+    def displayWarning(message):
+        MGlobal.messages.append(("warning", message))
+
+    @staticmethod
+    def displayError(message):
+        MGlobal.messages.append(("error", message))
+
+    @staticmethod
+    def displayInfo(message):
+        MGlobal.messages.append(("info", message))
+
+    @staticmethod
+    def getSelectionListByName(name):
+        sel = MSelectionList()
+        sel.add(name)
+        return sel
+
+
+class MFn:
+    kTransform = 110
+    kTimeAttribute = 264
+    kPluginDependNode = 448
+    kPluginLocatorNode = 449
+
+
+class MItDependencyNodes:
+    """Iterate the nodes created with ``create_node`` or a modifier."""
+
+    def __init__(self, filter_type=None):
+        self._nodes = [
+            obj
+            for obj in MSelectionList.registry.values()
+            if obj.type_name != "transform"
+        ]
+        self._index = 0
+
+    def isDone(self):
+        return self._index >= len(self._nodes)
+
+    def thisNode(self):
+        return self._nodes[self._index]
+
+    def next(self):
+        self._index += 1
+
+
+class MSelectionList:
+    # Name -> MObject registry shared with the benchmarks
+    registry: ClassVar[dict] = {}
+
+    def __init__(self):
+        self._items = []
+
+    def add(self, name):
+        if name not in self.registry:
+            raise RuntimeError(f"No object matches name: {name}")
+        self._items.append(self.registry[name])
+        return self
+
+    def length(self):
+        return len(self._items)
+
+    def getDependNode(self, index):
+        return self._items[index]
+
+    def getDagPath(self, index):
+        return MDagPath(self._items[index])
+
+
+class MDGModifier:
+    def __init__(self):
+        self.operations = []
+
+    def createNode(self, type_name):
+        obj = MObject(type_name, type_name + "1")
+        self.operations.append(("create", obj))
+        return obj
+
+    def renameNode(self, obj, name):
+        obj.name = name
+
+    def newPlugValueString(self, plug, value):
+        self.operations.append(("set", plug, value))
+
+    def newPlugValueInt(self, plug, value):
+        self.operations.append(("set", plug, value))
+
+    def newPlugValueDouble(self, plug, value):
+        self.operations.append(("set", plug, value))
+
+    def newPlugValueFloat(self, plug, value):
+        self.operations.append(("set", plug, value))
+
+    def newPlugValueBool(self, plug, value):
+        self.operations.append(("set", plug, value))
+
+    def newPlugValueMTime(self, plug, value):
+        self.operations.append(("set", plug, value.value))
+
+    def newPlugValue(self, plug, value):
+        self.operations.append(("set", plug, value))
+
+    def deleteNode(self, obj):
+        self.operations.append(("delete", obj))
+
+    def doIt(self):
+        for op in self.operations:
+            if op[0] == "set":
+                _, plug, value = op
+                plug._node.values[plug._attr.name] = value
+            elif op[0] == "create" and op[1].type_name in _NODE_ATTRIBUTES:
+                MSelectionList.registry[op[1].name] = op[1]
+            elif op[0] == "delete":
+                MSelectionList.registry.pop(op[1].name, None)
+
+    def undoIt(self):
+        pass
+
+
+class MDagModifier(MDGModifier):
+    def createNode(self, type_name, parent=None):
+        obj = MObject(type_name, type_name + "1")
+        obj.parent = parent
+        self.operations.append(("create", obj))
+        return obj
+
+
+class MMessage:
+    callbacks: ClassVar[dict] = {}
+    _next_id = 1
+
+    @classmethod
+    def _add(cls, callback):
+        callback_id = MMessage._next_id
+        MMessage._next_id += 1
+        MMessage.callbacks[callback_id] = callback
+        return callback_id
+
+    @staticmethod
+    def removeCallback(callback_id):
+        MMessage.callbacks.pop(callback_id, None)
+
+    @staticmethod
+    def removeCallbacks(callback_ids):
+        for callback_id in callback_ids:
+            MMessage.callbacks.pop(callback_id, None)
+
+
+class MTimerMessage(MMessage):
+    # Callback id -> client data, fired by fire_timers
+    timers: ClassVar[dict] = {}
+
+    @classmethod
+    def addTimerCallback(cls, period, callback, client_data=None):
+        callback_id = cls._add(callback)
+        MTimerMessage.timers[callback_id] = client_data
+        return callback_id
+
+
+class MEventMessage(MMessage):
+    @classmethod
+    def addEventCallback(cls, event_name, callback, client_data=None):
+        return cls._add(callback)
+
+
+class MSceneMessage(MMessage):
+    kAfterOpen = 1
+    kBeforeNew = 2
+    kAfterNew = 3
+    kBeforeOpen = 4
+    kBeforeSave = 5
+    kAfterPluginUnload = 6
+
+    # Callback id -> message, fired by fire
+    messages: ClassVar[dict] = {}
+
+    @classmethod
+    def addCallback(cls, message, callback, client_data=None):
+        callback_id = cls._add(callback)
+        MSceneMessage.messages[callback_id] = message
+        return callback_id
+
+    @classmethod
+    def addStringArrayCallback(cls, message, callback, client_data=None):
+        return cls.addCallback(message, callback, client_data)
+
+    @classmethod
+    def fire(cls, message, *args):
+        """Call the callbacks registered for a message."""
+        for callback_id, registered in list(MSceneMessage.messages.items()):
+            callback = MMessage.callbacks.get(callback_id)
+            if registered == message and callback is not None:
+                callback(*args)
+
+
+class MFnPlugin:
+    registered: ClassVar[dict] = {"nodes": {}, "commands": {}}
+
+    def __init__(self, obj=None, vendor="", version="", api_version="Any"):
+        pass
+
+    def registerNode(
+        self, name, type_id, creator, initialize, node_type=0, classification=""
+    ):
+        MFnPlugin.registered["nodes"][name] = (creator, initialize)
+        node_class = type(creator())
+        node_class._type_name = name
+        # Re-run initialize now that attributes know their node type
+        _NODE_ATTRIBUTES.pop(name, None)
+        initialize()
+
+    def deregisterNode(self, type_id):
+        pass
+
+    def registerCommand(self, name, creator, syntax_creator=None):
+        MFnPlugin.registered["commands"][name] = (creator, syntax_creator)
+
+    def deregisterCommand(self, name):
+        MFnPlugin.registered["commands"].pop(name, None)
+
+
+def create_node(type_name, name, parent_name=None):
+    """Create a fake node of a registered plug-in type (benchmark helper)."""
+    creator, _ = MFnPlugin.registered["nodes"][type_name]
+    user_node = creator()
+    obj = user_node.thisMObject()
+    obj.name = name
+    if parent_name is not None:
+        obj.parent = MObject("transform", parent_name)
+        MSelectionList.registry[parent_name] = obj.parent
+    MSelectionList.registry[name] = obj
+    return obj
+
+
+def fire_timers(elapsed=0.0):
+    """Run every registered timer callback once (benchmark helper)."""
+    for callback_id, client_data in list(MTimerMessage.timers.items()):
+        callback = MMessage.callbacks.get(callback_id)
+        if callback is None:
+            del MTimerMessage.timers[callback_id]
+        else:
+            callback(elapsed, elapsed, client_data)
+
+
+def run_command(name, *args):
+    """Run a registered plug-in command with flat arguments (benchmark helper)."""
+    creator, syntax_creator = MFnPlugin.registered["commands"][name]
+    command = creator()
+    command._syntax = syntax_creator() if syntax_creator else MSyntax()
+    command.doIt(MArgList(args))
+    return command._result
+
+
+sys.modules.setdefault("maya.api.OpenMaya", sys.modules[__name__])
@@ -0,0 +1,28 @@
+"""Minimal stand-in for maya.api.OpenMayaAnim."""
+
+from .OpenMaya import MTime
+
+
+class MAnimControl:
+    _current = MTime(0.0, MTime.kFilm)
+    _playing = False
+
+    @staticmethod
+    def currentTime():
+        return MAnimControl._current
+
+    @staticmethod
+    def setCurrentTime(time):
+        MAnimControl._current = time
+
+    @staticmethod
+    def isPlaying():
+        return MAnimControl._playing
+
+    @staticmethod
+    def minTime():
+        return MTime(1.0, MAnimControl._current.unit)
+
+    @staticmethod
+    def maxTime():
+        return MTime(120.0, MAnimControl._current.unit)
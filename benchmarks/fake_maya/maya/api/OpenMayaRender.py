@@ -0,0 +1,87 @@
+"""Minimal stand-in for maya.api.OpenMayaRender."""
+
+from typing import ClassVar
+
+from . import OpenMaya
+
+# Draw call counters read by the benchmarks
+counters = {"draw_calls": 0, "drawables": 0}
+
+
+class MRenderer:
+    kNone = 0
+    kOpenGL = 1
+    kDirectX11 = 2
+    kOpenGLCoreProfile = 4
+    kAllDevices = 7
+
+
+class MFrameContext:
+    def __init__(self, width=1920, height=1080):
+        self._dimensions = (0, 0, width, height)
+
+    def getViewportDimensions(self):
+        return self._dimensions
+
+
+class MUIDrawManager:
+    kLeft = 0
+    kCenter = 1
+    kRight = 2
+
+    kDefaultFontSize = 12
+    kSmallFontSize = 9
+
+    def __init__(self):
+        self.calls = []
+        self.record = False
+
+    def _call(self, name, *args):
+        counters["draw_calls"] += 1
+        if self.record:
+            self.calls.append((name, args))
+
+    def beginDrawable(self, *args):
+        counters["drawables"] += 1
+
+    def endDrawable(self):
+        pass
+
+    def setFontSize(self, size):
+        self._call("setFontSize", size)
+
+    def setColor(self, color):
+        self._call("setColor", color)
+
+    def setLineWidth(self, width):
+        self._call("setLineWidth", width)
+
+    def text2d(self, position, text, *args):
+        self._call("text2d", position, text)
+
+    def rect2d(self, center, up, scale_x, scale_y, filled=False):
+        self._call("rect2d", center, up, scale_x, scale_y, filled)
+
+
+class MPxDrawOverride:
+    def __init__(self, obj, callback, isAlwaysDirty=True):
+        self._obj = obj
+        self.isAlwaysDirty = isAlwaysDirty
+
+
+class MDrawRegistry:
+    creators: ClassVar[dict] = {}
+
+    @staticmethod
+    def registerDrawOverrideCreator(classification, registrant, creator):
+        MDrawRegistry.creators[classification] = creator
+
+    @staticmethod
+    def deregisterDrawOverrideCreator(classification, registrant):
+        MDrawRegistry.creators.pop(classification, None)
+
+
+class MGeometryUtilities:
+    @staticmethod
+    def wireframeColor(path):
+        return OpenMaya.MColor((1.0, 1.0, 1.0))
@@ -0,0 +1,15 @@
+"""Minimal stand-in for maya.api.OpenMayaUI."""
+
+from .OpenMaya import MPxNode
+
+
+class MPxLocatorNode(MPxNode):
+    pass
+
+
+class M3dView:
+    refreshes = 0
+
+    @staticmethod
+    def scheduleRefreshAllViews():
+        M3dView.refreshes += 1
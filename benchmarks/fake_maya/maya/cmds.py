@@ -0,0 +1,76 @@
+"""Minimal stand-in for maya.cmds.
+
+``loadPlugin`` imports a plug-in (a .py path, or a name looked up on
+MAYA_PLUG_IN_PATH) and runs its initializePlugin like Maya does. Commands
+that are not defined here are accepted and return None, so UI code runs
+headless. Every call is counted in ``calls``.
+"""
+
+import importlib.util
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+from maya.api import OpenMaya
+
+# Command name -> number of calls
+calls = Counter()
+
+# Plug-in name -> module
+plugins = {}
+
+
+def _find_plugin(path):
+    path = Path(path)
+    if path.suffix == ".py":
+        return path
+    for directory in os.environ.get("MAYA_PLUG_IN_PATH", "").split(os.pathsep):
+        candidate = Path(directory) / f"{path.name}.py"
+        if directory and candidate.exists():
+            return candidate
+    raise RuntimeError(f"Plug-in not found: {path}")
+
+
+def loadPlugin(path, quiet=False):
+    calls["loadPlugin"] += 1
+    path = _find_plugin(path)
+    name = path.stem
+    if name not in plugins:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        module.initializePlugin(OpenMaya.MObject("plugin"))
+        plugins[name] = module
+    return [name]
+
+
+def unloadPlugin(name, force=False):
+    calls["unloadPlugin"] += 1
+    module = plugins.pop(name)
+    module.uninitializePlugin(OpenMaya.MObject("plugin"))
+    OpenMaya.MSceneMessage.fire(OpenMaya.MSceneMessage.kAfterPluginUnload, [name])
+
+
+def pluginInfo(name=None, query=False, loaded=False, listPlugins=False, **kwargs):
+    calls["pluginInfo"] += 1
+    if listPlugins:
+        return list(plugins) or None
+    if loaded:
+        return Path(name).stem in plugins
+    return None
+
+
+def reset():
+    """Unload every plug-in without callbacks and clear the call counts."""
+    plugins.clear()
+    calls.clear()
+
+
+def __getattr__(name):
+    def command(*args, **kwargs):
+        calls[name] += 1
+
+    command.__name__ = name
+    return command
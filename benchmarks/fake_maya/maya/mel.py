@@ -0,0 +1,5 @@
+"""Minimal stand-in for maya.mel."""
+
+
+def eval(command):
+    """Accept any MEL and return None (no MEL interpreter outside Maya)."""
@@ -0,0 +1,6 @@
+"""Minimal stand-in for maya.utils."""
+
+
+def executeDeferred(callable_object, *args, **kwargs):
+    """Run immediately; there is no idle queue outside Maya."""
+    callable_object(*args, **kwargs)
@@ -0,0 +1,278 @@
+"""Shared helpers for the headless benchmarks.
+
+Puts the fake ``maya`` package on ``sys.path``, loads plug-ins from the
+repository and handles timing, allocation measurement and baselines.
+"""
+
+import importlib.util
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+BASELINE_DIR = BENCH_DIR / "baselines"
+
+sys.path.insert(0, str(BENCH_DIR / "fake_maya"))
+
+from maya.api import OpenMaya, OpenMayaAnim, OpenMayaRender
+
+# Words used for synthetic subtitle text
+_EN_WORDS = [
+    "the",
+    "quick",
+    "brown",
+    "fox",
+    "jumps",
+    "over",
+    "lazy",
+    "dog",
+    "while",
+    "camera",
+    "pans",
+    "across",
+    "frozen",
+    "lake",
+    "and",
+    "distant",
+    "mountains",
+    "glow",
+    "under",
+    "evening",
+    "light",
+]
+_JA_CHARS = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん日本語字幕表示"
+
+
+def load_plugin(name="subtitleLocator"):
+    """Import a plug-in from plug-ins/ and run its initializePlugin.
+
+    A fresh module is created on every call, so class-level caches never
+    leak between scenarios.
+    """
+    path = REPO_ROOT / "plug-ins" / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    module.initializePlugin(OpenMaya.MObject("plugin"))
+    return module
+
+
+def write_srt(path, cue_count, language="en", seed=0, words=False):
+    """Write a synthetic SRT file.
+
+    Cues last 2 seconds with a 0.5 second gap and hold 20-120 characters.
+    With ``words``, a word timing sidecar (``.words.json``) is written too,
+    the words of each cue spread evenly over it.
+    """
+    rng = random.Random(seed)
+    cues = []
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(cue_count):
+            start = i * 2500
+            end = start + 2000
+            if language == "ja":
+                text = "".join(
+                    rng.choice(_JA_CHARS) for _ in range(rng.randint(10, 60))
+                )
+            else:
+                words = []
+                while sum(len(word) + 1 for word in words) < rng.randint(20, 120):
+                    words.append(rng.choice(_EN_WORDS))
+                text = " ".join(words)
+            f.write(f"{i + 1}\n{_timestamp(start)} --> {_timestamp(end)}\n{text}\n\n")
+            cues.append(_word_timings(start, end, text))
+    if words:
+        words_path = Path(path).with_suffix(".words.json")
+        words_path.write_text(
+            json.dumps({"version": 1, "cues": cues}), encoding="utf-8"
+        )
+    return path
+
+
+def _word_timings(start, end, text):
+    """Word timing sidecar entry with the space-separated words of a cue."""
+    spans = []
+    pos = 0
+    for token in text.split(" "):
+        spans += [pos, pos + len(token)]
+        pos += len(token) + 1
+    count = len(spans) // 2
+    times = []
+    for i in range(count):
+        times += [
+            start + (end - start) * i // count,
+            start + (end - start) * (i + 1) // count,
+        ]
+    return {"start": start, "spans": spans, "times": times}
+
+
+def _timestamp(millis):
+    secs, millis = divmod(millis, 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def set_frame(frame):
+    """Move the fake timeline to ``frame`` (24 fps)."""
+    OpenMayaAnim.MAnimControl.setCurrentTime(
+        OpenMaya.MTime(frame, OpenMaya.MTime.kFilm)
+    )
+
+
+class Viewport:
+    """One camera and viewport drawing a set of locator nodes."""
+
+    def __init__(self, module, nodes, width=1920, height=1080):
+        self.module = module
+        self.camera_path = OpenMaya.MDagPath(OpenMaya.MObject("camera", "perspShape"))
+        self.frame_context = OpenMayaRender.MFrameContext(width, height)
+        self.draw_manager = OpenMayaRender.MUIDrawManager()
+        override_class = module.SubtitleLocatorDrawOverride
+        self.items = [
+            [OpenMaya.MDagPath(node), override_class.creator(node), None]
+            for node in nodes
+        ]
+
+    def draw(self):
+        """Run prepareForDraw and addUIDrawables for every node."""
+        for item in self.items:
+            path, override, data = item
+            data = override.prepareForDraw(
+                path, self.camera_path, self.frame_context, data
+            )
+            override.addUIDrawables(path, self.draw_manager, self.frame_context, data)
+            item[2] = data
+
+
+def idle():
+    """Let Maya go idle between frames: fire the plug-ins' timer callbacks."""
+    OpenMaya.fire_timers()
+
+
+def measure(viewport, frames, alloc_frames=200, idle_between=False):
+    """Time a frame sequence and measure allocations per frame.
+
+    Args:
+        viewport: Viewport to draw
+        frames: Frame numbers to visit, in order
+        alloc_frames: Number of frames traced for allocation statistics
+        idle_between: Run ``idle`` after each frame (not timed)
+
+    Returns:
+        Dict of metrics
+    """
+    OpenMaya.counters["plug_reads"] = 0
+    OpenMayaRender.counters["draw_calls"] = 0
+
+    elapsed = 0.0
+    slowest = 0.0
+    for frame in frames:
+        set_frame(frame)
+        start = time.perf_counter()
+        viewport.draw()
+        frame_time = time.perf_counter() - start
+        elapsed += frame_time
+        slowest = max(slowest, frame_time)
+        if idle_between:
+            idle()
+
+    plug_reads = OpenMaya.counters["plug_reads"]
+    draw_calls = OpenMayaRender.counters["draw_calls"]
+
+    # Peak transient memory and allocated blocks per frame
+    traced = frames[:alloc_frames]
+    peak_bytes = 0
+    blocks = 0
+    tracemalloc.start()
+    try:
+        for frame in traced:
+            set_frame(frame)
+            tracemalloc.reset_peak()
+            before_size = tracemalloc.get_traced_memory()[0]
+            before_blocks = sys.getallocatedblocks()
+            viewport.draw()
+            peak_bytes += tracemalloc.get_traced_memory()[1] - before_size
+            blocks += max(sys.getallocatedblocks() - before_blocks, 0)
+    finally:
+        tracemalloc.stop()
+
+    count = len(frames)
+    return {
+        "frames": count,
+        "fps": count / elapsed if elapsed else 0.0,
+        "ms_per_frame": elapsed * 1000.0 / count,
+        "max_ms": slowest * 1000.0,
+        "plug_reads_per_frame": plug_reads / count,
+        "draw_calls_per_frame": draw_calls / count,
+        "alloc_bytes_per_frame": peak_bytes / max(len(traced), 1),
+        "retained_blocks_per_frame": blocks / max(len(traced), 1),
+    }
+
+
+def save_baseline(name, results):
+    """Save results as the baseline for a benchmark."""
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def compare_baseline(name, results, tolerance=0.2):
+    """Compare results with the saved baseline.
+
+    Args:
+        name: Benchmark name
+        results: Dict of scenario -> metrics
+        tolerance: Allowed relative slowdown in fps before failing
+
+    Returns:
+        List of regression messages (empty if none)
+    """
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        print(f"No baseline at {path}")
+        return []
+
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    print(f"\n{'scenario':<28} {'baseline fps':>14} {'fps':>12} {'change':>8}")
+    for scenario, metrics in results.items():
+        if scenario not in baseline:
+            continue
+        old = baseline[scenario]["fps"]
+        new = metrics["fps"]
+        change = (new - old) / old if old else 0.0
+        print(f"{scenario:<28} {old:>14.1f} {new:>12.1f} {change:>+8.1%}")
+        if change < -tolerance:
+            regressions.append(
+                f"{scenario}: {old:.1f} -> {new:.1f} fps ({change:+.1%})"
+            )
+    return regressions
+
+
+def print_results(results):
+    """Print a result table."""
+    print(
+        f"{'scenario':<28} {'fps':>10} {'ms/frame':>10} {'max ms':>8} {'plugs':>7} "
+        f"{'draws':>7} {'alloc B':>9} {'blocks':>7}"
+    )
+    for scenario, metrics in results.items():
+        print(
+            f"{scenario:<28} {metrics['fps']:>10.1f} "
+            f"{metrics['ms_per_frame']:>10.3f} "
+            f"{metrics.get('max_ms', 0.0):>8.3f} "
+            f"{metrics['plug_reads_per_frame']:>7.1f} "
+            f"{metrics['draw_calls_per_frame']:>7.1f} "
+            f"{metrics['alloc_bytes_per_frame']:>9.0f} "
+            f"{metrics['retained_blocks_per_frame']:>7.1f}"
+        )
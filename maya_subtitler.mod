@@ -1,3 +1,4 @@
 + maya_subtitler 1.0.0 .
 plug-ins: .\plug-ins
 scripts: .\scripts
+PYTHONPATH +:= .
@@ -2,10 +2,12 @@
 Subtitle Locator Node for Maya.
 
 A custom locator that displays subtitles synchronized with the timeline.
-Reads SRT files directly.
+Reads SRT, WebVTT, ASS and JSON lines files directly, or the binary sidecar
+index (.subidx) written by ``subtitler index`` when it is present and up to
+date.
 
 Attributes:
-    subtitleFile (string): Path to the SRT file
+    subtitleFile (string): Path to the subtitle file (srt, vtt, ass, jsonl)
     targetCamera (message): Camera to display subtitles in (connect camera shape)
     startFrame (int): Frame where subtitle time 0 begins (default: 0)
     fontSize (int): Font size for subtitle display
@@ -16,24 +18,89 @@ Attributes:
     wordWrap (bool): Wrap by words (True) or characters (False)
     maxCharsPerLine (int): Maximum characters per line
     maxLines (int): Maximum number of lines
+    highlightWords (bool): Highlight the spoken word (needs .words.json sidecar)
+    highlightColor (float3): Color of the highlighted word
+    displayMode (enum): Original text, Romaji, or both (needs ``subtitler``)
+    textEffect (enum): None, Shadow or Outline drawn under the text
+    effectColor (float3): Color of the shadow / outline
+    effectWidth (int): Shadow / outline offset in pixels
+    backgroundBox (bool): Draw a filled box behind the text
+    backgroundColor (float3): Box color RGB
+    backgroundOpacity (float): Box opacity (0 to 1)
+    backgroundPadding (int): Space between the text and the box edges in pixels
+    embeddedCues (string): Cue table saved with the scene (see subtitleEmbed)
+    embeddedChecksum (string): Checksum of the embedded file; embedded cues
+        are used instead of subtitleFile while it is set
+
+Commands:
+    subtitleLocatorStats: Enable, reset and query per-node draw timings
+    subtitleLocatorBake: Precompute frames for playblasts and export them
+    listSubtitleSources: List loaded subtitle files with their memory use
+    subtitleCue: Find the cue at, after or before a frame and bookmark cues
+    subtitleEmbed: Save the parsed cue table in the scene and re-sync it
 """
 
+import base64
+import binascii
+import hashlib
+import html
+import json
+import mmap
+import os
 import re
+import struct
 import sys
+import threading
+import time
+import unicodedata
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from fractions import Fraction
 from pathlib import Path
+from typing import ClassVar
 
+import maya.utils
 from maya.api import OpenMaya, OpenMayaAnim, OpenMayaRender, OpenMayaUI
 
+# Romaji conversion is optional: the subtitler package (and pykakasi) must
+# be importable from Maya's Python for displayMode Romaji / Both. It is
+# imported on first use (see _romanize) to keep loading the plug-in fast.
+_romanize_module = None
+_romanize_missing = False
+
 
 def maya_useNewAPI():
     pass
 
 
+def _romanize():
+    """Import subtitler.romanize on first use.
+
+    Returns:
+        The module, or None if subtitler is not importable
+    """
+    global _romanize_module, _romanize_missing
+    if _romanize_module is None and not _romanize_missing:
+        try:
+            from subtitler import romanize
+        except ImportError:
+            _romanize_missing = True
+        else:
+            _romanize_module = romanize
+    return _romanize_module
+
+
 # Plug-in information
 K_PLUGIN_NODE_NAME = "subtitleLocator"
 K_PLUGIN_NODE_ID = OpenMaya.MTypeId(0x0007F7F8)
 K_PLUGIN_CLASSIFICATION = "drawdb/geometry/subtitleLocator"
 K_DRAW_REGISTRANT_ID = "subtitleLocatorNode"
+K_STATS_CMD_NAME = "subtitleLocatorStats"
+K_BAKE_CMD_NAME = "subtitleLocatorBake"
+K_SOURCES_CMD_NAME = "listSubtitleSources"
+K_CUE_CMD_NAME = "subtitleCue"
+K_EMBED_CMD_NAME = "subtitleEmbed"
 
 # Default values
 DEFAULT_START_FRAME = 0
@@ -45,6 +112,1186 @@ DEFAULT_WRAP_TEXT = True
 DEFAULT_WORD_WRAP = True
 DEFAULT_MAX_CHARS_PER_LINE = 80
 DEFAULT_MAX_LINES = 3
+DEFAULT_HIGHLIGHT_WORDS = False
+DEFAULT_HIGHLIGHT_COLOR = (1.0, 0.85, 0.2)
+
+# Line height as a multiple of the font size
+LINE_SPACING = 1.4
+
+# textEffect values: drop shadow (one offset copy of the text) or outline
+# (four diagonal copies), drawn in effectColor under the text
+EFFECT_NONE, EFFECT_SHADOW, EFFECT_OUTLINE = range(3)
+DEFAULT_TEXT_EFFECT = EFFECT_NONE
+DEFAULT_EFFECT_COLOR = (0.0, 0.0, 0.0)
+DEFAULT_EFFECT_WIDTH = 1
+EFFECT_OFFSETS = {
+    EFFECT_SHADOW: ((1, -1),),
+    EFFECT_OUTLINE: ((-1, -1), (-1, 1), (1, -1), (1, 1)),
+}
+
+# Background box behind the text block (rect2d up vector: screen aligned)
+SCREEN_UP = OpenMaya.MVector(0.0, 1.0, 0.0)
+DEFAULT_BACKGROUND_BOX = False
+DEFAULT_BACKGROUND_COLOR = (0.0, 0.0, 0.0)
+DEFAULT_BACKGROUND_OPACITY = 0.6
+DEFAULT_BACKGROUND_PADDING = 8
+
+# displayMode values
+DISPLAY_ORIGINAL, DISPLAY_ROMAJI, DISPLAY_BOTH = range(3)
+DEFAULT_DISPLAY_MODE = DISPLAY_ORIGINAL
+
+# Cues romanized ahead of the one on screen
+ROMAJI_PREFETCH_CUES = 16
+
+# Cues on each side of the one on screen wrapped (and romanized) ahead of
+# time, refilled by a timer callback every CUE_PREFETCH_INTERVAL seconds
+# that works for at most CUE_PREFETCH_BUDGET seconds per tick
+CUE_PREFETCH_WINDOW = 8
+CUE_PREFETCH_INTERVAL = 0.05
+CUE_PREFETCH_BUDGET = 0.004
+
+# Time slider bookmarks made by subtitleCue (Maya 2020+): node type, color
+# and the longest label shown
+BOOKMARK_NODE_TYPE = "timeSliderBookmark"
+BOOKMARK_COLOR = (0.25, 0.55, 0.9)
+BOOKMARK_LABEL_LENGTH = 40
+
+# Seconds between checks of loaded subtitle files for changes on disk
+SOURCE_CHECK_INTERVAL = 1.0
+
+# Wrapped cue texts kept per subtitle file
+WRAP_CACHE_SIZE = 4096
+
+# Number of frames kept per node by the draw instrumentation
+DEFAULT_STATS_FRAMES = 240
+
+# Word timing sidecar (see subtitler/words.py)
+WORDS_SUFFIX = ".words.json"
+WORDS_VERSION = 1
+
+# Binary subtitle index (see subtitler/subidx.py)
+INDEX_SUFFIX = ".subidx"
+INDEX_MAGIC = b"SIDX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sHHIqq")
+
+# Cue table embedded in the scene: a binary index followed by the word
+# timings JSON, zlib-compressed and base64-encoded into a string attribute
+EMBED_MAGIC = b"SEMB"
+EMBED_VERSION = 1
+EMBED_HEADER = struct.Struct("<4sHI")  # magic, version, index size
+EMBED_KEY_PREFIX = "embedded:"
+
+# Default ASS event fields, used when a file has no Format line
+ASS_EVENT_FIELDS = [
+    "Layer", "Start", "End", "Style", "Name",
+    "MarginL", "MarginR", "MarginV", "Effect", "Text",
+]  # fmt: skip
+
+
+def estimate_text_width(text, font_size):
+    """Estimate the pixel width of a string drawn with text2d.
+
+    MUIDrawManager has no text metrics, so wide (CJK) characters count as
+    one em and everything else as 0.6 em.
+    """
+    width = 0.0
+    for char in text:
+        if unicodedata.east_asian_width(char) in ("W", "F"):
+            width += 1.0
+        else:
+            width += 0.6
+    return width * font_size
+
+
+def locate_span(text, lines, start, end):
+    """Map a character range of the original text onto wrapped lines.
+
+    Wrapping only changes whitespace, so positions are matched by counting
+    non-whitespace characters.
+
+    Args:
+        text: Original cue text
+        lines: Wrapped lines
+        start: Start of the range in ``text``
+        end: End of the range in ``text``
+
+    Returns:
+        (line index, start column, end column) or None
+    """
+    first = sum(1 for char in text[:start] if not char.isspace())
+    last = first + sum(1 for char in text[start:end] if not char.isspace())
+    if first == last:
+        return None
+
+    seen = 0
+    for line_index, line in enumerate(lines):
+        begin = None
+        for column, char in enumerate(line):
+            if char.isspace():
+                continue
+            if seen == first:
+                begin = column
+            seen += 1
+            if begin is not None and seen == last:
+                return line_index, begin, column + 1
+        if begin is not None:
+            # Range continues on the next line; highlight up to line end
+            return line_index, begin, len(line)
+    return None
+
+
+# Draw phases recorded by DrawStats (index into a sample)
+STATS_PHASES = ("camera", "plugs", "lookup", "wrap", "draw")
+PHASE_CAMERA, PHASE_PLUGS, PHASE_LOOKUP, PHASE_WRAP, PHASE_DRAW = range(1, 6)
+
+
+class DrawStats:
+    """Per-node draw timings and counters.
+
+    Every drawn frame appends one sample ``[frame, camera, plugs, lookup,
+    wrap, draw]`` (seconds) to a ring buffer, so memory stays bounded during
+    long playback.
+    """
+
+    def __init__(self, size=DEFAULT_STATS_FRAMES):
+        """Constructor."""
+        self.samples = deque(maxlen=size)
+        self.counters = {"frames": 0, "cache_hits": 0, "cache_misses": 0}
+        self._sample = None
+        self._last = 0.0
+
+    def begin(self):
+        """Start a new frame sample."""
+        self.counters["frames"] += 1
+        self._sample = [OpenMayaAnim.MAnimControl.currentTime().value] + [0.0] * 5
+        self.samples.append(self._sample)
+        self._last = time.perf_counter()
+
+    def resume(self):
+        """Restart the phase clock (between prepareForDraw and drawing)."""
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Add the time since the last lap to ``phase``."""
+        now = time.perf_counter()
+        self._sample[phase] += now - self._last
+        self._last = now
+
+    def cache(self, hit):
+        """Count a subtitle cache lookup."""
+        self.counters["cache_hits" if hit else "cache_misses"] += 1
+
+    def summary(self, include_samples=False):
+        """Summarize the recorded frames.
+
+        Returns:
+            Dict with counters and mean/max/last milliseconds per phase
+        """
+        samples = list(self.samples)
+        phases = {}
+        for i, phase in enumerate(STATS_PHASES + ("total",), start=1):
+            if phase == "total":
+                values = [sum(sample[1:]) * 1000.0 for sample in samples]
+            else:
+                values = [sample[i] * 1000.0 for sample in samples]
+            phases[phase] = {
+                "mean": sum(values) / len(values) if values else 0.0,
+                "max": max(values) if values else 0.0,
+                "last": values[-1] if values else 0.0,
+            }
+
+        result = dict(self.counters)
+        result["phases_ms"] = phases
+        if include_samples:
+            result["samples"] = samples
+        return result
+
+
+class _NullDrawStats:
+    """Stand-in used while instrumentation is disabled."""
+
+    def begin(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def cache(self, hit):
+        pass
+
+
+NULL_DRAW_STATS = _NullDrawStats()
+
+
+class SubtitleIndex:
+    """Read-only view over a binary subtitle index.
+
+    Timestamp and offset arrays are typed views on the underlying buffer,
+    so a memory-mapped index is never copied and cue text is only decoded
+    when it is displayed.
+    """
+
+    def __init__(self, buffer):
+        """Constructor."""
+        if sys.byteorder != "little":
+            raise ValueError("Subtitle index requires a little-endian host")
+
+        self.mapped = isinstance(buffer, mmap.mmap)
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        try:
+            self._read_header(self._view)
+        except ValueError:
+            # Release the views now: a caller closing the mapping cannot while
+            # the traceback keeps them alive
+            self._release()
+            raise
+        self._frame_key = None
+        self._frame_tables = {}  # (fps, start frame) -> (start frames, end frames)
+        self._start_frames = []
+        self._end_frames = []
+
+    def _read_header(self, view):
+        if len(view) < INDEX_HEADER.size:
+            raise ValueError("Subtitle index is truncated")
+
+        magic, version, _flags, count, size, mtime_ns = INDEX_HEADER.unpack_from(view)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("Not a subtitle index")
+
+        pos = INDEX_HEADER.size
+        array_end = pos + (3 * count + 1) * 4
+        if len(view) < array_end:
+            raise ValueError("Subtitle index is truncated")
+
+        self.source_size = size
+        self.source_mtime_ns = mtime_ns
+        self.nbytes = len(view)
+        self.starts = view[pos : pos + count * 4].cast("I")
+        pos += count * 4
+        self.ends = view[pos : pos + count * 4].cast("I")
+        pos += count * 4
+        self.offsets = view[pos : pos + (count + 1) * 4].cast("I")
+        self._blob = view[array_end:]
+
+        if self.offsets[count] > len(self._blob):
+            raise ValueError("Subtitle index is truncated")
+
+    def _release(self):
+        for name in ("starts", "ends", "offsets", "_blob"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._view.release()
+
+    def close(self):
+        """Release the views and close a memory-mapped buffer.
+
+        The index cannot be used afterwards.
+        """
+        self._release()
+        if self.mapped:
+            self._buffer.close()
+
+    @staticmethod
+    def from_segments(segments):
+        """Build an in-memory index from parsed segments.
+
+        Args:
+            segments: List of dicts with 'start_ms', 'end_ms' and 'text'
+
+        Returns:
+            SubtitleIndex
+        """
+        ordered = sorted(segments, key=lambda seg: seg["start_ms"])
+        count = len(ordered)
+        texts = [seg["text"].strip().encode("utf-8") for seg in ordered]
+        offsets = [0]
+        for text in texts:
+            offsets.append(offsets[-1] + len(text))
+
+        data = b"".join(
+            [
+                INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0, count, 0, 0),
+                struct.pack(f"<{count}I", *[seg["start_ms"] for seg in ordered]),
+                struct.pack(f"<{count}I", *[seg["end_ms"] for seg in ordered]),
+                struct.pack(f"<{count + 1}I", *offsets),
+                *texts,
+            ]
+        )
+        return SubtitleIndex(data)
+
+    @staticmethod
+    def open_sidecar(subtitle_path):
+        """Memory-map the sidecar index of a subtitle file.
+
+        Args:
+            subtitle_path: Path to the source subtitle file
+
+        Returns:
+            SubtitleIndex, or None if the index is missing, stale or unreadable
+        """
+        index_path = subtitle_path.with_name(subtitle_path.name + INDEX_SUFFIX)
+        try:
+            stat = os.stat(subtitle_path)
+            with open(index_path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            index = SubtitleIndex(buffer)
+        except ValueError:
+            buffer.close()
+            return None
+
+        if (
+            index.source_size != stat.st_size
+            or index.source_mtime_ns != stat.st_mtime_ns
+        ):
+            index.close()
+            return None
+
+        return index
+
+    def __len__(self):
+        return len(self.starts)
+
+    def tobytes(self):
+        """Get the whole index as bytes (for embedding)."""
+        return bytes(memoryview(self._buffer))
+
+    def text(self, i):
+        """Decode the text of cue ``i``."""
+        return str(self._blob[self.offsets[i] : self.offsets[i + 1]], "utf-8")
+
+    def find(self, time_ms):
+        """Find the cue shown at ``time_ms``, or -1 if none is active."""
+        i = bisect_right(self.starts, time_ms) - 1
+        if i >= 0 and time_ms < self.ends[i]:
+            return i
+        return -1
+
+    def find_frame(self, frame, fps, start_frame):
+        """Find the cue shown at a timeline frame, or -1 if none is active.
+
+        Cue boundaries are converted to frames once per frame rate and start
+        frame, so per-frame lookups compare frames only. Tables are kept per
+        start frame, as locators sharing a file may be offset differently.
+
+        Args:
+            frame: Current timeline frame (may be fractional)
+            fps: Frames per second
+            start_frame: Frame where subtitle time 0 begins
+        """
+        key = (fps, start_frame)
+        if key != self._frame_key:
+            self._use_frame_table(key)
+
+        i = bisect_right(self._start_frames, frame) - 1
+        if i >= 0 and frame < self._end_frames[i]:
+            return i
+        return -1
+
+    def next_frame(self, frame, fps, start_frame):
+        """Find the first cue starting after a frame, or -1 if there is none."""
+        self._use_frame_table((fps, start_frame))
+        i = bisect_right(self._start_frames, frame)
+        return i if i < len(self._start_frames) else -1
+
+    def previous_frame(self, frame, fps, start_frame):
+        """Find the last cue starting before a frame, or -1 if there is none."""
+        self._use_frame_table((fps, start_frame))
+        return bisect_left(self._start_frames, frame) - 1
+
+    def frame_range(self, i, fps, start_frame):
+        """Get the first frame of cue ``i`` and the first frame after it."""
+        self._use_frame_table((fps, start_frame))
+        return self._start_frames[i], self._end_frames[i]
+
+    def _use_frame_table(self, key):
+        """Select the frame table of (fps, start frame), building it once."""
+        if key == self._frame_key:
+            return
+        table = self._frame_tables.get(key)
+        if table is None:
+            table = self._frame_tables[key] = self._build_frame_table(*key)
+        self._start_frames, self._end_frames = table
+        self._frame_key = key
+
+    def _build_frame_table(self, fps, start_frame):
+        """Convert cue start/end milliseconds to whole frames.
+
+        Each boundary maps to the first frame at or after it, using exact
+        rational arithmetic (23.976 fps is treated as 24000/1001).
+
+        Returns:
+            Lists of cue start and end frames
+        """
+        rate = Fraction(fps).limit_denominator(1001)
+        num = rate.numerator
+        den = 1000 * rate.denominator
+        return (
+            [start_frame - (-ms * num // den) for ms in self.starts],
+            [start_frame - (-ms * num // den) for ms in self.ends],
+        )
+
+
+class _LazyConverter:
+    """pykakasi converter created on first use.
+
+    ``romanize_texts`` only asks for a converter when some text is not in
+    the persistent cache, so dictionaries are not loaded for cached files.
+    """
+
+    def __init__(self):
+        self._kakasi = None
+
+    def getConverter(self):
+        if self._kakasi is None:
+            self._kakasi = _romanize().create_converter()
+        return self._kakasi.getConverter()
+
+
+class RomajiPrefetcher:
+    """Romanize cue text on a background thread, memoized per cue.
+
+    ``get`` never converts on the calling (draw) thread: it returns the
+    memoized text, or None while the cue is still queued, and queues the
+    cue together with the next ``prefetch`` cues. Views are refreshed when
+    a cue that was asked for arrives.
+
+    Each file has a generation, bumped by ``clear``: conversions queued or
+    running before a clear (the text of a reloaded file) are discarded
+    instead of being stored.
+    """
+
+    def __init__(self, prefetch=ROMAJI_PREFETCH_CUES):
+        """Constructor."""
+        self.prefetch = prefetch
+        self.error = None
+        self._texts = {}  # (subtitle file, cue) -> romaji
+        self._queued = set()
+        self._queue = []  # ((subtitle file, cue), text, generation)
+        # Bumped by clear(): all files, and per file
+        self._epoch = 0
+        self._generations = {}
+        self._waiting = False
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+        self._stopped = False
+        # pykakasi is not shared with the worker thread
+        self._sync_converter = _LazyConverter()
+
+    def get(self, subtitle_file, index, cue, wait=False):
+        """Get the romaji of a cue.
+
+        Args:
+            subtitle_file: Subtitle file path (cache key)
+            index: SubtitleIndex of the file
+            cue: Cue index
+            wait: Convert on this thread if the cue is not converted yet
+
+        Returns:
+            Romanized text, or None if it is not converted yet
+        """
+        text = self._texts.get((subtitle_file, cue))
+        if wait and text is None:
+            return self._convert_now(subtitle_file, index, cue)
+        if text is not None and (subtitle_file, cue + 1) in self._texts:
+            return text
+
+        with self._lock:
+            if self.error is not None or self._stopped:
+                return text
+            self._enqueue(subtitle_file, index, cue, cue + 1 + self.prefetch)
+            if text is None:
+                self._waiting = True
+        return text
+
+    def peek(self, subtitle_file, cue):
+        """Get the romaji of a cue if it is converted, without queueing it."""
+        return self._texts.get((subtitle_file, cue))
+
+    def queue(self, subtitle_file, index, first, last):
+        """Queue cues ``first`` to ``last`` (exclusive) for conversion."""
+        with self._lock:
+            if self.error is None and not self._stopped:
+                self._enqueue(subtitle_file, index, first, last)
+
+    def _generation(self, subtitle_file):
+        # Called with the lock held
+        return self._epoch, self._generations.get(subtitle_file, 0)
+
+    def _enqueue(self, subtitle_file, index, first, last):
+        # Called with the lock held
+        generation = self._generation(subtitle_file)
+        for i in range(max(first, 0), min(last, len(index))):
+            key = (subtitle_file, i)
+            if key not in self._texts and key not in self._queued:
+                self._queued.add(key)
+                self._queue.append((key, index.text(i), generation))
+        if self._queue:
+            self._start()
+            self._wake.notify()
+
+    def _convert_now(self, subtitle_file, index, cue):
+        """Convert a cue and the following ones on the calling thread."""
+        cues = [
+            i
+            for i in range(cue, min(cue + 1 + self.prefetch, len(index)))
+            if (subtitle_file, i) not in self._texts
+        ]
+        with self._lock:
+            generation = self._generation(subtitle_file)
+        converted = dict(
+            zip(
+                cues,
+                _romanize().romanize_texts(
+                    [index.text(i) for i in cues], self._sync_converter
+                ),
+            )
+        )
+        with self._lock:
+            if self._generation(subtitle_file) == generation:
+                for i, romaji in converted.items():
+                    self._texts[(subtitle_file, i)] = romaji
+        if cue in converted:
+            return converted[cue]
+        return self._texts.get((subtitle_file, cue))
+
+    def memory(self, subtitle_file):
+        """Estimate the bytes held for the cues of one file."""
+        with self._lock:
+            return sum(
+                sys.getsizeof(key) + sys.getsizeof(text)
+                for key, text in self._texts.items()
+                if key[0] == subtitle_file
+            )
+
+    def clear(self, subtitle_file=None):
+        """Forget memoized and queued text (of one file, or all)."""
+        with self._lock:
+            if subtitle_file is None:
+                self._epoch += 1
+                self._texts.clear()
+                self._queue = []
+                self._queued.clear()
+                return
+
+            generation = self._generations.get(subtitle_file, 0)
+            self._generations[subtitle_file] = generation + 1
+            for key in [key for key in self._texts if key[0] == subtitle_file]:
+                del self._texts[key]
+            self._queue = [item for item in self._queue if item[0][0] != subtitle_file]
+            self._queued = {key for key in self._queued if key[0] != subtitle_file}
+
+    def stop(self):
+        """Stop the worker thread (on plug-in unload)."""
+        with self._lock:
+            self._stopped = True
+            self._wake.notify()
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="subtitleLocatorRomaji", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        converter = _LazyConverter()
+        while True:
+            with self._lock:
+                while not self._queue and not self._stopped:
+                    self._wake.wait()
+                if self._stopped:
+                    return
+                batch = self._queue
+                self._queue = []
+
+            try:
+                results = _romanize().romanize_texts(
+                    [text for _, text, _ in batch], converter
+                )
+            except Exception as e:  # noqa: BLE001
+                # Deliberately broad: subtitler or pykakasi missing, cache I/O
+                # and converter bugs all end here. An exception escaping this
+                # daemon thread would stop it silently with cues still queued;
+                # instead the original text is shown from now on.
+                with self._lock:
+                    self.error = e
+                    self._queue = []
+                    self._queued.clear()
+                maya.utils.executeDeferred(
+                    OpenMaya.MGlobal.displayWarning,
+                    f"Romaji conversion failed, showing original text: {e}",
+                )
+                return
+
+            with self._lock:
+                for (key, _, generation), romaji in zip(batch, results):
+                    # Cleared while converting: the text is stale
+                    if generation != self._generation(key[0]):
+                        continue
+                    self._texts[key] = romaji
+                    self._queued.discard(key)
+                refresh = self._waiting
+                self._waiting = False
+            if refresh:
+                maya.utils.executeDeferred(OpenMayaUI.M3dView.scheduleRefreshAllViews)
+
+
+def _container_bytes(values):
+    """Estimate the size of a list or tuple of small objects in bytes."""
+    return sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+
+
+class SubtitleSource:
+    """One subtitle file, loaded once for every locator that shows it.
+
+    Holds the cue index, the word timing sidecar (loaded on first use) and
+    the wrapped text of displayed cues. ``SubtitleManager`` reloads it when
+    the file or its word timings change on disk. Sources of embedded cue
+    tables (``from_embedded``) have no path and are never reloaded.
+    """
+
+    def __init__(self, path, key=None):
+        """Constructor."""
+        self.path = path
+        self.key = key or str(path)
+        self.index = None
+        self.words = None
+        # (cue, is romaji, max chars, max lines, word wrap) -> wrapped text
+        self.wrapped = {}
+        # (wrap settings, display mode) -> cue whose neighbours are prepared
+        self.prefetched = {}
+        self.signature = None
+        self.load_ms = 0.0
+
+    @staticmethod
+    def stat_signature(path):
+        """Get (size, mtime) of a file and its word timings, or None if missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        try:
+            words_stat = os.stat(path.with_name(path.stem + WORDS_SUFFIX))
+            words = (words_stat.st_size, words_stat.st_mtime_ns)
+        except OSError:
+            words = None
+        return stat.st_size, stat.st_mtime_ns, words
+
+    def load(self):
+        """(Re)load the cue index and drop everything derived from it.
+
+        The sidecar index is memory-mapped when it is present and fresh;
+        otherwise the subtitle file is parsed and indexed in memory.
+        """
+        start = time.perf_counter()
+        self.index = None
+        self.words = None
+        self.wrapped = {}
+        self.prefetched = {}
+        self.signature = self.stat_signature(self.path)
+        if self.signature is not None:
+            try:
+                index = SubtitleIndex.open_sidecar(self.path)
+                if index is None:
+                    index = SubtitleIndex.from_segments(self._parse_file(self.path))
+                self.index = index
+            except Exception as e:
+                OpenMaya.MGlobal.displayWarning(f"Failed to load SRT file: {e}")
+        self.load_ms = (time.perf_counter() - start) * 1000.0
+
+    @classmethod
+    def from_embedded(cls, checksum, payload):
+        """Load a cue table embedded with ``encode_embedded``.
+
+        Args:
+            checksum: embeddedChecksum value
+            payload: embeddedCues value
+
+        Returns:
+            SubtitleSource (its index is None if the payload is corrupt)
+        """
+        source = cls(None, EMBED_KEY_PREFIX + checksum)
+        start = time.perf_counter()
+        source.words = {}
+        try:
+            source.index, source.words = decode_embedded(payload)
+        except ValueError as e:
+            OpenMaya.MGlobal.displayWarning(f"Failed to load embedded subtitles: {e}")
+        source.load_ms = (time.perf_counter() - start) * 1000.0
+        return source
+
+    def find_word(self, cue_start_ms, time_ms):
+        """Find the word spoken at ``time_ms`` within a cue.
+
+        Args:
+            cue_start_ms: Start time of the active cue
+            time_ms: Current subtitle time in milliseconds
+
+        Returns:
+            (start, end) character range in the cue text, or None
+        """
+        if self.words is None:
+            self.words = self._load_words(self.path)
+        words = self.words.get(cue_start_ms)
+        if not words:
+            return None
+
+        spans, word_starts, word_ends = words
+        i = bisect_right(word_starts, time_ms) - 1
+        if i < 0 or time_ms >= word_ends[i]:
+            return None
+        return spans[2 * i], spans[2 * i + 1]
+
+    def memory(self):
+        """Estimate the memory held for this file.
+
+        Returns:
+            Dict of bytes: 'index' (in-memory index), 'mapped' (memory-mapped
+            sidecar, paged in on demand), 'frames' (frame lookup tables),
+            'words' and 'wrapped'
+        """
+        index = self.index
+        usage = {"index": 0, "mapped": 0, "frames": 0, "words": 0, "wrapped": 0}
+        if index is not None:
+            usage["mapped" if index.mapped else "index"] = index.nbytes
+            usage["frames"] = sum(
+                _container_bytes(starts) + _container_bytes(ends)
+                for starts, ends in index._frame_tables.values()
+            )
+        if self.words:
+            usage["words"] = sys.getsizeof(self.words) + sum(
+                _container_bytes(lists[0])
+                + _container_bytes(lists[1])
+                + _container_bytes(lists[2])
+                for lists in self.words.values()
+            )
+        usage["wrapped"] = sys.getsizeof(self.wrapped) + sum(
+            sys.getsizeof(key) + sys.getsizeof(text)
+            for key, text in self.wrapped.items()
+        )
+        return usage
+
+    @classmethod
+    def _load_words(cls, path):
+        """Load the word timing sidecar of a subtitle file.
+
+        Args:
+            path: Path to subtitle file
+
+        Returns:
+            Dict of cue start ms -> (spans, word starts, word ends)
+        """
+        words = {}
+        sidecar = path.with_name(path.stem + WORDS_SUFFIX)
+        try:
+            if sidecar.exists():
+                with open(sidecar, "r", encoding="utf-8") as f:
+                    words = cls._words_from_content(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            OpenMaya.MGlobal.displayWarning(f"Failed to load word timings: {e}")
+        return words
+
+    @staticmethod
+    def _words_from_content(content):
+        """Index the cues of a parsed word timing sidecar by start time."""
+        words = {}
+        if content.get("version") == WORDS_VERSION:
+            for cue in content["cues"]:
+                times = cue["times"]
+                words[cue["start"]] = (cue["spans"], times[0::2], times[1::2])
+        return words
+
+    @classmethod
+    def _parse_srt_timestamp(cls, timestamp):
+        """Parse SRT timestamp to integer milliseconds.
+
+        Args:
+            timestamp: SRT format timestamp (HH:MM:SS,mmm)
+
+        Returns:
+            Time in milliseconds
+        """
+        match = re.match(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})", timestamp)
+        if not match:
+            return 0
+
+        hours, minutes, seconds, millis = map(int, match.groups())
+        return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
+
+    @classmethod
+    def _parse_file(cls, path):
+        """Parse a subtitle file according to its extension.
+
+        Args:
+            path: Path to subtitle file
+
+        Returns:
+            List of segments
+        """
+        suffix = path.suffix.lower()
+        if suffix == ".vtt":
+            return cls._parse_vtt(path)
+        if suffix in (".ass", ".ssa"):
+            return cls._parse_ass(path)
+        if suffix == ".jsonl":
+            return cls._parse_jsonl(path)
+        return cls._parse_srt(path)
+
+    @classmethod
+    def _parse_srt(cls, path):
+        """Parse an SRT file.
+
+        Args:
+            path: Path to SRT file
+
+        Returns:
+            List of segments
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        segments = []
+        blocks = re.split(r"\n\n+", content.strip())
+
+        for block in blocks:
+            lines = block.strip().split("\n")
+            if len(lines) < 3:
+                continue
+
+            # Line 0: index (ignored)
+            # Line 1: timestamp
+            # Line 2+: text
+            timestamp_line = lines[1]
+            text_lines = lines[2:]
+
+            # Parse timestamp
+            match = re.match(r"(.+?)\s*-->\s*(.+)", timestamp_line)
+            if not match:
+                continue
+
+            start_str, end_str = match.groups()
+            start = cls._parse_srt_timestamp(start_str.strip())
+            end = cls._parse_srt_timestamp(end_str.strip())
+            text = " ".join(text_lines)
+
+            segments.append({"start_ms": start, "end_ms": end, "text": text})
+
+        return segments
+
+    @classmethod
+    def _parse_vtt(cls, path):
+        """Parse a WebVTT file.
+
+        Args:
+            path: Path to WebVTT file
+
+        Returns:
+            List of segments
+        """
+        with open(path, "r", encoding="utf-8-sig") as f:
+            content = f.read()
+
+        segments = []
+        for block in re.split(r"\n\n+", content.strip()):
+            lines = block.strip().split("\n")
+            for i, line in enumerate(lines):
+                if "-->" in line:
+                    break
+            else:
+                # Header, NOTE, STYLE and REGION blocks have no timing line
+                continue
+
+            times = [
+                re.match(r"(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})", part.strip())
+                for part in line.split("-->", 1)
+            ]
+            if not all(times):
+                continue
+
+            start, end = [
+                ((int(h or 0) * 60 + int(m)) * 60 + int(s)) * 1000 + int(ms)
+                for h, m, s, ms in (match.groups() for match in times)
+            ]
+            text = " ".join(
+                html.unescape(re.sub(r"<[^>]*>", "", text)) for text in lines[i + 1 :]
+            )
+            segments.append({"start_ms": start, "end_ms": end, "text": text})
+
+        return segments
+
+    @classmethod
+    def _parse_ass(cls, path):
+        """Parse the Dialogue events of an ASS/SSA file.
+
+        Args:
+            path: Path to ASS file
+
+        Returns:
+            List of segments
+        """
+        fields = ASS_EVENT_FIELDS
+        segments = []
+        in_events = False
+
+        with open(path, "r", encoding="utf-8-sig") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    in_events = line.lower() == "[events]"
+                    continue
+                if not in_events:
+                    continue
+
+                key, _, value = line.partition(":")
+                if key == "Format":
+                    fields = [field.strip() for field in value.split(",")]
+                elif key == "Dialogue":
+                    values = dict(zip(fields, value.split(",", len(fields) - 1)))
+                    times = [
+                        re.match(r"(\d+):(\d{2}):(\d{2})\.(\d{2})", value.strip())
+                        for value in (values["Start"], values["End"])
+                    ]
+                    if not all(times):
+                        continue
+
+                    start, end = [
+                        ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + int(cs) * 10
+                        for h, m, s, cs in (match.groups() for match in times)
+                    ]
+                    text = re.sub(r"(?<!\\)\{[^}]*\}", "", values.get("Text", ""))
+                    text = text.replace("\\N", " ").replace("\\n", " ")
+                    text = text.replace("\\{", "{").replace("\\}", "}").strip()
+                    segments.append({"start_ms": start, "end_ms": end, "text": text})
+
+        return segments
+
+    @classmethod
+    def _parse_jsonl(cls, path):
+        """Parse a JSON lines file written by ``subtitler --format jsonl``.
+
+        Args:
+            path: Path to JSON lines file
+
+        Returns:
+            List of segments
+        """
+        segments = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                segments.append(
+                    {
+                        "start_ms": round(record["start"] * 1000),
+                        "end_ms": round(record["end"] * 1000),
+                        "text": record["text"],
+                    }
+                )
+        return segments
+
+
+def source_checksum(path):
+    """Hash a subtitle file together with its word timing sidecar.
+
+    Args:
+        path: Path to the subtitle file
+
+    Returns:
+        Hex digest
+    """
+    path = Path(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    sidecar = path.with_name(path.stem + WORDS_SUFFIX)
+    if sidecar.exists():
+        digest.update(b"\0" + WORDS_SUFFIX.encode("ascii") + b"\0")
+        digest.update(sidecar.read_bytes())
+    return digest.hexdigest()
+
+
+def encode_embedded(path):
+    """Pack a subtitle file and its word timings for the embeddedCues attribute.
+
+    Args:
+        path: Path to the subtitle file
+
+    Returns:
+        embeddedCues value (store ``source_checksum`` in embeddedChecksum)
+    """
+    path = Path(path)
+    index = SubtitleIndex.open_sidecar(path)
+    if index is None:
+        index = SubtitleIndex.from_segments(SubtitleSource._parse_file(path))
+    data = index.tobytes()
+    sidecar = path.with_name(path.stem + WORDS_SUFFIX)
+    words = sidecar.read_bytes() if sidecar.exists() else b""
+    packed = EMBED_HEADER.pack(EMBED_MAGIC, EMBED_VERSION, len(data)) + data + words
+    return base64.b64encode(zlib.compress(packed, 9)).decode("ascii")
+
+
+def decode_embedded(payload):
+    """Unpack an embeddedCues value.
+
+    Returns:
+        (SubtitleIndex, word timings by cue start ms)
+
+    Raises:
+        ValueError: If the payload is corrupt or from a newer version
+    """
+    try:
+        packed = zlib.decompress(base64.b64decode(payload, validate=True))
+    except (binascii.Error, zlib.error) as e:
+        raise ValueError(f"cannot decompress cue table ({e})")
+    if len(packed) < EMBED_HEADER.size:
+        raise ValueError("cue table is truncated")
+    magic, version, index_size = EMBED_HEADER.unpack_from(packed)
+    if magic != EMBED_MAGIC or version != EMBED_VERSION:
+        raise ValueError("unsupported cue table")
+
+    view = memoryview(packed)
+    index_end = EMBED_HEADER.size + index_size
+    index = SubtitleIndex(view[EMBED_HEADER.size : index_end])
+    words = {}
+    if len(packed) > index_end:
+        content = json.loads(str(view[index_end:], "utf-8"))
+        words = SubtitleSource._words_from_content(content)
+    return index, words
+
+
+class SubtitleManager:
+    """Scene-wide owner of loaded subtitle files.
+
+    Every locator resolves its subtitleFile through the one manager, and
+    every spelling of a path maps to one SubtitleSource, so memory and load
+    time grow with the number of files rather than locators. Files are
+    checked on disk at most every ``check_interval`` seconds and reloaded
+    when they change. Romaji of displayed cues is memoized here as well.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Get the manager, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, check_interval=SOURCE_CHECK_INTERVAL):
+        """Constructor."""
+        self.check_interval = check_interval
+        self.romaji = RomajiPrefetcher()
+        self._sources = {}  # normalized path -> SubtitleSource
+        self._aliases = {}  # subtitleFile value -> SubtitleSource
+        self._embedded = {}  # embeddedChecksum value -> SubtitleSource
+        self._next_check = 0.0
+
+    def source(self, subtitle_file, embedded=""):
+        """Get the loaded source of a locator.
+
+        Args:
+            subtitle_file: subtitleFile attribute value
+            embedded: embeddedChecksum attribute value; its cue table (see
+                ``load_embedded``) is used instead of the file when loaded
+
+        Returns:
+            SubtitleSource (its index is None if the file cannot be read),
+            or None for an empty value
+        """
+        if embedded:
+            source = self._embedded.get(embedded)
+            if source is not None and source.index is not None:
+                return source
+        if not subtitle_file:
+            return None
+
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            self.check()
+
+        source = self._aliases.get(subtitle_file)
+        if source is None:
+            key = os.path.normcase(os.path.abspath(subtitle_file))
+            source = self._sources.get(key)
+            if source is None:
+                source = self._sources[key] = SubtitleSource(Path(key))
+                source.load()
+            self._aliases[subtitle_file] = source
+        return source
+
+    def is_loaded(self, subtitle_file, embedded=""):
+        """Check whether a locator's source is already resolved."""
+        return embedded in self._embedded or subtitle_file in self._aliases
+
+    def find(self, subtitle_file, embedded=""):
+        """Get the source of a locator without loading it."""
+        source = self._embedded.get(embedded)
+        if source is not None and source.index is not None:
+            return source
+        return self._aliases.get(subtitle_file)
+
+    def has_embedded(self, checksum):
+        """Check whether an embedded cue table is loaded."""
+        return checksum in self._embedded
+
+    def load_embedded(self, checksum, payload):
+        """Load an embedded cue table, once per checksum.
+
+        Args:
+            checksum: embeddedChecksum attribute value
+            payload: embeddedCues attribute value
+
+        Returns:
+            SubtitleSource
+        """
+        source = self._embedded.get(checksum)
+        if source is None:
+            source = SubtitleSource.from_embedded(checksum, payload)
+            self._embedded[checksum] = source
+        return source
+
+    def check(self):
+        """Reload sources whose files changed on disk.
+
+        Returns:
+            List of reloaded SubtitleSource
+        """
+        reloaded = []
+        for source in self._sources.values():
+            if SubtitleSource.stat_signature(source.path) != source.signature:
+                source.load()
+                self.romaji.clear(source.key)
+                reloaded.append(source)
+        return reloaded
+
+    def clear(self):
+        """Drop every source (on scene new/open)."""
+        self._sources.clear()
+        self._aliases.clear()
+        self._embedded.clear()
+        self.romaji.clear()
+
+    def sources(self):
+        """Get the loaded sources (files, then embedded cue tables)."""
+        return list(self._sources.values()) + list(self._embedded.values())
+
+    def aliases(self, source):
+        """Get the subtitleFile values that resolve to a source."""
+        return [value for value, alias in self._aliases.items() if alias is source]
 
 
 class SubtitleLocator(OpenMayaUI.MPxLocatorNode):
@@ -62,6 +1309,18 @@ class SubtitleLocator(OpenMayaUI.MPxLocatorNode):
     word_wrap = None
     max_chars_per_line = None
     max_lines = None
+    highlight_words = None
+    highlight_color = None
+    display_mode = None
+    text_effect = None
+    effect_color = None
+    effect_width = None
+    background_box = None
+    background_color = None
+    background_opacity = None
+    background_padding = None
+    embedded_cues = None
+    embedded_checksum = None
 
     def __init__(self):
         """Constructor."""
@@ -83,6 +1342,7 @@ class SubtitleLocator(OpenMayaUI.MPxLocatorNode):
         typed_attr = OpenMaya.MFnTypedAttribute()
         numeric_attr = OpenMaya.MFnNumericAttribute()
         message_attr = OpenMaya.MFnMessageAttribute()
+        enum_attr = OpenMaya.MFnEnumAttribute()
 
         # Subtitle file path (SRT)
         SubtitleLocator.subtitle_file = typed_attr.create(
@@ -192,11 +1452,318 @@ class SubtitleLocator(OpenMayaUI.MPxLocatorNode):
         numeric_attr.writable = True
         SubtitleLocator.addAttribute(SubtitleLocator.max_lines)
 
+        # Highlight the currently spoken word
+        SubtitleLocator.highlight_words = numeric_attr.create(
+            "highlightWords",
+            "hw",
+            OpenMaya.MFnNumericData.kBoolean,
+            DEFAULT_HIGHLIGHT_WORDS,
+        )
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.highlight_words)
+
+        # Highlight color
+        SubtitleLocator.highlight_color = numeric_attr.createColor(
+            "highlightColor", "hc"
+        )
+        numeric_attr.default = DEFAULT_HIGHLIGHT_COLOR
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.highlight_color)
+
+        # Text shown: original, romaji (converted on the fly) or both
+        SubtitleLocator.display_mode = enum_attr.create(
+            "displayMode", "dm", DEFAULT_DISPLAY_MODE
+        )
+        enum_attr.addField("Original", DISPLAY_ORIGINAL)
+        enum_attr.addField("Romaji", DISPLAY_ROMAJI)
+        enum_attr.addField("Both", DISPLAY_BOTH)
+        enum_attr.keyable = True
+        enum_attr.storable = True
+        enum_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.display_mode)
+
+        # Shadow or outline drawn under the text for readability
+        SubtitleLocator.text_effect = enum_attr.create(
+            "textEffect", "tfx", DEFAULT_TEXT_EFFECT
+        )
+        enum_attr.addField("None", EFFECT_NONE)
+        enum_attr.addField("Shadow", EFFECT_SHADOW)
+        enum_attr.addField("Outline", EFFECT_OUTLINE)
+        enum_attr.keyable = True
+        enum_attr.storable = True
+        enum_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.text_effect)
+
+        SubtitleLocator.effect_color = numeric_attr.createColor("effectColor", "efc")
+        numeric_attr.default = DEFAULT_EFFECT_COLOR
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.effect_color)
+
+        # Shadow / outline offset in pixels
+        SubtitleLocator.effect_width = numeric_attr.create(
+            "effectWidth", "efw", OpenMaya.MFnNumericData.kInt, DEFAULT_EFFECT_WIDTH
+        )
+        numeric_attr.setMin(1)
+        numeric_attr.setMax(8)
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.effect_width)
+
+        # Filled box behind the text
+        SubtitleLocator.background_box = numeric_attr.create(
+            "backgroundBox",
+            "bgb",
+            OpenMaya.MFnNumericData.kBoolean,
+            DEFAULT_BACKGROUND_BOX,
+        )
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.background_box)
+
+        SubtitleLocator.background_color = numeric_attr.createColor(
+            "backgroundColor", "bgc"
+        )
+        numeric_attr.default = DEFAULT_BACKGROUND_COLOR
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.background_color)
+
+        SubtitleLocator.background_opacity = numeric_attr.create(
+            "backgroundOpacity",
+            "bgo",
+            OpenMaya.MFnNumericData.kFloat,
+            DEFAULT_BACKGROUND_OPACITY,
+        )
+        numeric_attr.setMin(0.0)
+        numeric_attr.setMax(1.0)
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.background_opacity)
+
+        # Space between the text and the box edges in pixels
+        SubtitleLocator.background_padding = numeric_attr.create(
+            "backgroundPadding",
+            "bgp",
+            OpenMaya.MFnNumericData.kInt,
+            DEFAULT_BACKGROUND_PADDING,
+        )
+        numeric_attr.setMin(0)
+        numeric_attr.setMax(100)
+        numeric_attr.keyable = True
+        numeric_attr.storable = True
+        numeric_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.background_padding)
+
+        # Cue table saved with the scene (written by subtitleEmbed)
+        SubtitleLocator.embedded_cues = typed_attr.create(
+            "embeddedCues", "ec", OpenMaya.MFnData.kString
+        )
+        typed_attr.storable = True
+        typed_attr.writable = True
+        typed_attr.hidden = True
+        SubtitleLocator.addAttribute(SubtitleLocator.embedded_cues)
+
+        SubtitleLocator.embedded_checksum = typed_attr.create(
+            "embeddedChecksum", "ecs", OpenMaya.MFnData.kString
+        )
+        typed_attr.storable = True
+        typed_attr.writable = True
+        SubtitleLocator.addAttribute(SubtitleLocator.embedded_checksum)
+
     def draw(self, view, path, style, status):
         """Legacy draw - not used."""
         return None
 
 
+# Attribute values that decide what a locator shows
+LocatorSettings = namedtuple(
+    "LocatorSettings",
+    "subtitle_file start_frame font_size font_color position_x position_y "
+    "wrap_text word_wrap max_chars max_lines display_mode "
+    "highlight_words highlight_color embedded style",
+)
+
+# Shadow / outline and background box of a locator (None when both are off);
+# background_color includes the opacity as alpha
+TextStyle = namedtuple(
+    "TextStyle",
+    "effect effect_color effect_width background background_color padding",
+)
+
+# What a locator shows on one frame (highlight_color is None without highlight)
+FrameState = namedtuple(
+    "FrameState",
+    "subtitle_text font_size font_color position_x position_y "
+    "highlight highlight_color style",
+)
+
+# Precomputed frame -> FrameState table of a locator (see bake)
+BakedFrames = namedtuple("BakedFrames", "camera fps frames")
+
+
+class TextLayout:
+    """Screen layout of a subtitle: the text2d calls that draw it.
+
+    Each node's draw data keeps one layout, updated when the text, font
+    size, position or viewport size changes. Frames showing the same cue
+    as the last one draw from it without splitting text or computing line
+    positions, and a new cue moves the existing MPoints instead of
+    creating new ones.
+
+    Lines are drawn centered, one text2d each (text2d has no line breaks).
+    A line with a highlighted word is drawn left-aligned in parts; the
+    parts in the font color are drawn with the other lines, so the color
+    is only switched once for the word.
+
+    text2d has no outline or shadow of its own: a text effect is offset
+    copies of every text2d call, laid out here with the text. The
+    background box is computed once per layout from the line widths.
+    """
+
+    __slots__ = ("_runs", "font_size", "key", "lines", "points")
+
+    def __init__(self):
+        self.key = None
+        self.lines = []
+        self.font_size = 0
+        # Line positions; only the first len(lines) are in use
+        self.points = []
+        # highlight -> (runs, highlighted run); also effect runs and box
+        self._runs = {}
+
+    def update(self, key, text, font_size, center_x, center_y):
+        """Lay out new text.
+
+        Args:
+            key: Value identifying the inputs (compared by the caller)
+            text: Subtitle text, lines separated by newlines
+            font_size: Font size in pixels
+            center_x: Horizontal center of the block in pixels
+            center_y: Vertical center of the block in pixels
+        """
+        self.key = key
+        self.lines = lines = text.split("\n")
+        self.font_size = font_size
+        points = self.points
+        while len(points) < len(lines):
+            points.append(OpenMaya.MPoint())
+        line_height = int(font_size * LINE_SPACING)
+        top = center_y + line_height * len(lines) // 2
+        for i in range(len(lines)):
+            point = points[i]
+            point.x = center_x
+            point.y = top - i * line_height
+        self._runs.clear()
+
+    def runs(self, highlight):
+        """Get the text2d calls for a line with a highlighted word.
+
+        Args:
+            highlight: (line index, start column, end column)
+
+        Returns:
+            List of (MPoint, text, alignment) drawn in the font color, and
+            the (MPoint, text, alignment) of the highlighted word or None
+        """
+        cached = self._runs.get(highlight)
+        if cached is not None:
+            return cached
+
+        center = OpenMayaRender.MUIDrawManager.kCenter
+        left = OpenMayaRender.MUIDrawManager.kLeft
+        runs = []
+        word = None
+        for i, (line, point) in enumerate(zip(self.lines, self.points)):
+            if highlight[0] != i:
+                runs.append((point, line, center))
+                continue
+            # Part offsets use the estimated width (no text metrics in VP2)
+            _, begin, end = highlight
+            x = point.x - estimate_text_width(line, self.font_size) / 2
+            for j, text in enumerate((line[:begin], line[begin:end], line[end:])):
+                if text:
+                    run = (OpenMaya.MPoint(x, point.y, 0), text, left)
+                    if j == 1:
+                        word = run
+                    else:
+                        runs.append(run)
+                    x += estimate_text_width(text, self.font_size)
+
+        cached = self._runs[highlight] = (runs, word)
+        return cached
+
+    def effect_runs(self, highlight, effect, width):
+        """Get the text2d calls of a shadow or outline.
+
+        Args:
+            highlight: (line index, start column, end column) or None
+            effect: EFFECT_SHADOW or EFFECT_OUTLINE
+            width: Offset of the copies in pixels
+
+        Returns:
+            List of (MPoint, text, alignment), all drawn in the effect color
+        """
+        key = ("effect", highlight, effect, width)
+        cached = self._runs.get(key)
+        if cached is not None:
+            return cached
+
+        if highlight is None:
+            center = OpenMayaRender.MUIDrawManager.kCenter
+            runs = [
+                (point, line, center) for line, point in zip(self.lines, self.points)
+            ]
+        else:
+            runs, word = self.runs(highlight)
+            if word is not None:
+                runs = runs + [word]
+        MPoint = OpenMaya.MPoint
+        cached = self._runs[key] = [
+            (MPoint(point.x + dx * width, point.y + dy * width, 0), text, alignment)
+            for dx, dy in EFFECT_OFFSETS[effect]
+            for point, text, alignment in runs
+        ]
+        return cached
+
+    def box(self, padding):
+        """Get the rect2d arguments of the background box.
+
+        Args:
+            padding: Space between the text and the box edges in pixels
+
+        Returns:
+            (center MPoint, half width, half height)
+        """
+        key = ("box", padding)
+        cached = self._runs.get(key)
+        if cached is not None:
+            return cached
+
+        count = len(self.lines)
+        width = max(estimate_text_width(line, self.font_size) for line in self.lines)
+        line_height = int(self.font_size * LINE_SPACING)
+        # text2d positions are on the baseline; leave room for descenders
+        top = self.points[0].y + self.font_size + padding
+        bottom = self.points[count - 1].y - (line_height - self.font_size) - padding
+        # rect2d scales are half extents
+        cached = self._runs[key] = (
+            OpenMaya.MPoint(self.points[0].x, (top + bottom) / 2.0, 0),
+            width / 2.0 + padding,
+            (top - bottom) / 2.0,
+        )
+        return cached
+
+
 class SubtitleLocatorData(OpenMaya.MUserData):
     """User data for subtitle locator drawing."""
 
@@ -208,14 +1775,47 @@ class SubtitleLocatorData(OpenMaya.MUserData):
         self.font_color = OpenMaya.MColor(DEFAULT_FONT_COLOR)
         self.position_x = DEFAULT_POSITION_X
         self.position_y = DEFAULT_POSITION_Y
+        self.highlight_color = OpenMaya.MColor(DEFAULT_HIGHLIGHT_COLOR)
+        self.highlight = None  # (line index, start column, end column)
         self.should_draw = True
+        self.stats = NULL_DRAW_STATS
+        self.style = None  # TextStyle, None without effect and box
+        self.layout = TextLayout()
+
+    def apply(self, state):
+        """Copy a FrameState into the draw data."""
+        (
+            self.subtitle_text,
+            self.font_size,
+            self.font_color,
+            self.position_x,
+            self.position_y,
+            self.highlight,
+            highlight_color,
+            self.style,
+        ) = state
+        if highlight_color is not None:
+            self.highlight_color = highlight_color
 
 
 class SubtitleLocatorDrawOverride(OpenMayaRender.MPxDrawOverride):
     """Draw override for subtitle locator."""
 
-    # Cache for loaded subtitle data
-    _subtitle_cache = {}
+    # Loaded subtitle files, shared by all locators
+    manager = SubtitleManager.instance()
+
+    # Draw instrumentation: node path -> DrawStats
+    stats_enabled = False
+    _stats: ClassVar[dict] = {}
+
+    _romaji_warned = False
+
+    # Baked frame tables for playblasts: node path -> BakedFrames
+    _baked: ClassVar[dict] = {}
+
+    # Cue windows to prepare in idle time:
+    # (source, (wrap settings, display mode)) -> cue on screen
+    _prefetch_requests: ClassVar[dict] = {}
 
     def __init__(self, obj):
         """Constructor."""
@@ -254,6 +1854,26 @@ class SubtitleLocatorDrawOverride(OpenMayaRender.MPxDrawOverride):
         node = obj_path.node()
         data.should_draw = True
 
+        stats = NULL_DRAW_STATS
+        if SubtitleLocatorDrawOverride.stats_enabled:
+            stats = self._get_stats(obj_path)
+        data.stats = stats
+        stats.begin()
+
+        # Get current time in frames
+        current_time = OpenMayaAnim.MAnimControl.currentTime()
+        current_frame = current_time.value
+
+        # Baked frames (playblast): a single lookup, no plug reads
+        if self._baked:
+            baked = self._baked.get(obj_path.fullPathName())
+            state = baked.frames.get(current_frame) if baked else None
+            if state is not None:
+                data.should_draw = baked.camera in (None, camera_path.fullPathName())
+                data.apply(state)
+                stats.lap(PHASE_LOOKUP)
+                return data
+
         # Check target camera
         target_camera_plug = OpenMaya.MPlug(node, SubtitleLocator.target_camera)
         if target_camera_plug.isConnected:
@@ -271,52 +1891,307 @@ class SubtitleLocatorDrawOverride(OpenMayaRender.MPxDrawOverride):
                 if current_camera_path != target_camera_path:
                     data.should_draw = False
                     data.subtitle_text = ""
+                    stats.lap(PHASE_CAMERA)
                     return data
 
-        # Get attributes
-        data.font_size = OpenMaya.MPlug(node, SubtitleLocator.font_size).asInt()
-        data.font_color = OpenMaya.MColor(
-            OpenMaya.MPlug(node, SubtitleLocator.font_color).asMDataHandle().asFloat3()
-        )
-        data.position_x = OpenMaya.MPlug(node, SubtitleLocator.position_x).asFloat()
-        data.position_y = OpenMaya.MPlug(node, SubtitleLocator.position_y).asFloat()
+        stats.lap(PHASE_CAMERA)
+
+        settings = self._read_settings(node)
+        fps = OpenMaya.MTime(1.0, OpenMaya.MTime.kSeconds).asUnits(current_time.unit)
+        stats.lap(PHASE_PLUGS)
 
-        # Get wrap settings
-        wrap_text = OpenMaya.MPlug(node, SubtitleLocator.wrap_text).asBool()
-        word_wrap = OpenMaya.MPlug(node, SubtitleLocator.word_wrap).asBool()
-        max_chars = OpenMaya.MPlug(node, SubtitleLocator.max_chars_per_line).asInt()
-        max_lines = OpenMaya.MPlug(node, SubtitleLocator.max_lines).asInt()
+        data.apply(self._evaluate(settings, current_frame, fps, stats))
+        return data
 
-        # Get subtitle file path
-        subtitle_file_plug = OpenMaya.MPlug(node, SubtitleLocator.subtitle_file)
-        subtitle_file = subtitle_file_plug.asString()
+    @staticmethod
+    def _read_settings(node):
+        """Read the attributes that decide what a locator shows."""
+        MPlug = OpenMaya.MPlug
+        highlight_words = MPlug(node, SubtitleLocator.highlight_words).asBool()
+        highlight_color = None
+        if highlight_words:
+            highlight_color = OpenMaya.MColor(
+                MPlug(node, SubtitleLocator.highlight_color).asMDataHandle().asFloat3()
+            )
 
-        # Get start frame
-        start_frame = OpenMaya.MPlug(node, SubtitleLocator.start_frame).asInt()
+        # Effect and box settings are read only when one of them is on
+        style = None
+        effect = MPlug(node, SubtitleLocator.text_effect).asShort()
+        background = MPlug(node, SubtitleLocator.background_box).asBool()
+        if effect != EFFECT_NONE or background:
+            effect_color = effect_width = background_color = padding = None
+            if effect != EFFECT_NONE:
+                effect_color = OpenMaya.MColor(
+                    MPlug(node, SubtitleLocator.effect_color).asMDataHandle().asFloat3()
+                )
+                effect_width = MPlug(node, SubtitleLocator.effect_width).asInt()
+            if background:
+                red, green, blue = (
+                    MPlug(node, SubtitleLocator.background_color)
+                    .asMDataHandle()
+                    .asFloat3()
+                )
+                opacity = MPlug(node, SubtitleLocator.background_opacity).asFloat()
+                background_color = OpenMaya.MColor((red, green, blue, opacity))
+                padding = MPlug(node, SubtitleLocator.background_padding).asInt()
+            style = TextStyle(
+                effect,
+                effect_color,
+                effect_width,
+                background,
+                background_color,
+                padding,
+            )
 
-        # Get current time in frames, then convert to subtitle time in seconds
-        current_frame = OpenMayaAnim.MAnimControl.currentTime().value
-        fps = OpenMaya.MTime(1.0, OpenMaya.MTime.kSeconds).asUnits(
-            OpenMayaAnim.MAnimControl.currentTime().unit
+        # The embedded cue table is read from the node once per checksum
+        embedded = MPlug(node, SubtitleLocator.embedded_checksum).asString()
+        if embedded:
+            manager = SubtitleManager.instance()
+            if not manager.has_embedded(embedded):
+                manager.load_embedded(
+                    embedded, MPlug(node, SubtitleLocator.embedded_cues).asString()
+                )
+
+        # Positional, in LocatorSettings field order (cheaper per frame)
+        return LocatorSettings(
+            MPlug(node, SubtitleLocator.subtitle_file).asString(),
+            MPlug(node, SubtitleLocator.start_frame).asInt(),
+            MPlug(node, SubtitleLocator.font_size).asInt(),
+            OpenMaya.MColor(
+                MPlug(node, SubtitleLocator.font_color).asMDataHandle().asFloat3()
+            ),
+            MPlug(node, SubtitleLocator.position_x).asFloat(),
+            MPlug(node, SubtitleLocator.position_y).asFloat(),
+            MPlug(node, SubtitleLocator.wrap_text).asBool(),
+            MPlug(node, SubtitleLocator.word_wrap).asBool(),
+            MPlug(node, SubtitleLocator.max_chars_per_line).asInt(),
+            MPlug(node, SubtitleLocator.max_lines).asInt(),
+            MPlug(node, SubtitleLocator.display_mode).asShort(),
+            highlight_words,
+            highlight_color,
+            embedded,
+            style,
         )
 
-        # Calculate subtitle time: (currentFrame - startFrame) / fps
-        subtitle_time = (current_frame - start_frame) / fps
+    @classmethod
+    def _evaluate(cls, settings, frame, fps, stats=NULL_DRAW_STATS, wait=False):
+        """Compute what a locator shows at a frame.
 
-        # Find subtitle for current time
-        raw_text = self._get_subtitle_at_time(subtitle_file, subtitle_time)
+        Args:
+            settings: LocatorSettings of the node
+            frame: Timeline frame (may be fractional)
+            fps: Frames per second
+            stats: DrawStats to record the phases in
+            wait: Convert romaji on this thread instead of in the background
 
-        # Apply text wrapping if enabled
-        if wrap_text and raw_text:
-            data.subtitle_text = self._wrap_text(
-                raw_text, max_chars, max_lines, word_wrap
-            )
+        Returns:
+            FrameState
+        """
+        # Find subtitle for current frame
+        stats.cache(cls.manager.is_loaded(settings.subtitle_file, settings.embedded))
+        source = cls.manager.source(settings.subtitle_file, settings.embedded)
+        index = source.index if source is not None else None
+        cue = index.find_frame(frame, fps, settings.start_frame) if index else -1
+        raw_text = index.text(cue) if cue >= 0 else ""
+        stats.lap(PHASE_LOOKUP)
+
+        # Romaji from the background converter (original text until ready)
+        display_mode = settings.display_mode
+        romaji_text = None
+        if cue >= 0 and display_mode != DISPLAY_ORIGINAL:
+            romaji_text = cls._get_romaji(source, cue, wait)
+        is_romaji = romaji_text is not None and display_mode == DISPLAY_ROMAJI
+        if is_romaji:
+            raw_text, romaji_text = romaji_text, None
+        stats.lap(PHASE_LOOKUP)
+
+        # Apply text wrapping if enabled (cached per cue in the source)
+        wrap = (settings.max_chars, settings.max_lines, settings.word_wrap)
+
+        # Have the idle-time prefetch prepare the cues around this one
+        if cue >= 0 and (settings.wrap_text or display_mode != DISPLAY_ORIGINAL):
+            key = (wrap if settings.wrap_text else None, display_mode)
+            if source.prefetched.get(key) != cue:
+                cls._prefetch_requests[(source, key)] = cue
+        if settings.wrap_text and raw_text:
+            subtitle_text = cls._wrap_cue(source, cue, is_romaji, raw_text, wrap)
         else:
-            data.subtitle_text = raw_text
+            subtitle_text = raw_text
+        original_lines = subtitle_text.split("\n")
+        if romaji_text:
+            if settings.wrap_text:
+                romaji_text = cls._wrap_cue(source, cue, True, romaji_text, wrap)
+            subtitle_text += "\n" + romaji_text
+        stats.lap(PHASE_WRAP)
+
+        # Find the spoken word within the cue (word timings index the original)
+        highlight = None
+        if cue >= 0 and display_mode != DISPLAY_ROMAJI and settings.highlight_words:
+            time_ms = (frame - settings.start_frame) * 1000.0 / fps
+            span = source.find_word(index.starts[cue], time_ms)
+            if span:
+                highlight = locate_span(raw_text, original_lines, *span)
+        stats.lap(PHASE_LOOKUP)
+
+        return FrameState(
+            subtitle_text,
+            settings.font_size,
+            settings.font_color,
+            settings.position_x,
+            settings.position_y,
+            highlight,
+            settings.highlight_color if highlight else None,
+            settings.style,
+        )
 
-        return data
+    @classmethod
+    def bake(cls, dag_path, start_frame, end_frame):
+        """Precompute what a locator shows on every frame of a range.
 
-    def _wrap_text(self, text, max_chars, max_lines, word_wrap):
+        While a node is baked, drawing a whole frame in the range is a
+        single dict lookup (no plug reads, wrapping or romaji conversion).
+        Attribute changes are not seen until the node is baked again.
+
+        Args:
+            dag_path: MDagPath of the locator shape
+            start_frame: First frame
+            end_frame: Last frame (inclusive)
+
+        Returns:
+            BakedFrames
+        """
+        node = dag_path.node()
+        camera = None
+        target_camera_plug = OpenMaya.MPlug(node, SubtitleLocator.target_camera)
+        if target_camera_plug.isConnected:
+            connections = target_camera_plug.connectedTo(True, False)
+            if connections:
+                camera = OpenMaya.MDagPath.getAPathTo(
+                    connections[0].node()
+                ).fullPathName()
+
+        settings = cls._read_settings(node)
+        unit = OpenMayaAnim.MAnimControl.currentTime().unit
+        fps = OpenMaya.MTime(1.0, OpenMaya.MTime.kSeconds).asUnits(unit)
+
+        frames = {}
+        previous = None
+        for frame in range(int(start_frame), int(end_frame) + 1):
+            state = cls._evaluate(settings, frame, fps, wait=True)
+            # Share one state between the frames of a cue
+            if state == previous:
+                state = previous
+            frames[frame] = previous = state
+
+        baked = BakedFrames(camera, fps, frames)
+        cls._baked[dag_path.fullPathName()] = baked
+        return baked
+
+    @classmethod
+    def prefetch_cues(cls, budget=CUE_PREFETCH_BUDGET):
+        """Wrap and romanize the cues around each locator's current cue.
+
+        Runs from a timer callback between draws, so scrubbing back and
+        forth or stepping through dense dialogue finds the neighbouring
+        cues ready. Work stops after ``budget`` seconds and continues on
+        the next tick.
+
+        Args:
+            budget: Seconds to work for
+
+        Returns:
+            Number of windows left to prepare
+        """
+        requests = cls._prefetch_requests
+        if not requests:
+            return 0
+        deadline = time.perf_counter() + budget
+        for request in list(requests):
+            source, key = request
+            cue = requests.pop(request)
+            index = source.index
+            if index is None or cue >= len(index):
+                continue
+            if cls._prefetch_window(source, index, cue, *key, deadline):
+                source.prefetched[key] = cue
+            else:
+                # Out of time, or romaji still converting: retry next tick
+                requests.setdefault(request, cue)
+            if time.perf_counter() > deadline:
+                break
+        return len(requests)
+
+    @classmethod
+    def _prefetch_window(cls, source, index, cue, wrap, display_mode, deadline):
+        """Prepare the cues within CUE_PREFETCH_WINDOW of ``cue``, nearest first.
+
+        Returns:
+            True if every cue of the window is ready
+        """
+        romaji = None
+        if display_mode != DISPLAY_ORIGINAL and _romanize() is not None:
+            romaji = cls.manager.romaji
+            if romaji.error is None:
+                romaji.queue(
+                    source.key,
+                    index,
+                    cue - CUE_PREFETCH_WINDOW,
+                    cue + CUE_PREFETCH_WINDOW + 1,
+                )
+            else:
+                romaji = None
+
+        complete = True
+        for offset in range(CUE_PREFETCH_WINDOW + 1):
+            for i in (cue - offset, cue + offset) if offset else (cue,):
+                if not 0 <= i < len(index):
+                    continue
+                if time.perf_counter() > deadline:
+                    return False
+                romaji_text = romaji.peek(source.key, i) if romaji else None
+                if romaji is not None and romaji_text is None:
+                    complete = False
+                if wrap is None:
+                    continue
+                if display_mode != DISPLAY_ROMAJI or romaji_text is None:
+                    cls._wrap_cue(source, i, False, index.text(i), wrap)
+                if romaji_text is not None:
+                    cls._wrap_cue(source, i, True, romaji_text, wrap)
+        return complete
+
+    @classmethod
+    def _wrap_cue(cls, source, cue, is_romaji, text, wrap):
+        """Wrap cue text, reusing the result for every locator on the file."""
+        key = (cue, is_romaji) + wrap
+        wrapped = source.wrapped.get(key)
+        if wrapped is None:
+            if len(source.wrapped) >= WRAP_CACHE_SIZE:
+                source.wrapped.clear()
+            wrapped = source.wrapped[key] = cls._wrap_text(text, *wrap)
+        return wrapped
+
+    @classmethod
+    def _get_romaji(cls, source, cue, wait=False):
+        """Get the romaji of a cue, or None if it is not available yet."""
+        if _romanize() is None:
+            if not SubtitleLocatorDrawOverride._romaji_warned:
+                SubtitleLocatorDrawOverride._romaji_warned = True
+                OpenMaya.MGlobal.displayWarning(
+                    "displayMode needs the subtitler package; showing original text"
+                )
+            return None
+        return cls.manager.romaji.get(source.key, source.index, cue, wait)
+
+    def _get_stats(self, obj_path):
+        """Get the DrawStats of a node, creating it on first use."""
+        key = obj_path.fullPathName()
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = DrawStats()
+        return stats
+
+    @classmethod
+    def _wrap_text(cls, text, max_chars, max_lines, word_wrap):
         """Wrap text according to settings.
 
         Args:
@@ -369,149 +2244,747 @@ class SubtitleLocatorDrawOverride(OpenMayaRender.MPxDrawOverride):
 
         return "\n".join(lines)
 
-    def _get_subtitle_at_time(self, subtitle_file, time_seconds):
-        """Get subtitle text for the given time.
-
-        Args:
-            subtitle_file: Path to SRT file
-            time_seconds: Current time in seconds
-
-        Returns:
-            Subtitle text or empty string
-        """
-        if not subtitle_file:
-            return ""
-
-        # Load subtitle data (with caching)
-        segments = self._load_srt(subtitle_file)
-        if not segments:
-            return ""
+    def addUIDrawables(self, obj_path, draw_manager, frame_context, data):
+        """Add UI drawables for subtitle display."""
+        if not isinstance(data, SubtitleLocatorData):
+            return
 
-        # Find subtitle at current time
-        for segment in segments:
-            start = segment.get("start", 0)
-            end = segment.get("end", 0)
-            if start <= time_seconds < end:
-                return segment.get("text", "")
+        if not data.should_draw or not data.subtitle_text:
+            return
 
-        return ""
+        data.stats.resume()
+
+        # Lay the text out again only when it or the viewport changed
+        _, _, viewport_width, viewport_height = frame_context.getViewportDimensions()
+        layout = data.layout
+        key = (
+            data.subtitle_text,
+            data.font_size,
+            data.position_x,
+            data.position_y,
+            viewport_width,
+            viewport_height,
+        )
+        if layout.key != key:
+            layout.update(
+                key,
+                data.subtitle_text,
+                data.font_size,
+                int(viewport_width * (0.5 + data.position_x * 0.5)),
+                int(viewport_height * (0.5 + data.position_y * 0.5)),
+            )
 
-    def _parse_srt_timestamp(self, timestamp):
-        """Parse SRT timestamp to seconds.
+        draw_manager.beginDrawable()
+        text2d = draw_manager.text2d
+        style = data.style
+        if style is not None and style.background:
+            center, scale_x, scale_y = layout.box(style.padding)
+            draw_manager.setColor(style.background_color)
+            draw_manager.rect2d(center, SCREEN_UP, scale_x, scale_y, True)
+        draw_manager.setFontSize(data.font_size)
+        if style is not None and style.effect != EFFECT_NONE:
+            draw_manager.setColor(style.effect_color)
+            effect_runs = layout.effect_runs(
+                data.highlight, style.effect, style.effect_width
+            )
+            for position, text, alignment in effect_runs:
+                text2d(position, text, alignment, None, None, False)
+        draw_manager.setColor(data.font_color)
+        if data.highlight is None:
+            center = OpenMayaRender.MUIDrawManager.kCenter
+            for line, position in zip(layout.lines, layout.points):
+                text2d(position, line, center, None, None, False)
+        else:
+            runs, word = layout.runs(data.highlight)
+            for position, text, alignment in runs:
+                text2d(position, text, alignment, None, None, False)
+            if word is not None:
+                draw_manager.setColor(data.highlight_color)
+                position, text, alignment = word
+                text2d(position, text, alignment, None, None, False)
+        draw_manager.endDrawable()
+        data.stats.lap(PHASE_DRAW)
+
+
+def get_draw_stats(nodes=None, include_samples=False):
+    """Get draw instrumentation for subtitle locators.
+
+    Args:
+        nodes: Node path names to report (default: all recorded nodes)
+        include_samples: Include the raw per-frame samples
+
+    Returns:
+        Dict with 'enabled' and per-node summaries under 'nodes'
+    """
+    recorded = SubtitleLocatorDrawOverride._stats
+    if nodes:
+        keys = [
+            key
+            for key in recorded
+            if any(key == node or key.startswith(node + "|") for node in nodes)
+        ]
+    else:
+        keys = list(recorded)
+
+    return {
+        "enabled": SubtitleLocatorDrawOverride.stats_enabled,
+        "nodes": {key: recorded[key].summary(include_samples) for key in keys},
+    }
+
+
+class SubtitleLocatorStatsCmd(OpenMaya.MPxCommand):
+    """Control and query the draw instrumentation.
+
+    Usage:
+        cmds.subtitleLocatorStats(enable=True)
+        cmds.subtitleLocatorStats("subtitleLocator1")  # JSON summary
+        cmds.subtitleLocatorStats(reset=True)
+    """
+
+    kEnableFlag = "-e"
+    kEnableFlagLong = "-enable"
+    kResetFlag = "-r"
+    kResetFlagLong = "-reset"
+    kSamplesFlag = "-s"
+    kSamplesFlagLong = "-samples"
 
-        Args:
-            timestamp: SRT format timestamp (HH:MM:SS,mmm)
+    def __init__(self):
+        OpenMaya.MPxCommand.__init__(self)
 
-        Returns:
-            Time in seconds
-        """
-        match = re.match(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})", timestamp)
-        if not match:
-            return 0.0
+    @staticmethod
+    def creator():
+        return SubtitleLocatorStatsCmd()
 
-        hours, minutes, seconds, millis = map(int, match.groups())
-        return hours * 3600 + minutes * 60 + seconds + millis / 1000
+    @staticmethod
+    def createSyntax():
+        syntax = OpenMaya.MSyntax()
+        syntax.addFlag(
+            SubtitleLocatorStatsCmd.kEnableFlag,
+            SubtitleLocatorStatsCmd.kEnableFlagLong,
+            OpenMaya.MSyntax.kBoolean,
+        )
+        syntax.addFlag(
+            SubtitleLocatorStatsCmd.kResetFlag, SubtitleLocatorStatsCmd.kResetFlagLong
+        )
+        syntax.addFlag(
+            SubtitleLocatorStatsCmd.kSamplesFlag,
+            SubtitleLocatorStatsCmd.kSamplesFlagLong,
+        )
+        syntax.setObjectType(OpenMaya.MSyntax.kStringObjects, 0)
+        return syntax
+
+    def doIt(self, args):
+        arg_parser = OpenMaya.MArgParser(self.syntax(), args)
+
+        if arg_parser.isFlagSet(self.kEnableFlag):
+            enabled = arg_parser.flagArgumentBool(self.kEnableFlag, 0)
+            SubtitleLocatorDrawOverride.stats_enabled = enabled
+
+        if arg_parser.isFlagSet(self.kResetFlag):
+            SubtitleLocatorDrawOverride._stats.clear()
+
+        nodes = []
+        for name in arg_parser.getObjectStrings():
+            selection = OpenMaya.MGlobal.getSelectionListByName(name)
+            nodes.append(selection.getDagPath(0).fullPathName())
+
+        include_samples = arg_parser.isFlagSet(self.kSamplesFlag)
+        self.setResult(json.dumps(get_draw_stats(nodes, include_samples)))
+
+
+def _locators_by_source(manager):
+    """Map loaded source paths to the names of the locators showing them."""
+    nodes = {}
+    iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kPluginLocatorNode)
+    while not iterator.isDone():
+        node = iterator.thisNode()
+        node_fn = OpenMaya.MFnDependencyNode(node)
+        if node_fn.typeName == K_PLUGIN_NODE_NAME:
+            value = OpenMaya.MPlug(node, SubtitleLocator.subtitle_file).asString()
+            checksum = OpenMaya.MPlug(node, SubtitleLocator.embedded_checksum)
+            source = manager.find(value, checksum.asString())
+            if source is not None:
+                nodes.setdefault(source.key, []).append(node_fn.name())
+        iterator.next()
+    return nodes
+
+
+def list_subtitle_sources():
+    """Describe the subtitle files loaded by the scene's locators.
+
+    Returns:
+        List of dicts with 'path', 'aliases' (subtitleFile values),
+        'nodes' (locators showing it), 'cues', 'loadMs', 'memory' (bytes
+        per cache, see SubtitleSource.memory, plus 'romaji') and
+        'memoryTotal' (bytes, excluding the memory-mapped index)
+    """
+    manager = SubtitleManager.instance()
+    nodes = _locators_by_source(manager)
+    sources = []
+    for source in manager.sources():
+        memory = source.memory()
+        memory["romaji"] = manager.romaji.memory(source.key)
+        sources.append(
+            {
+                "path": source.key,
+                "aliases": manager.aliases(source),
+                "nodes": nodes.get(source.key, []),
+                "cues": len(source.index) if source.index is not None else 0,
+                "loadMs": source.load_ms,
+                "memory": memory,
+                "memoryTotal": sum(
+                    size for name, size in memory.items() if name != "mapped"
+                ),
+            }
+        )
+    return sources
 
-    def _load_srt(self, subtitle_file):
-        """Load subtitles from SRT file with caching.
 
-        Args:
-            subtitle_file: Path to SRT file
+class ListSubtitleSourcesCmd(OpenMaya.MPxCommand):
+    """List the subtitle files shared by the scene's locators.
 
-        Returns:
-            List of segments or empty list
-        """
-        # Check cache
-        if subtitle_file in self._subtitle_cache:
-            return self._subtitle_cache[subtitle_file]
+    Usage:
+        json.loads(cmds.listSubtitleSources())
+        cmds.listSubtitleSources(reload=True)  # re-check files on disk first
+    """
 
-        # Load file
-        try:
-            path = Path(subtitle_file)
-            if not path.exists():
-                return []
+    kReloadFlag = "-r"
+    kReloadFlagLong = "-reload"
 
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+    def __init__(self):
+        OpenMaya.MPxCommand.__init__(self)
 
-            # Parse SRT
-            segments = []
-            blocks = re.split(r"\n\n+", content.strip())
+    @staticmethod
+    def creator():
+        return ListSubtitleSourcesCmd()
 
-            for block in blocks:
-                lines = block.strip().split("\n")
-                if len(lines) < 3:
-                    continue
+    @staticmethod
+    def createSyntax():
+        syntax = OpenMaya.MSyntax()
+        syntax.addFlag(
+            ListSubtitleSourcesCmd.kReloadFlag, ListSubtitleSourcesCmd.kReloadFlagLong
+        )
+        return syntax
+
+    def doIt(self, args):
+        arg_parser = OpenMaya.MArgParser(self.syntax(), args)
+        if arg_parser.isFlagSet(self.kReloadFlag):
+            SubtitleManager.instance().check()
+        self.setResult(json.dumps(list_subtitle_sources()))
+
+
+def baked_events(baked):
+    """Merge the frames of a baked table into subtitle events.
+
+    Consecutive frames showing the same text with the same style become
+    one event; word highlights are not included.
+
+    Args:
+        baked: BakedFrames
+
+    Returns:
+        List of dicts with 'start' and 'end' (exclusive) frames, 'text',
+        'fontSize', 'color' (RGB), 'position' (x, y from -1 to 1)
+    """
+    events = []
+    current = None
+    for frame in sorted(baked.frames):
+        state = baked.frames[frame]
+        key = (
+            state.subtitle_text,
+            state.font_size,
+            tuple(state.font_color)[:3],
+            state.position_x,
+            state.position_y,
+        )
+        if current is not None and current[0] == key and current[1]["end"] == frame:
+            current[1]["end"] = frame + 1
+            continue
+        current = None
+        if state.subtitle_text:
+            event = {
+                "start": frame,
+                "end": frame + 1,
+                "text": state.subtitle_text,
+                "fontSize": state.font_size,
+                "color": list(key[2]),
+                "position": [state.position_x, state.position_y],
+            }
+            events.append(event)
+            current = (key, event)
+    return events
+
+
+class SubtitleLocatorBakeCmd(OpenMaya.MPxCommand):
+    """Bake subtitle locators for playblasts and batch renders.
+
+    Baking evaluates every frame of a range up front, so drawing a baked
+    frame skips the Python draw path. The result also lists the frames as
+    events, which ``maya_subtitler.burnin`` turns into ASS or ffmpeg
+    drawtext scripts for burning subtitles in outside Maya.
+
+    Usage:
+        cmds.subtitleLocatorBake("subtitleLocator1", startFrame=1, endFrame=240)
+        cmds.subtitleLocatorBake("subtitleLocator1", events=True)  # JSON
+        cmds.subtitleLocatorBake(clear=True)
+
+    Each call bakes again, so attribute and file changes are picked up;
+    -reuse keeps an existing bake of the same range instead.
+    """
+
+    kStartFrameFlag = "-sf"
+    kStartFrameFlagLong = "-startFrame"
+    kEndFrameFlag = "-ef"
+    kEndFrameFlagLong = "-endFrame"
+    kClearFlag = "-c"
+    kClearFlagLong = "-clear"
+    kEventsFlag = "-ev"
+    kEventsFlagLong = "-events"
+    kReuseFlag = "-ru"
+    kReuseFlagLong = "-reuse"
 
-                # Line 0: index (ignored)
-                # Line 1: timestamp
-                # Line 2+: text
-                timestamp_line = lines[1]
-                text_lines = lines[2:]
+    def __init__(self):
+        OpenMaya.MPxCommand.__init__(self)
 
-                # Parse timestamp
-                match = re.match(r"(.+?)\s*-->\s*(.+)", timestamp_line)
-                if not match:
-                    continue
+    @staticmethod
+    def creator():
+        return SubtitleLocatorBakeCmd()
 
-                start_str, end_str = match.groups()
-                start = self._parse_srt_timestamp(start_str.strip())
-                end = self._parse_srt_timestamp(end_str.strip())
-                text = " ".join(text_lines)
+    @staticmethod
+    def createSyntax():
+        syntax = OpenMaya.MSyntax()
+        syntax.addFlag(
+            SubtitleLocatorBakeCmd.kStartFrameFlag,
+            SubtitleLocatorBakeCmd.kStartFrameFlagLong,
+            OpenMaya.MSyntax.kDouble,
+        )
+        syntax.addFlag(
+            SubtitleLocatorBakeCmd.kEndFrameFlag,
+            SubtitleLocatorBakeCmd.kEndFrameFlagLong,
+            OpenMaya.MSyntax.kDouble,
+        )
+        syntax.addFlag(
+            SubtitleLocatorBakeCmd.kClearFlag, SubtitleLocatorBakeCmd.kClearFlagLong
+        )
+        syntax.addFlag(
+            SubtitleLocatorBakeCmd.kEventsFlag, SubtitleLocatorBakeCmd.kEventsFlagLong
+        )
+        syntax.addFlag(
+            SubtitleLocatorBakeCmd.kReuseFlag, SubtitleLocatorBakeCmd.kReuseFlagLong
+        )
+        syntax.setObjectType(OpenMaya.MSyntax.kStringObjects, 0)
+        return syntax
+
+    def doIt(self, args):
+        arg_parser = OpenMaya.MArgParser(self.syntax(), args)
+
+        paths = []
+        for name in arg_parser.getObjectStrings():
+            dag_path = OpenMaya.MGlobal.getSelectionListByName(name).getDagPath(0)
+            paths.append(dag_path)
+
+        baked_tables = SubtitleLocatorDrawOverride._baked
+        if arg_parser.isFlagSet(self.kClearFlag):
+            if paths:
+                for dag_path in paths:
+                    baked_tables.pop(dag_path.fullPathName(), None)
+            else:
+                baked_tables.clear()
+            self.setResult(json.dumps({"nodes": {}}))
+            return
 
-                segments.append({"start": start, "end": end, "text": text})
+        if not paths:
+            raise RuntimeError("subtitleLocatorBake: no subtitle locator given")
+
+        start_frame = OpenMayaAnim.MAnimControl.minTime().value
+        if arg_parser.isFlagSet(self.kStartFrameFlag):
+            start_frame = arg_parser.flagArgumentDouble(self.kStartFrameFlag, 0)
+        end_frame = OpenMayaAnim.MAnimControl.maxTime().value
+        if arg_parser.isFlagSet(self.kEndFrameFlag):
+            end_frame = arg_parser.flagArgumentDouble(self.kEndFrameFlag, 0)
+
+        include_events = arg_parser.isFlagSet(self.kEventsFlag)
+        reuse = arg_parser.isFlagSet(self.kReuseFlag)
+        result = {}
+        for dag_path in paths:
+            key = dag_path.fullPathName()
+            baked = baked_tables.get(key) if reuse else None
+            if (
+                baked is None
+                or not baked.frames
+                or min(baked.frames) != int(start_frame)
+                or max(baked.frames) != int(end_frame)
+            ):
+                baked = SubtitleLocatorDrawOverride.bake(
+                    dag_path, start_frame, end_frame
+                )
+            summary = {
+                "startFrame": int(start_frame),
+                "endFrame": int(end_frame),
+                "fps": baked.fps,
+                "camera": baked.camera,
+                "frames": len(baked.frames),
+                "states": len({id(state) for state in baked.frames.values()}),
+            }
+            if include_events:
+                summary["events"] = baked_events(baked)
+            result[key] = summary
+
+        self.setResult(json.dumps({"nodes": result}))
+
+
+def _locator_path(name):
+    """Get the shape path of a locator from its transform or shape name."""
+    dag_path = OpenMaya.MGlobal.getSelectionListByName(name).getDagPath(0)
+    if dag_path.node().hasFn(OpenMaya.MFn.kTransform):
+        dag_path.extendToShape()
+    return dag_path
+
+
+class SubtitleCueCmd(OpenMaya.MPxCommand):
+    """Navigate the cues of a subtitle locator and bookmark them.
+
+    Lookups are a bisect over the locator's sorted cue index, so they take
+    the same time for ten cues or ten thousand. Results are JSON with the
+    cue 'index', 'startFrame', 'endFrame' (first frame after the cue) and
+    'text', or null when there is no such cue. Like Maya's next/previous
+    key, -next and -previous look strictly after or before the frame.
+
+    Bookmarks are created (or removed) in one undoable batch.
+
+    Usage:
+        cmds.subtitleCue("subtitleLocator1")  # cue at the current frame
+        cmds.subtitleCue("subtitleLocator1", frame=120)
+        cmds.subtitleCue("subtitleLocator1", next=True, go=True)  # jump to it
+        cmds.subtitleCue("subtitleLocator1", previous=True, go=True)
+        cmds.subtitleCue("subtitleLocator1", bookmarks=True)
+        cmds.subtitleCue("subtitleLocator1", clearBookmarks=True)
+    """
+
+    kFrameFlag = "-f"
+    kFrameFlagLong = "-frame"
+    kNextFlag = "-nx"
+    kNextFlagLong = "-next"
+    kPreviousFlag = "-pv"
+    kPreviousFlagLong = "-previous"
+    kGoFlag = "-g"
+    kGoFlagLong = "-go"
+    kBookmarksFlag = "-bm"
+    kBookmarksFlagLong = "-bookmarks"
+    kClearBookmarksFlag = "-cbm"
+    kClearBookmarksFlagLong = "-clearBookmarks"
 
-            self._subtitle_cache[subtitle_file] = segments
-            return segments
+    def __init__(self):
+        OpenMaya.MPxCommand.__init__(self)
+        self._modifier = None
 
-        except Exception as e:
-            OpenMaya.MGlobal.displayWarning(f"Failed to load SRT file: {e}")
-            return []
+    @staticmethod
+    def creator():
+        return SubtitleCueCmd()
 
-    def addUIDrawables(self, obj_path, draw_manager, frame_context, data):
-        """Add UI drawables for subtitle display."""
-        if not isinstance(data, SubtitleLocatorData):
+    @staticmethod
+    def createSyntax():
+        syntax = OpenMaya.MSyntax()
+        syntax.addFlag(
+            SubtitleCueCmd.kFrameFlag,
+            SubtitleCueCmd.kFrameFlagLong,
+            OpenMaya.MSyntax.kDouble,
+        )
+        syntax.addFlag(SubtitleCueCmd.kNextFlag, SubtitleCueCmd.kNextFlagLong)
+        syntax.addFlag(SubtitleCueCmd.kPreviousFlag, SubtitleCueCmd.kPreviousFlagLong)
+        syntax.addFlag(SubtitleCueCmd.kGoFlag, SubtitleCueCmd.kGoFlagLong)
+        syntax.addFlag(SubtitleCueCmd.kBookmarksFlag, SubtitleCueCmd.kBookmarksFlagLong)
+        syntax.addFlag(
+            SubtitleCueCmd.kClearBookmarksFlag, SubtitleCueCmd.kClearBookmarksFlagLong
+        )
+        syntax.setObjectType(OpenMaya.MSyntax.kStringObjects, 1, 1)
+        return syntax
+
+    def isUndoable(self):
+        # Only bookmark changes are undoable; lookups and -go are not
+        return self._modifier is not None
+
+    def doIt(self, args):
+        arg_parser = OpenMaya.MArgParser(self.syntax(), args)
+        dag_path = _locator_path(arg_parser.getObjectStrings()[0])
+        node = dag_path.node()
+
+        settings = SubtitleLocatorDrawOverride._read_settings(node)
+        start_frame = settings.start_frame
+        source = SubtitleManager.instance().source(
+            settings.subtitle_file, settings.embedded
+        )
+        if source is None or source.index is None:
+            raise RuntimeError(f"subtitleCue: cannot read '{settings.subtitle_file}'")
+        index = source.index
+        unit = OpenMayaAnim.MAnimControl.currentTime().unit
+        fps = OpenMaya.MTime(1.0, OpenMaya.MTime.kSeconds).asUnits(unit)
+
+        bookmarks = arg_parser.isFlagSet(self.kBookmarksFlag)
+        if bookmarks or arg_parser.isFlagSet(self.kClearBookmarksFlag):
+            prefix = OpenMaya.MFnDependencyNode(node).name() + "_cue"
+            self._modifier = OpenMaya.MDGModifier()
+            removed = self._delete_bookmarks(prefix)
+            created = 0
+            if bookmarks:
+                created = self._create_bookmarks(prefix, index, fps, start_frame, unit)
+            self._modifier.doIt()
+            self.setResult(json.dumps({"created": created, "removed": removed}))
             return
 
-        if not data.should_draw or not data.subtitle_text:
+        if arg_parser.isFlagSet(self.kFrameFlag):
+            frame = arg_parser.flagArgumentDouble(self.kFrameFlag, 0)
+        else:
+            frame = OpenMayaAnim.MAnimControl.currentTime().value
+
+        if arg_parser.isFlagSet(self.kNextFlag):
+            cue = index.next_frame(frame, fps, start_frame)
+        elif arg_parser.isFlagSet(self.kPreviousFlag):
+            cue = index.previous_frame(frame, fps, start_frame)
+        else:
+            cue = index.find_frame(frame, fps, start_frame)
+        if cue < 0:
+            self.setResult(json.dumps(None))
             return
 
-        draw_manager.beginDrawable()
+        cue_start, cue_end = index.frame_range(cue, fps, start_frame)
+        if arg_parser.isFlagSet(self.kGoFlag):
+            OpenMayaAnim.MAnimControl.setCurrentTime(OpenMaya.MTime(cue_start, unit))
+        self.setResult(
+            json.dumps(
+                {
+                    "index": cue,
+                    "startFrame": cue_start,
+                    "endFrame": cue_end,
+                    "text": index.text(cue),
+                }
+            )
+        )
 
-        # Get viewport dimensions
-        viewport_width = frame_context.getViewportDimensions()[2]
-        viewport_height = frame_context.getViewportDimensions()[3]
+    def _delete_bookmarks(self, prefix):
+        """Queue deletion of the bookmarks made for a locator."""
+        count = 0
+        iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kPluginDependNode)
+        while not iterator.isDone():
+            node_fn = OpenMaya.MFnDependencyNode(iterator.thisNode())
+            if node_fn.typeName == BOOKMARK_NODE_TYPE:
+                name = node_fn.name()
+                if name.startswith(prefix) and name[len(prefix) :].isdigit():
+                    self._modifier.deleteNode(iterator.thisNode())
+                    count += 1
+            iterator.next()
+        return count
+
+    def _create_bookmarks(self, prefix, index, fps, start_frame, unit):
+        """Queue one bookmark per cue, labelled with its first line."""
+        modifier = self._modifier
+        node_fn = OpenMaya.MFnDependencyNode()
+        for i in range(len(index)):
+            cue_start, cue_end = index.frame_range(i, fps, start_frame)
+            label = index.text(i).split("\n", 1)[0]
+            if len(label) > BOOKMARK_LABEL_LENGTH:
+                label = label[: BOOKMARK_LABEL_LENGTH - 1] + "\u2026"
+
+            try:
+                obj = modifier.createNode(BOOKMARK_NODE_TYPE)
+            except RuntimeError as e:
+                raise RuntimeError(
+                    "subtitleCue: bookmarks need the timeSliderBookmark plug-in "
+                    "(Maya 2020 or later)"
+                ) from e
+            modifier.renameNode(obj, f"{prefix}{i + 1}")
+            node_fn.setObject(obj)
+            modifier.newPlugValueString(node_fn.findPlug("name", False), label)
+            self._set_frame(node_fn.findPlug("timeRangeStart", False), cue_start, unit)
+            self._set_frame(
+                node_fn.findPlug("timeRangeStop", False),
+                max(cue_end - 1, cue_start),
+                unit,
+            )
+            color_plug = node_fn.findPlug("color", False)
+            for channel, value in enumerate(BOOKMARK_COLOR):
+                modifier.newPlugValueFloat(color_plug.child(channel), value)
+        return len(index)
+
+    def _set_frame(self, plug, frame, unit):
+        """Set a time or double plug to a frame."""
+        if plug.attribute().hasFn(OpenMaya.MFn.kTimeAttribute):
+            self._modifier.newPlugValueMTime(plug, OpenMaya.MTime(frame, unit))
+        else:
+            self._modifier.newPlugValueDouble(plug, frame)
+
+    def redoIt(self):
+        self._modifier.doIt()
+
+    def undoIt(self):
+        self._modifier.undoIt()
+
+
+def _embed_node(node, modifier, mode):
+    """Embed, re-sync, clear or describe the cue table of one locator.
+
+    Args:
+        node: Locator shape MObject
+        modifier: MDGModifier to queue attribute changes on
+        mode: "embed", "sync" (embed only if the file changed), "clear" or
+            "status"
+
+    Returns:
+        Dict with 'action' ("embedded", "unchanged", "missing", "cleared" or
+        "status"), 'checksum' (embedded), 'sourceChecksum' (file on disk)
+        and 'upToDate' (None unless both are known)
+    """
+    subtitle_file = OpenMaya.MPlug(node, SubtitleLocator.subtitle_file).asString()
+    checksum_plug = OpenMaya.MPlug(node, SubtitleLocator.embedded_checksum)
+    cues_plug = OpenMaya.MPlug(node, SubtitleLocator.embedded_cues)
+    checksum = checksum_plug.asString()
+
+    path = Path(os.path.abspath(subtitle_file)) if subtitle_file else None
+    current = None
+    if path is not None and path.is_file():
+        current = source_checksum(path)
+
+    action = "status"
+    if mode == "clear":
+        modifier.newPlugValueString(checksum_plug, "")
+        modifier.newPlugValueString(cues_plug, "")
+        action = "cleared"
+        checksum = ""
+    elif mode != "status":
+        if current is None:
+            if mode != "sync":
+                raise RuntimeError(f"subtitleEmbed: cannot read '{subtitle_file}'")
+            # Keep what is embedded (e.g. on a machine without the file)
+            action = "missing"
+        elif mode == "sync" and checksum == current:
+            action = "unchanged"
+        else:
+            modifier.newPlugValueString(cues_plug, encode_embedded(path))
+            modifier.newPlugValueString(checksum_plug, current)
+            action = "embedded"
+            checksum = current
+
+    return {
+        "action": action,
+        "checksum": checksum or None,
+        "sourceChecksum": current,
+        "upToDate": checksum == current if checksum and current else None,
+    }
+
+
+class SubtitleEmbedCmd(OpenMaya.MPxCommand):
+    """Save the parsed cue tables of subtitle locators in the scene.
+
+    An embedded locator draws from the compressed cue table stored on the
+    node, so the scene opens on farm machines or remote workstations
+    without the subtitle file and nothing is parsed on load. The checksum
+    of the file and its word timings is stored with it: -sync re-embeds
+    only locators whose file changed, and embedded locators are re-synced
+    this way before every scene save. Changes are undoable.
+
+    Usage:
+        cmds.subtitleEmbed("subtitleLocator1")  # JSON status per node
+        cmds.subtitleEmbed("subtitleLocator1", sync=True)
+        cmds.subtitleEmbed("subtitleLocator1", status=True)
+        cmds.subtitleEmbed("subtitleLocator1", clear=True)  # use the file again
+    """
+
+    kSyncFlag = "-s"
+    kSyncFlagLong = "-sync"
+    kStatusFlag = "-st"
+    kStatusFlagLong = "-status"
+    kClearFlag = "-c"
+    kClearFlagLong = "-clear"
 
-        # Calculate base position (normalized to pixel coordinates)
-        pos_x = int(viewport_width * (0.5 + data.position_x * 0.5))
-        pos_y = int(viewport_height * (0.5 + data.position_y * 0.5))
+    def __init__(self):
+        OpenMaya.MPxCommand.__init__(self)
+        self._modifier = None
 
-        # Set font properties
-        draw_manager.setFontSize(data.font_size)
-        draw_manager.setColor(data.font_color)
+    @staticmethod
+    def creator():
+        return SubtitleEmbedCmd()
 
-        # Split text into lines and draw each line separately
-        lines = data.subtitle_text.split("\n")
-        line_height = int(data.font_size * 1.4)  # Line spacing
-
-        # Calculate starting Y position (center the block of text)
-        total_height = line_height * len(lines)
-        start_y = pos_y + total_height // 2
-
-        for i, line in enumerate(lines):
-            line_y = start_y - (i * line_height)
-            position = OpenMaya.MPoint(pos_x, line_y, 0)
-
-            draw_manager.text2d(
-                position,
-                line,
-                OpenMayaRender.MUIDrawManager.kCenter,
-                None,
-                None,
-                False,
+    @staticmethod
+    def createSyntax():
+        syntax = OpenMaya.MSyntax()
+        syntax.addFlag(SubtitleEmbedCmd.kSyncFlag, SubtitleEmbedCmd.kSyncFlagLong)
+        syntax.addFlag(SubtitleEmbedCmd.kStatusFlag, SubtitleEmbedCmd.kStatusFlagLong)
+        syntax.addFlag(SubtitleEmbedCmd.kClearFlag, SubtitleEmbedCmd.kClearFlagLong)
+        syntax.setObjectType(OpenMaya.MSyntax.kStringObjects, 1)
+        return syntax
+
+    def isUndoable(self):
+        return self._modifier is not None
+
+    def doIt(self, args):
+        arg_parser = OpenMaya.MArgParser(self.syntax(), args)
+        mode = "embed"
+        if arg_parser.isFlagSet(self.kClearFlag):
+            mode = "clear"
+        elif arg_parser.isFlagSet(self.kStatusFlag):
+            mode = "status"
+        elif arg_parser.isFlagSet(self.kSyncFlag):
+            mode = "sync"
+
+        modifier = OpenMaya.MDGModifier()
+        result = {}
+        for name in arg_parser.getObjectStrings():
+            dag_path = _locator_path(name)
+            result[dag_path.fullPathName()] = _embed_node(
+                dag_path.node(), modifier, mode
             )
-
-        draw_manager.endDrawable()
+        modifier.doIt()
+        if mode != "status":
+            self._modifier = modifier
+        self.setResult(json.dumps({"nodes": result}))
+
+    def redoIt(self):
+        self._modifier.doIt()
+
+    def undoIt(self):
+        self._modifier.undoIt()
+
+
+# Scene message callback ids, removed on unload
+_callback_ids = []
+
+
+def _on_scene_change(*args):
+    """Drop loaded files and baked frames of the previous scene."""
+    SubtitleManager.instance().clear()
+    SubtitleLocatorDrawOverride._baked.clear()
+    SubtitleLocatorDrawOverride._prefetch_requests.clear()
+
+
+def _on_before_save(*args):
+    """Re-embed the cue tables of locators whose subtitle file changed."""
+    modifier = OpenMaya.MDGModifier()
+    iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kPluginLocatorNode)
+    while not iterator.isDone():
+        node = iterator.thisNode()
+        node_fn = OpenMaya.MFnDependencyNode(node)
+        if (
+            node_fn.typeName == K_PLUGIN_NODE_NAME
+            and OpenMaya.MPlug(node, SubtitleLocator.embedded_checksum).asString()
+        ):
+            try:
+                status = _embed_node(node, modifier, "sync")
+            except (OSError, ValueError, RuntimeError) as e:
+                OpenMaya.MGlobal.displayWarning(
+                    f"{node_fn.name()}: failed to re-embed subtitles: {e}"
+                )
+            else:
+                if status["action"] == "embedded":
+                    OpenMaya.MGlobal.displayInfo(
+                        f"{node_fn.name()}: re-embedded changed subtitles"
+                    )
+        iterator.next()
+    modifier.doIt()
+
+
+def _on_prefetch_timer(elapsed_time, last_time, client_data):
+    """Prepare upcoming cues between draws."""
+    SubtitleLocatorDrawOverride.prefetch_cues()
 
 
 def initializePlugin(plugin):
@@ -541,10 +3014,76 @@ def initializePlugin(plugin):
         sys.stderr.write(f"Failed to register draw override: {e}\n")
         raise
 
+    try:
+        plugin_fn.registerCommand(
+            K_STATS_CMD_NAME,
+            SubtitleLocatorStatsCmd.creator,
+            SubtitleLocatorStatsCmd.createSyntax,
+        )
+    except Exception as e:
+        sys.stderr.write(f"Failed to register command: {e}\n")
+        raise
+
+    try:
+        plugin_fn.registerCommand(
+            K_BAKE_CMD_NAME,
+            SubtitleLocatorBakeCmd.creator,
+            SubtitleLocatorBakeCmd.createSyntax,
+        )
+        plugin_fn.registerCommand(
+            K_SOURCES_CMD_NAME,
+            ListSubtitleSourcesCmd.creator,
+            ListSubtitleSourcesCmd.createSyntax,
+        )
+        plugin_fn.registerCommand(
+            K_CUE_CMD_NAME,
+            SubtitleCueCmd.creator,
+            SubtitleCueCmd.createSyntax,
+        )
+        plugin_fn.registerCommand(
+            K_EMBED_CMD_NAME,
+            SubtitleEmbedCmd.creator,
+            SubtitleEmbedCmd.createSyntax,
+        )
+    except Exception as e:
+        sys.stderr.write(f"Failed to register command: {e}\n")
+        raise
+
+    for message in (
+        OpenMaya.MSceneMessage.kBeforeNew,
+        OpenMaya.MSceneMessage.kBeforeOpen,
+    ):
+        _callback_ids.append(
+            OpenMaya.MSceneMessage.addCallback(message, _on_scene_change)
+        )
+    _callback_ids.append(
+        OpenMaya.MSceneMessage.addCallback(
+            OpenMaya.MSceneMessage.kBeforeSave, _on_before_save
+        )
+    )
+    _callback_ids.append(
+        OpenMaya.MTimerMessage.addTimerCallback(
+            CUE_PREFETCH_INTERVAL, _on_prefetch_timer
+        )
+    )
+
 
 def uninitializePlugin(plugin):
     """Uninitialize the plugin."""
     plugin_fn = OpenMaya.MFnPlugin(plugin)
+    SubtitleManager.instance().romaji.stop()
+    OpenMaya.MMessage.removeCallbacks(_callback_ids)
+    del _callback_ids[:]
+
+    try:
+        plugin_fn.deregisterCommand(K_EMBED_CMD_NAME)
+        plugin_fn.deregisterCommand(K_CUE_CMD_NAME)
+        plugin_fn.deregisterCommand(K_SOURCES_CMD_NAME)
+        plugin_fn.deregisterCommand(K_BAKE_CMD_NAME)
+        plugin_fn.deregisterCommand(K_STATS_CMD_NAME)
+    except Exception as e:
+        sys.stderr.write(f"Failed to deregister command: {e}\n")
+        raise
 
     try:
         OpenMayaRender.MDrawRegistry.deregisterDrawOverrideCreator(
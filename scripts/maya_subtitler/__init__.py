@@ -1,32 +1,70 @@
-"""Maya Subtitler - Subtitle display tools for Maya."""
+"""Maya Subtitler - Subtitle display tools for Maya.
+
+Importing the package is cheap: submodules (the UI included) are imported
+when first used, and the plug-ins are loaded once per session. Set
+``MAYA_SUBTITLER_DEV=1`` while working on the package to reload its
+submodules whenever the package is reloaded and to check the plug-ins on
+every ``load_plugins`` call.
+"""
 
 import importlib
 import os
+import sys
 
 import maya.cmds as cmds
+from maya.api import OpenMaya
 
-from . import command
-from . import ui
+__version__ = "1.0.0"
 
-importlib.reload(command)
-importlib.reload(ui)
+DEV_ENV = "MAYA_SUBTITLER_DEV"
+DEV = os.environ.get(DEV_ENV, "") not in ("", "0")
+
+# Plug-in name (its file name, as listed by pluginInfo) -> path for loadPlugin
+PLUGINS = {
+    "subtitleLocator": "subtitleLocator",
+    "command": os.path.join(os.path.dirname(__file__), "command.py"),
+}
+
+# Set once every plug-in is loaded; cleared when one of them is unloaded
+_plugins_loaded = False
+_unload_callback = None
 
-__version__ = "1.0.0"
+
+def _on_plugin_unload(names, client_data=None):
+    global _plugins_loaded
+    if names and names[0] in PLUGINS:
+        _plugins_loaded = False
 
 
 def load_plugins():
     """Load all required plugins for maya_subtitler."""
-    # Load the locator node plugin
-    if not cmds.pluginInfo("subtitleLocator", query=True, loaded=True):
-        cmds.loadPlugin("subtitleLocator")
+    global _plugins_loaded, _unload_callback
+    if _plugins_loaded and not DEV:
+        return
+
+    loaded = set(cmds.pluginInfo(query=True, listPlugins=True) or ())
+    for name, path in PLUGINS.items():
+        if name not in loaded:
+            cmds.loadPlugin(path)
+    _plugins_loaded = True
 
-    # Load the command plugin from this package
-    if not cmds.pluginInfo("createSubtitleLocator", query=True, loaded=True):
-        command_path = os.path.join(os.path.dirname(__file__), "command.py")
-        cmds.loadPlugin(command_path)
+    if _unload_callback is None and not DEV:
+        _unload_callback = OpenMaya.MSceneMessage.addStringArrayCallback(
+            OpenMaya.MSceneMessage.kAfterPluginUnload, _on_plugin_unload
+        )
 
 
 def show_ui():
     """Show the subtitle locator UI."""
     load_plugins()
+    from . import ui
+
     ui.show()
+
+
+if DEV:
+    # Hot-reload: importlib.reload(maya_subtitler) picks up edited submodules.
+    # Done last so they import the functions defined above.
+    for _name, _module in list(sys.modules.items()):
+        if _name.startswith(__name__ + ".") and _module is not None:
+            importlib.reload(_module)
@@ -0,0 +1,269 @@
+"""
+Subtitle burn-in for playblasts and encodes.
+
+Usage:
+    from maya_subtitler import burnin
+
+    # Playblast with baked subtitles (no per-frame Python draw work)
+    burnin.playblast(filename="movies/shot010", format="qt", percent=100)
+
+    # Or burn in outside Maya at encode speed
+    burnin.export_ass("shot010.ass", width=1920, height=1080)
+    # ffmpeg -i shot010.mov -vf ass=shot010.ass shot010_subs.mp4
+    burnin.export_drawtext("shot010.txt", width=1920, height=1080)
+    # ffmpeg -i shot010.mov -filter_script:v shot010.txt shot010_subs.mp4
+"""
+
+import json
+
+import maya.cmds as cmds
+
+from . import load_plugins
+
+# Viewport height the locator's fontSize is tuned for; exported font sizes
+# are scaled from it to the output height
+REFERENCE_HEIGHT = 1080
+
+# Line spacing used by the locator (fontSize * 1.4)
+LINE_SPACING = 1.4
+
+
+def _run(*args, **kwargs):
+    """Run subtitleLocatorBake and decode its JSON result."""
+    load_plugins()
+    return json.loads(cmds.subtitleLocatorBake(*args, **kwargs))["nodes"]
+
+
+def _locators(nodes):
+    """Get locator shapes (all in the scene by default)."""
+    if nodes is None:
+        return cmds.ls(type="subtitleLocator", long=True) or []
+    if isinstance(nodes, str):
+        nodes = [nodes]
+    return nodes
+
+
+def _frame_range(start, end):
+    if start is None:
+        start = cmds.playbackOptions(query=True, minTime=True)
+    if end is None:
+        end = cmds.playbackOptions(query=True, maxTime=True)
+    return start, end
+
+
+def bake(nodes=None, start=None, end=None, events=False):
+    """Precompute every frame of a range for subtitle locators.
+
+    Args:
+        nodes: Locator names (default: all subtitle locators)
+        start: First frame (default: playback range start)
+        end: Last frame (default: playback range end)
+        events: Include the merged subtitle events in the result
+
+    Returns:
+        Dict of node path -> bake summary
+    """
+    nodes = _locators(nodes)
+    if not nodes:
+        return {}
+    start, end = _frame_range(start, end)
+    return _run(*nodes, startFrame=start, endFrame=end, events=events)
+
+
+def clear(nodes=None):
+    """Drop baked frames so locators are evaluated live again.
+
+    Args:
+        nodes: Locator names (default: every baked locator)
+    """
+    args = _locators(nodes) if nodes is not None else []
+    _run(*args, clear=True)
+
+
+def playblast(nodes=None, **kwargs):
+    """Playblast with subtitle locators baked for the playblast range.
+
+    Args:
+        nodes: Locator names (default: all subtitle locators)
+        **kwargs: Arguments for ``cmds.playblast``
+
+    Returns:
+        Result of ``cmds.playblast``
+    """
+    start, end = _frame_range(kwargs.get("startTime"), kwargs.get("endTime"))
+    baked = list(bake(nodes, start, end))
+    try:
+        return cmds.playblast(**kwargs)
+    finally:
+        if baked:
+            clear(baked)
+
+
+def _events(node, start, end):
+    """Get the subtitle events of one locator with times in seconds."""
+    nodes = _locators(node)
+    if len(nodes) != 1:
+        raise ValueError(f"Expected one subtitle locator, found {len(nodes)}")
+    start, end = _frame_range(start, end)
+    # Baked only to read the events; the viewport shows the node live again
+    try:
+        summary = next(iter(bake(nodes, start, end, events=True).values()))
+    finally:
+        clear(nodes)
+    fps = summary["fps"]
+    events = []
+    for event in summary["events"]:
+        event = dict(event)
+        event["startTime"] = (event["start"] - start) / fps
+        event["endTime"] = (event["end"] - start) / fps
+        events.append(event)
+    return events
+
+
+def _screen_position(event, width, height):
+    """Convert a locator position (-1 to 1, y up) to pixels (y down)."""
+    x, y = event["position"]
+    return round(width * (0.5 + x * 0.5)), round(height * (0.5 - y * 0.5))
+
+
+def _font_size(event, height):
+    return max(1, round(event["fontSize"] * height / REFERENCE_HEIGHT))
+
+
+def _ass_timestamp(seconds):
+    """Format seconds as an ASS timestamp (H:MM:SS.cc)."""
+    centis = max(0, round(seconds * 100))
+    secs, centis = divmod(centis, 100)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def _ass_color(rgb):
+    """Convert an RGB float color to an ASS &HBBGGRR& override."""
+    r, g, b = (max(0, min(255, round(value * 255))) for value in rgb)
+    return f"&H{b:02X}{g:02X}{r:02X}&"
+
+
+def export_ass(path, node=None, start=None, end=None, width=1920, height=1080):
+    """Write a locator's subtitles as an ASS script for burning in.
+
+    Each event keeps the locator's position, font size and color. Times
+    are relative to ``start``, the first frame of the playblast.
+
+    Args:
+        path: Output .ass path
+        node: Locator name (default: the only subtitle locator)
+        start: First frame (default: playback range start)
+        end: Last frame (default: playback range end)
+        width: Video width in pixels
+        height: Video height in pixels
+
+    Returns:
+        Number of events written
+    """
+    events = _events(node, start, end)
+    lines = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "WrapStyle: 2",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        (
+            "Format: Name, Fontname, Fontsize, PrimaryColour, OutlineColour, "
+            "BackColour, Bold, Italic, BorderStyle, Outline, Shadow, Alignment, "
+            "MarginL, MarginR, MarginV, Encoding"
+        ),
+        (
+            "Style: Default,Arial,48,&H00FFFFFF,&H00000000,&H00000000,"
+            "0,0,1,2,0,5,0,0,0,1"
+        ),
+        "",
+        "[Events]",
+        (
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, "
+            "Effect, Text"
+        ),
+    ]
+    for event in events:
+        x, y = _screen_position(event, width, height)
+        text = event["text"].replace("{", "(").replace("}", ")")
+        text = text.replace("\n", "\\N")
+        overrides = (
+            f"{{\\an5\\pos({x},{y})\\fs{_font_size(event, height)}"
+            f"\\c{_ass_color(event['color'])}}}"
+        )
+        lines.append(
+            f"Dialogue: 0,{_ass_timestamp(event['startTime'])},"
+            f"{_ass_timestamp(event['endTime'])},Default,,0,0,0,,{overrides}{text}"
+        )
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return len(events)
+
+
+def _escape(text, special):
+    return "".join("\\" + char if char in special else char for char in text)
+
+
+def _drawtext_escape(text):
+    """Escape a drawtext option value inside a filtergraph.
+
+    Values are escaped once for the option parser and once more for the
+    filtergraph parser (see "Quoting and escaping" in the ffmpeg docs).
+    """
+    return _escape(_escape(text, "\\':"), "\\',;[]")
+
+
+def export_drawtext(
+    path, node=None, start=None, end=None, width=1920, height=1080, font_file=None
+):
+    """Write a locator's subtitles as an ffmpeg drawtext filter script.
+
+    Use with ``ffmpeg -filter_script:v``. Each line of an event is a
+    separate drawtext filter so lines are centered like in the viewport.
+
+    Args:
+        path: Output filter script path
+        node: Locator name (default: the only subtitle locator)
+        start: First frame (default: playback range start)
+        end: Last frame (default: playback range end)
+        width: Video width in pixels
+        height: Video height in pixels
+        font_file: Font file for drawtext (needed for Japanese text)
+
+    Returns:
+        Number of events written
+    """
+    events = _events(node, start, end)
+    filters = []
+    for event in events:
+        x, y = _screen_position(event, width, height)
+        font_size = _font_size(event, height)
+        line_height = round(font_size * LINE_SPACING)
+        lines = event["text"].split("\n")
+        top = y - line_height * len(lines) // 2
+        r, g, b = (max(0, min(255, round(value * 255))) for value in event["color"])
+        enable = f"between(t,{event['startTime']:.3f},{event['endTime']:.3f})"
+        for i, line in enumerate(lines):
+            options = [
+                f"text={_drawtext_escape(line)}",
+                "expansion=none",
+                f"fontsize={font_size}",
+                f"fontcolor=0x{r:02X}{g:02X}{b:02X}",
+                "borderw=2",
+                f"x={x}-text_w/2",
+                f"y={top + i * line_height}",
+                f"enable='{enable}'",
+            ]
+            if font_file:
+                options.insert(0, f"fontfile={_drawtext_escape(str(font_file))}")
+            filters.append("drawtext=" + ":".join(options))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",\n".join(filters or ["null"]) + "\n")
+    return len(events)
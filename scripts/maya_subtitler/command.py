@@ -14,6 +14,9 @@ Usage:
         fontSize=24,
         startFrame=101
     )
+
+    # Outline and background box for bright plates
+    cmds.createSubtitleLocator(textEffect=2, backgroundBox=True)
 """
 
 from maya.api import OpenMaya
@@ -50,6 +53,14 @@ class CreateSubtitleLocatorCmd(OpenMaya.MPxCommand):
     kMaxCharsFlagLong = "-maxCharsPerLine"
     kMaxLinesFlag = "-ml"
     kMaxLinesFlagLong = "-maxLines"
+    kHighlightWordsFlag = "-hw"
+    kHighlightWordsFlagLong = "-highlightWords"
+    kDisplayModeFlag = "-dm"
+    kDisplayModeFlagLong = "-displayMode"
+    kTextEffectFlag = "-tfx"
+    kTextEffectFlagLong = "-textEffect"
+    kBackgroundBoxFlag = "-bgb"
+    kBackgroundBoxFlagLong = "-backgroundBox"
 
     def __init__(self):
         OpenMaya.MPxCommand.__init__(self)
@@ -112,6 +123,26 @@ class CreateSubtitleLocatorCmd(OpenMaya.MPxCommand):
             CreateSubtitleLocatorCmd.kMaxLinesFlagLong,
             OpenMaya.MSyntax.kLong,
         )
+        syntax.addFlag(
+            CreateSubtitleLocatorCmd.kHighlightWordsFlag,
+            CreateSubtitleLocatorCmd.kHighlightWordsFlagLong,
+            OpenMaya.MSyntax.kBoolean,
+        )
+        syntax.addFlag(
+            CreateSubtitleLocatorCmd.kDisplayModeFlag,
+            CreateSubtitleLocatorCmd.kDisplayModeFlagLong,
+            OpenMaya.MSyntax.kLong,
+        )
+        syntax.addFlag(
+            CreateSubtitleLocatorCmd.kTextEffectFlag,
+            CreateSubtitleLocatorCmd.kTextEffectFlagLong,
+            OpenMaya.MSyntax.kLong,
+        )
+        syntax.addFlag(
+            CreateSubtitleLocatorCmd.kBackgroundBoxFlag,
+            CreateSubtitleLocatorCmd.kBackgroundBoxFlagLong,
+            OpenMaya.MSyntax.kBoolean,
+        )
         return syntax
 
     def isUndoable(self):
@@ -161,6 +192,24 @@ class CreateSubtitleLocatorCmd(OpenMaya.MPxCommand):
         if arg_parser.isFlagSet(self.kMaxLinesFlag):
             max_lines = arg_parser.flagArgumentInt(self.kMaxLinesFlag, 0)
 
+        highlight_words = False
+        if arg_parser.isFlagSet(self.kHighlightWordsFlag):
+            highlight_words = arg_parser.flagArgumentBool(self.kHighlightWordsFlag, 0)
+
+        # 0: original, 1: romaji, 2: both
+        display_mode = 0
+        if arg_parser.isFlagSet(self.kDisplayModeFlag):
+            display_mode = arg_parser.flagArgumentInt(self.kDisplayModeFlag, 0)
+
+        # 0: none, 1: shadow, 2: outline
+        text_effect = 0
+        if arg_parser.isFlagSet(self.kTextEffectFlag):
+            text_effect = arg_parser.flagArgumentInt(self.kTextEffectFlag, 0)
+
+        background_box = False
+        if arg_parser.isFlagSet(self.kBackgroundBoxFlag):
+            background_box = arg_parser.flagArgumentBool(self.kBackgroundBoxFlag, 0)
+
         # Create nodes using MDagModifier for undo support
         self._dag_modifier = OpenMaya.MDagModifier()
 
@@ -206,6 +255,18 @@ class CreateSubtitleLocatorCmd(OpenMaya.MPxCommand):
         plug = shape_fn.findPlug("maxLines", False)
         plug.setInt(max_lines)
 
+        plug = shape_fn.findPlug("highlightWords", False)
+        plug.setBool(highlight_words)
+
+        plug = shape_fn.findPlug("displayMode", False)
+        plug.setShort(display_mode)
+
+        plug = shape_fn.findPlug("textEffect", False)
+        plug.setShort(text_effect)
+
+        plug = shape_fn.findPlug("backgroundBox", False)
+        plug.setBool(background_box)
+
         # Store for undo
         self._created_nodes = [transform_obj, shape_obj]
 
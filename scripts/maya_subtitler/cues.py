@@ -0,0 +1,105 @@
+"""
+Cue navigation and timeline bookmarks for subtitle locators.
+
+Usage:
+    from maya_subtitler import cues
+
+    cues.next_cue()  # jump to the next line of the selected locator
+    cues.prev_cue("subtitleLocator1")
+    cues.cue_at_frame("subtitleLocator1", 120)
+
+    # One time slider bookmark per cue, created in one undoable step
+    cues.add_bookmarks("subtitleLocator1")
+"""
+
+import json
+
+import maya.cmds as cmds
+
+from . import load_plugins
+
+
+def _locator(node):
+    """Get a locator name (default: the selected or the only locator)."""
+    if node is not None:
+        return node
+    nodes = cmds.ls(selection=True, dag=True, type="subtitleLocator", long=True)
+    if not nodes:
+        nodes = cmds.ls(type="subtitleLocator", long=True) or []
+    if len(nodes) != 1:
+        raise ValueError(
+            f"Select one subtitle locator or pass its name ({len(nodes)} found)"
+        )
+    return nodes[0]
+
+
+def _run(node, **kwargs):
+    """Run subtitleCue and decode its JSON result."""
+    load_plugins()
+    kwargs = {flag: value for flag, value in kwargs.items() if value is not None}
+    return json.loads(cmds.subtitleCue(_locator(node), **kwargs))
+
+
+def cue_at_frame(node=None, frame=None):
+    """Get the cue a locator shows at a frame.
+
+    Args:
+        node: Locator name (default: the selected or the only locator)
+        frame: Timeline frame (default: current frame)
+
+    Returns:
+        Dict with 'index', 'startFrame', 'endFrame' (first frame after the
+        cue) and 'text', or None between cues
+    """
+    return _run(node, frame=frame)
+
+
+def next_cue(node=None, frame=None, go=True):
+    """Get the first cue starting after a frame and jump to it.
+
+    Args:
+        node: Locator name (default: the selected or the only locator)
+        frame: Timeline frame (default: current frame)
+        go: Set the current frame to the start of the cue
+
+    Returns:
+        Cue dict as in ``cue_at_frame``, or None after the last cue
+    """
+    return _run(node, frame=frame, next=True, go=go)
+
+
+def prev_cue(node=None, frame=None, go=True):
+    """Get the last cue starting before a frame and jump to it.
+
+    Args:
+        node: Locator name (default: the selected or the only locator)
+        frame: Timeline frame (default: current frame)
+        go: Set the current frame to the start of the cue
+
+    Returns:
+        Cue dict as in ``cue_at_frame``, or None before the first cue
+    """
+    return _run(node, frame=frame, previous=True, go=go)
+
+
+def add_bookmarks(node=None):
+    """Mark every cue of a locator with a time slider bookmark.
+
+    Bookmarks made earlier for the locator are replaced. Needs Maya 2020
+    or later (timeSliderBookmark plug-in).
+
+    Returns:
+        Number of bookmarks created
+    """
+    if not cmds.pluginInfo("timeSliderBookmark", query=True, loaded=True):
+        cmds.loadPlugin("timeSliderBookmark")
+    return _run(node, bookmarks=True)["created"]
+
+
+def clear_bookmarks(node=None):
+    """Remove the bookmarks made for a locator.
+
+    Returns:
+        Number of bookmarks removed
+    """
+    return _run(node, clearBookmarks=True)["removed"]
@@ -0,0 +1,83 @@
+"""
+Embed parsed subtitles in the scene.
+
+An embedded locator draws from a compressed cue table stored on the node,
+so the scene no longer needs the subtitle file (farm machines, remote
+artists) and nothing is parsed when it opens.
+
+Usage:
+    from maya_subtitler import embed
+
+    embed.embed()  # every subtitle locator in the scene
+    embed.status("subtitleLocator1")
+    embed.sync()  # re-embed locators whose subtitle file changed
+    embed.clear()  # read the subtitle files again
+"""
+
+import json
+
+import maya.cmds as cmds
+
+from . import load_plugins
+
+
+def _run(nodes, **kwargs):
+    """Run subtitleEmbed and decode its JSON result."""
+    load_plugins()
+    if nodes is None:
+        nodes = cmds.ls(type="subtitleLocator", long=True) or []
+    elif isinstance(nodes, str):
+        nodes = [nodes]
+    if not nodes:
+        return {}
+    return json.loads(cmds.subtitleEmbed(*nodes, **kwargs))["nodes"]
+
+
+def embed(nodes=None):
+    """Embed the subtitle files of locators.
+
+    Args:
+        nodes: Locator names (default: all subtitle locators)
+
+    Returns:
+        Dict of node path -> status (see ``status``)
+    """
+    return _run(nodes)
+
+
+def sync(nodes=None):
+    """Re-embed locators whose subtitle file or word timings changed.
+
+    Locators whose file is missing keep their embedded cues. Embedded
+    locators are also synced automatically before the scene is saved.
+
+    Args:
+        nodes: Locator names (default: all subtitle locators)
+
+    Returns:
+        Dict of node path -> status; 'action' is "embedded", "unchanged"
+        or "missing"
+    """
+    return _run(nodes, sync=True)
+
+
+def status(nodes=None):
+    """Compare embedded cue tables with the subtitle files on disk.
+
+    Args:
+        nodes: Locator names (default: all subtitle locators)
+
+    Returns:
+        Dict of node path -> dict with 'checksum' (embedded, or None),
+        'sourceChecksum' (None if the file is missing) and 'upToDate'
+    """
+    return _run(nodes, status=True)
+
+
+def clear(nodes=None):
+    """Remove embedded cue tables so locators read their files again.
+
+    Args:
+        nodes: Locator names (default: all subtitle locators)
+    """
+    return _run(nodes, clear=True)
@@ -0,0 +1,73 @@
+"""
+Draw instrumentation for subtitle locators.
+
+Usage:
+    from maya_subtitler import stats
+
+    stats.enable()
+    # ... play back or scrub the timeline ...
+    print(stats.query("subtitleLocator1"))
+    stats.disable()
+
+    # Subtitle files loaded by the scene's locators and their memory use
+    print(stats.sources())
+"""
+
+import json
+
+import maya.cmds as cmds
+
+from . import load_plugins
+
+
+def _run(*args, **kwargs):
+    """Run subtitleLocatorStats and decode its JSON result."""
+    load_plugins()
+    return json.loads(cmds.subtitleLocatorStats(*args, **kwargs))
+
+
+def enable(reset=True):
+    """Start recording draw timings for all subtitle locators."""
+    return _run(enable=True, reset=reset)
+
+
+def disable():
+    """Stop recording draw timings (recorded frames are kept)."""
+    return _run(enable=False)
+
+
+def reset():
+    """Discard all recorded frames and counters."""
+    return _run(reset=True)
+
+
+def query(node=None, samples=False):
+    """Get recorded draw timings.
+
+    Args:
+        node: Locator transform or shape name (default: all locators)
+        samples: Include raw per-frame samples
+            ([frame, camera, plugs, lookup, wrap, draw] in seconds)
+
+    Returns:
+        Dict with 'enabled' and per-node summaries under 'nodes'. Each
+        summary has frame and cache hit/miss counters plus mean/max/last
+        milliseconds per phase in 'phases_ms'.
+    """
+    args = [node] if node else []
+    return _run(*args, samples=samples)
+
+
+def sources(reload=False):
+    """Get the subtitle files shared by the scene's locators.
+
+    Args:
+        reload: Check the files on disk and reload changed ones first
+
+    Returns:
+        List of dicts with 'path', 'aliases' (subtitleFile values), 'nodes',
+        'cues', 'loadMs' and memory use in bytes ('memory' per cache and
+        'memoryTotal')
+    """
+    load_plugins()
+    return json.loads(cmds.listSubtitleSources(reload=reload))
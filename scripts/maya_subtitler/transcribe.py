@@ -0,0 +1,277 @@
+"""
+Transcribe scene audio with subtitler without blocking Maya.
+
+``subtitler transcribe`` runs in a separate Python process, so Whisper and
+torch never load into Maya. Its output is read from a pipe on a background
+thread and handed to Maya's main thread with ``executeDeferred``; when the
+process finishes, the subtitle file is loaded into a subtitle locator.
+
+The interpreter is, in order: the ``python`` argument, the
+``SUBTITLER_PYTHON`` environment variable, the repository's ``.venv``
+(created by ``uv sync``), then ``python3``/``python`` on PATH.
+
+Usage:
+    from maya_subtitler import transcribe
+
+    # Audio shown in the time slider (or the only audio node)
+    job = transcribe.transcribe_audio()
+
+    job = transcribe.transcribe_audio(
+        "audio1", locator="subtitleLocator1", model="small", language="ja"
+    )
+    job.running  # False once the locator has been updated
+    job.cancel()
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+from functools import partial
+from pathlib import Path
+
+import maya.cmds as cmds
+import maya.mel as mel
+import maya.utils
+
+from . import load_plugins
+
+# Repository root (subtitler package, .venv)
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+PYTHON_ENV = "SUBTITLER_PYTHON"
+
+# Running jobs, kept referenced until their process exits
+_jobs = set()
+
+
+def _python(python=None):
+    """Find the interpreter that has subtitler's dependencies installed."""
+    python = python or os.environ.get(PYTHON_ENV)
+    if python:
+        return str(python)
+    if os.name == "nt":
+        venv = ROOT / ".venv" / "Scripts" / "python.exe"
+    else:
+        venv = ROOT / ".venv" / "bin" / "python"
+    if venv.exists():
+        return str(venv)
+    found = shutil.which("python3") or shutil.which("python")
+    if found is None:
+        raise RuntimeError(
+            f"No Python found for subtitler; set {PYTHON_ENV} to an interpreter "
+            "with subtitler's dependencies installed"
+        )
+    return found
+
+
+def _environment():
+    """Environment for the subtitler process.
+
+    Maya's PYTHONHOME and PYTHONPATH point at its own interpreter and must
+    not leak into a different one.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONHOME", None)
+    env["PYTHONPATH"] = str(ROOT)
+    env["PYTHONUNBUFFERED"] = "1"
+    env["PYTHONIOENCODING"] = "utf-8"
+    return env
+
+
+def audio_nodes():
+    """Get the audio nodes in the scene."""
+    return cmds.ls(type="audio") or []
+
+
+def _audio_node(node):
+    """Resolve the audio node (default: time slider sound, or the only one)."""
+    if node:
+        return node
+    slider = mel.eval("$subtitlerSlider = $gPlayBackSlider")
+    node = cmds.timeControl(slider, query=True, sound=True)
+    if node:
+        return node
+    nodes = audio_nodes()
+    if len(nodes) != 1:
+        raise ValueError(f"Expected one audio node, found {len(nodes)}")
+    return nodes[0]
+
+
+class TranscribeJob:
+    """A subtitler process transcribing one audio file.
+
+    ``on_progress(line)`` receives each output line and ``on_done(job)``
+    is called once the process exits. Both run on Maya's main thread.
+
+    Args:
+        command: Command line of the subtitler process
+        on_progress: Called with each output line
+        on_done: Called with the job when the process exits
+    """
+
+    def __init__(self, command, on_progress=None, on_done=None):
+        self.command = command
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.lines = []
+        self.outputs = []
+        self.returncode = None
+
+        flags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+        self._process = subprocess.Popen(
+            command,
+            cwd=ROOT,
+            env=_environment(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="replace",
+            creationflags=flags,
+        )
+        _jobs.add(self)
+        threading.Thread(target=self._read, daemon=True).start()
+
+    @property
+    def running(self):
+        return self.returncode is None
+
+    @property
+    def subtitle_path(self):
+        """Path of the transcript (the first subtitle file written), or None."""
+        for path in self.outputs:
+            if path.suffix.lower() in (".srt", ".vtt", ".ass", ".jsonl"):
+                return path
+        return None
+
+    def cancel(self):
+        """Stop the subtitler process."""
+        if self.running:
+            self._process.terminate()
+
+    def _read(self):
+        # Background thread: never touch Maya here
+        for line in self._process.stdout:
+            maya.utils.executeDeferred(self._on_line, line.rstrip())
+        returncode = self._process.wait()
+        maya.utils.executeDeferred(self._on_exit, returncode)
+
+    def _on_line(self, line):
+        self.lines.append(line)
+        prefix, arrow, path = line.partition("-> ")
+        if arrow and not prefix.strip():
+            self.outputs.append(Path(path.strip()))
+        if self.on_progress is not None:
+            self.on_progress(line)
+
+    def _on_exit(self, returncode):
+        self.returncode = returncode
+        _jobs.discard(self)
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+def jobs():
+    """Get the running transcription jobs."""
+    return list(_jobs)
+
+
+def load_subtitles(subtitle_file, locator=None, start_frame=0):
+    """Load a subtitle file into a locator, creating one if needed.
+
+    Args:
+        subtitle_file: Subtitle file path
+        locator: Locator name (default: create a new locator)
+        start_frame: Start frame of a new locator
+
+    Returns:
+        Locator name
+    """
+    load_plugins()
+    subtitle_file = Path(subtitle_file).as_posix()
+    if locator is None:
+        return cmds.createSubtitleLocator(
+            subtitleFile=subtitle_file, startFrame=start_frame
+        )
+    cmds.setAttr(f"{locator}.subtitleFile", subtitle_file, type="string")
+    # Pick up a file rewritten in place without waiting for the next check
+    cmds.listSubtitleSources(reload=True)
+    return locator
+
+
+def _print_progress(line):
+    print(f"subtitler: {line}")
+
+
+def _load_result(locator, start_frame, job):
+    """Default ``on_done``: load the transcript or report the failure."""
+    if job.returncode != 0:
+        message = job.lines[-1] if job.lines else ""
+        cmds.warning(f"Transcription failed ({job.returncode}): {message}")
+        return
+    if job.subtitle_path is None:
+        cmds.warning("Transcription wrote no subtitle file")
+        return
+    result = load_subtitles(job.subtitle_path, locator, start_frame)
+    print(f"Loaded {job.subtitle_path} into {result}")
+
+
+def transcribe_audio(
+    audio_node=None,
+    locator=None,
+    model="base",
+    language=None,
+    output_dir=None,
+    word_timestamps=True,
+    engine=None,
+    python=None,
+    on_progress=_print_progress,
+    on_done=None,
+):
+    """Transcribe an audio node in a subtitler process.
+
+    Returns immediately; Maya stays interactive while the process runs.
+
+    Args:
+        audio_node: Audio node (default: time slider sound, or the only one)
+        locator: Locator to load the result into (default: create one,
+            starting at the audio node's offset)
+        model: Whisper model size
+        language: Source language code (default: detected)
+        output_dir: Directory for the subtitle files (default: next to the
+            audio file)
+        word_timestamps: Also write word timings for highlighting
+        engine: Transcription engine (default: subtitler's default)
+        python: Interpreter with subtitler's dependencies (see module doc)
+        on_progress: Called with each output line (default: print)
+        on_done: Called with the job when it ends (default: load the
+            transcript into the locator)
+
+    Returns:
+        TranscribeJob
+    """
+    audio_node = _audio_node(audio_node)
+    # Relative paths are relative to the project
+    filename = cmds.getAttr(f"{audio_node}.filename")
+    audio_path = Path(cmds.workspace(expandName=filename))
+    if not audio_path.is_file():
+        raise ValueError(f"Audio file not found: {audio_path}")
+    if output_dir:
+        output_dir = Path(cmds.workspace(expandName=str(output_dir)))
+    else:
+        output_dir = audio_path.parent
+
+    command = [_python(python), "-u", "-m", "subtitler.cli", "transcribe"]
+    command += [str(audio_path), "-o", str(output_dir), "-m", model]
+    if language:
+        command += ["-l", language]
+    if word_timestamps:
+        command.append("--word-timestamps")
+    if engine:
+        command += ["--engine", engine]
+
+    if on_done is None:
+        start_frame = round(cmds.getAttr(f"{audio_node}.offset"))
+        on_done = partial(_load_result, locator, start_frame)
+    return TranscribeJob(command, on_progress, on_done)
@@ -8,10 +8,14 @@ Usage:
 
 import maya.cmds as cmds
 
+from . import load_plugins, transcribe
 
 WINDOW_NAME = "subtitleLocatorWindow"
 WINDOW_TITLE = "Subtitle Locator"
 
+# Whisper model sizes offered for transcription
+MODELS = ("tiny", "base", "small", "medium", "large")
+
 
 def show():
     """Show the subtitle locator UI window."""
@@ -21,7 +25,7 @@ def show():
     window = cmds.window(
         WINDOW_NAME,
         title=WINDOW_TITLE,
-        widthHeight=(400, 300),
+        widthHeight=(400, 480),
         sizeable=True,
     )
 
@@ -121,6 +125,45 @@ def show():
     # Create Button
     cmds.button(label="Create", command=lambda x: _create_locator(), height=30)
 
+    cmds.separator(height=10, style="in")
+
+    # Transcription (runs subtitler in a separate process)
+    cmds.rowLayout(
+        numberOfColumns=2,
+        columnWidth2=(100, 280),
+        columnAlign1="right",
+        adjustableColumn=2,
+    )
+    cmds.text(label="Audio:", width=100, align="right")
+    cmds.optionMenu("transcribeAudioMenu")
+    for node in transcribe.audio_nodes():
+        cmds.menuItem(label=node)
+    cmds.setParent("..")
+
+    cmds.rowLayout(
+        numberOfColumns=3,
+        columnWidth3=(100, 140, 140),
+        columnAlign1="right",
+        adjustableColumn=2,
+    )
+    cmds.text(label="Model:", width=100, align="right")
+    cmds.optionMenu("transcribeModelMenu")
+    for model in MODELS:
+        cmds.menuItem(label=model)
+    cmds.optionMenu("transcribeModelMenu", edit=True, value="base")
+    cmds.textField(
+        "transcribeLanguageField", placeholderText="Language (auto)", text=""
+    )
+    cmds.setParent("..")
+
+    cmds.button(
+        "transcribeButton",
+        label="Transcribe Audio",
+        command=lambda x: _transcribe(),
+        height=30,
+    )
+    cmds.scrollField("transcribeLog", editable=False, wordWrap=True, height=80)
+
     cmds.separator(height=10, style="none")
 
     cmds.showWindow(window)
@@ -130,13 +173,63 @@ def _browse_file():
     """Open file browser for SRT file selection."""
     result = cmds.fileDialog2(
         fileMode=1,
-        caption="Select SRT File",
-        fileFilter="SRT Files (*.srt);;All Files (*.*)",
+        caption="Select Subtitle File",
+        fileFilter="Subtitle Files (*.srt *.vtt *.ass *.jsonl);;All Files (*.*)",
     )
     if result:
         cmds.textField("subtitleFileField", edit=True, text=result[0])
 
 
+def _log(line):
+    """Append a line to the transcription log if the window is open."""
+    if cmds.scrollField("transcribeLog", exists=True):
+        cmds.scrollField("transcribeLog", edit=True, insertText=line + "\n")
+    else:
+        print(f"subtitler: {line}")
+
+
+def _transcribe():
+    """Transcribe the selected audio node, then create a locator from it."""
+    audio_node = cmds.optionMenu("transcribeAudioMenu", query=True, value=True)
+    if not audio_node:
+        cmds.warning("No audio node in the scene.")
+        return
+    model = cmds.optionMenu("transcribeModelMenu", query=True, value=True)
+    language = cmds.textField("transcribeLanguageField", query=True, text=True)
+    start_frame = round(cmds.getAttr(f"{audio_node}.offset"))
+
+    try:
+        transcribe.transcribe_audio(
+            audio_node,
+            model=model,
+            language=language.strip() or None,
+            on_progress=_log,
+            on_done=lambda job: _transcribed(job, start_frame),
+        )
+    except (ValueError, RuntimeError, OSError) as e:
+        cmds.warning(f"Failed to start transcription: {e}")
+        return
+    cmds.scrollField("transcribeLog", edit=True, clear=True)
+    cmds.button("transcribeButton", edit=True, enable=False)
+
+
+def _transcribed(job, start_frame):
+    """Create a locator from a finished transcription."""
+    if cmds.button("transcribeButton", exists=True):
+        cmds.button("transcribeButton", edit=True, enable=True)
+    if job.returncode != 0 or job.subtitle_path is None:
+        message = job.lines[-1] if job.lines else ""
+        cmds.warning(f"Transcription failed ({job.returncode}): {message}")
+        return
+    if not cmds.window(WINDOW_NAME, exists=True):
+        # Window closed while transcribing: create with the default settings
+        transcribe.load_subtitles(job.subtitle_path, start_frame=start_frame)
+        return
+    cmds.textField("subtitleFileField", edit=True, text=job.subtitle_path.as_posix())
+    cmds.intField("startFrameField", edit=True, value=start_frame)
+    _create_locator()
+
+
 def _create_locator():
     """Create subtitle locator with current UI settings."""
     # Check if SRT file is set
@@ -146,8 +239,6 @@ def _create_locator():
         return
 
     # Ensure plugins are loaded
-    from . import load_plugins
-
     try:
         load_plugins()
     except Exception as e:
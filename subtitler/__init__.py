@@ -1,18 +1,42 @@
-"""Subtitler - Audio transcription and subtitle generation tool."""
+"""Subtitler - Audio transcription and subtitle generation tool.
+
+Names are imported from their submodules on first access, so importing a
+light module such as ``subtitler.romanize`` does not load Whisper.
+"""
+
+import importlib
 
 __version__ = "1.0.0"
 
-from .transcribe import load_model, transcribe_audio, translate_audio
-from .romanize import create_converter, to_romaji, romanize_segments
-from .srt import parse_srt, write_srt
-
-__all__ = [
-    "load_model",
-    "transcribe_audio",
-    "translate_audio",
-    "create_converter",
-    "to_romaji",
-    "romanize_segments",
-    "parse_srt",
-    "write_srt",
-]
+# Public name -> submodule
+_EXPORTS = {
+    "load_model": "transcribe",
+    "transcribe_audio": "transcribe",
+    "translate_audio": "transcribe",
+    "create_converter": "romanize",
+    "to_romaji": "romanize",
+    "romanize_segments": "romanize",
+    "parse_srt": "srt",
+    "write_srt": "srt",
+    "read_subtitles": "formats",
+    "write_subtitles": "formats",
+    "filter_segments": "filters",
+    "available_engines": "engines",
+    "get_engine": "engines",
+    "register_engine": "engines",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,151 @@
+"""Decoded audio cache.
+
+Whisper decodes its input through an ffmpeg subprocess on every call.
+``load_pcm`` decodes a file once to 16 kHz mono float32 PCM, stores it in
+the cache directory under the file's content hash (``<hash>.f32``) and
+memory-maps it on later calls, so repeated runs skip ffmpeg and long files
+are paged in on demand instead of held in memory.
+
+Results derived from the audio alone, such as the detected language
+(``<hash>.lang.json``), are cached under the same hash.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import whisper
+
+# Cache directory (next to PROJECT/models)
+CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
+
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE
+PCM_SUFFIX = ".f32"
+LANGUAGE_SUFFIX = ".lang.json"
+
+# (path, size, mtime_ns) -> content hash, so one run hashes each file once
+_hash_memo = {}
+
+
+def file_hash(audio_path: Path) -> str:
+    """Get the content hash of a file.
+
+    Args:
+        audio_path: Path to file
+
+    Returns:
+        Hex BLAKE2b digest (32 characters)
+    """
+    audio_path = Path(audio_path)
+    stat = audio_path.stat()
+    key = (str(audio_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    if key in _hash_memo:
+        return _hash_memo[key]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(audio_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    _hash_memo[key] = digest.hexdigest()
+    return _hash_memo[key]
+
+
+def cache_path_for(
+    audio_path: Path, cache_dir: Path | None = None, suffix: str = PCM_SUFFIX
+) -> Path:
+    """Get the cache path for an audio file (PCM by default)."""
+    return (cache_dir or CACHE_DIR) / (file_hash(audio_path) + suffix)
+
+
+def load_pcm(audio_path: Path, cache_dir: Path | None = None) -> np.ndarray:
+    """Load audio as 16 kHz mono float32 samples through the cache.
+
+    Args:
+        audio_path: Path to audio file (mp3, wav, ...)
+        cache_dir: Cache directory (default: PROJECT/cache)
+
+    Returns:
+        Copy-on-write memory map of the samples (a plain array if empty)
+    """
+    pcm_path = cache_path_for(audio_path, cache_dir)
+
+    if not pcm_path.exists():
+        samples = whisper.load_audio(str(audio_path))
+        pcm_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = pcm_path.with_name(f"{pcm_path.name}.{os.getpid()}.tmp")
+        samples.astype(np.float32, copy=False).tofile(tmp_path)
+        os.replace(tmp_path, pcm_path)
+
+    if pcm_path.stat().st_size == 0:
+        return np.zeros(0, dtype=np.float32)
+    # Copy-on-write so torch.from_numpy gets a writable array
+    return np.memmap(pcm_path, dtype=np.float32, mode="c")
+
+
+def as_samples(audio: Path | np.ndarray) -> np.ndarray:
+    """Get 16 kHz samples for a path (through the cache) or pass an array on."""
+    if isinstance(audio, np.ndarray):
+        return audio
+    return load_pcm(audio)
+
+
+def read_language(
+    audio_path: Path, cache_dir: Path | None = None
+) -> tuple[str, float] | None:
+    """Get the cached language of an audio file.
+
+    Returns:
+        Language code and probability, or None if not detected yet
+    """
+    path = cache_path_for(audio_path, cache_dir, LANGUAGE_SUFFIX)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["language"], data["probability"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_language(
+    audio_path: Path,
+    language: str,
+    probability: float,
+    cache_dir: Path | None = None,
+) -> Path:
+    """Cache the detected language of an audio file."""
+    path = cache_path_for(audio_path, cache_dir, LANGUAGE_SUFFIX)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"language": language, "probability": probability}, f)
+    return path
+
+
+def _cache_files(cache_dir: Path):
+    if not cache_dir.exists():
+        return []
+    return [path for path in cache_dir.iterdir() if path.is_file()]
+
+
+def cache_usage(cache_dir: Path | None = None) -> tuple[int, int]:
+    """Get the number of cache files and their total size in bytes."""
+    sizes = [path.stat().st_size for path in _cache_files(cache_dir or CACHE_DIR)]
+    return len(sizes), sum(sizes)
+
+
+def clear_cache(cache_dir: Path | None = None) -> int:
+    """Delete every cache file.
+
+    Args:
+        cache_dir: Cache directory (default: PROJECT/cache)
+
+    Returns:
+        Number of bytes freed
+    """
+    freed = 0
+    for path in _cache_files(cache_dir or CACHE_DIR):
+        freed += path.stat().st_size
+        path.unlink()
+    return freed
@@ -0,0 +1,397 @@
+"""End-to-end pipeline benchmark."""
+
+import difflib
+import os
+import platform
+import tempfile
+import time
+import wave
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import torch
+import whisper
+
+from .audio import load_pcm
+from .engines import get_engine
+from .filters import filter_segments
+from .formats import write_subtitles
+from .romanize import create_converter, romanize_segments
+from .transcribe import load_model, transcribe_audio, translate_audio, use_fp16
+
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE
+
+# Text romanized when the synthetic audio yields no Japanese segments
+_ROMANIZE_FALLBACK = "今日はいい天気ですね。カメラを右にパンしてください。"
+
+
+def generate_audio(output_path: Path, duration: float = 30.0, seed: int = 0) -> Path:
+    """Write a synthetic speech-like test signal as 16 kHz mono WAV.
+
+    Alternates harmonic tone bursts (syllable-like, 3-6 per second) with
+    short pauses over a low noise floor.
+
+    Args:
+        output_path: Path to WAV file
+        duration: Length in seconds
+        seed: Random seed
+
+    Returns:
+        Path to the written file
+    """
+    rng = np.random.default_rng(seed)
+    count = int(duration * SAMPLE_RATE)
+    t = np.arange(count, dtype=np.float32) / SAMPLE_RATE
+    signal = rng.normal(0.0, 0.01, count).astype(np.float32)
+
+    pos = 0.0
+    while pos < duration:
+        length = rng.uniform(0.15, 0.35)
+        start = int(pos * SAMPLE_RATE)
+        end = int(min(pos + length, duration) * SAMPLE_RATE)
+        pitch = rng.uniform(110.0, 240.0)
+        burst = sum(
+            np.sin(2 * np.pi * pitch * harmonic * t[start:end]) / harmonic
+            for harmonic in range(1, 5)
+        )
+        signal[start:end] += 0.2 * burst * np.hanning(end - start)
+        pos += length + rng.choice([0.02, 0.05, 0.4], p=[0.6, 0.3, 0.1])
+
+    pcm = (np.clip(signal, -1.0, 1.0) * 32767).astype(np.int16)
+    with wave.open(str(output_path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm.tobytes())
+    return output_path
+
+
+class StageTimer:
+    """Collects wall-clock seconds per named stage."""
+
+    def __init__(self):
+        self.stages = {}
+
+    def time(self, name, func, *args, **kwargs):
+        """Call ``func`` and record its duration under ``name``."""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.stages[name] = time.perf_counter() - start
+        return result
+
+
+def run_pipeline(
+    audio_path: Path,
+    model_name: str,
+    threads: int,
+    language: str = "ja",
+    output_dir: Path | None = None,
+    precision: str = "fp32",
+    device: str | None = None,
+) -> dict:
+    """Time every stage of the transcription pipeline once.
+
+    Args:
+        audio_path: Audio file to transcribe
+        model_name: Whisper model size
+        threads: Torch intra-op thread count
+        language: Source language code
+        output_dir: Directory for the written subtitle files
+        precision: Model precision (see ``load_model``)
+        device: Torch device (default: CUDA if available)
+
+    Returns:
+        Dict with the configuration, stage timings, real-time factor and
+        the transcript text
+    """
+    timer = StageTimer()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A fresh PCM cache: "decode" is a miss (ffmpeg), "decode_cached" a hit
+        cache_dir = Path(tmp) / "cache"
+        timer.time("decode", load_pcm, audio_path, cache_dir)
+        audio = timer.time("decode_cached", load_pcm, audio_path, cache_dir)
+        duration = len(audio) / SAMPLE_RATE
+
+        model = timer.time(
+            "model_load",
+            load_model,
+            model_name,
+            device=device,
+            threads=threads,
+            precision=precision,
+        )
+        fp16 = use_fp16(model, precision)
+        timer.time("mel", whisper.log_mel_spectrogram, audio, model.dims.n_mels)
+
+        segments = timer.time(
+            "transcribe",
+            transcribe_audio,
+            audio,
+            model,
+            language=language,
+            fp16=fp16,
+        )
+        if language == "en":
+            translated = []
+        else:
+            translated = timer.time(
+                "translate",
+                translate_audio,
+                audio,
+                model,
+                language=language,
+                fp16=fp16,
+            )
+
+        if language == "ja":
+            source = segments or [
+                {"start": 0.0, "end": 1.0, "text": _ROMANIZE_FALLBACK}
+            ]
+            # Uncached, so the stage measures conversion rather than lookup
+            timer.time(
+                "romanize",
+                romanize_segments,
+                source,
+                create_converter(),
+                use_cache=False,
+            )
+
+        timer.time("filter", filter_segments, segments, "drop")
+
+        output_base = Path(output_dir or tmp) / f"{audio_path.stem}_{model_name}"
+        timer.time("srt_write", write_subtitles, segments, output_base, ["srt"])
+
+    return {
+        "model": model_name,
+        "threads": threads,
+        "precision": precision,
+        "device": str(model.device),
+        "language": language,
+        "segments": len(segments),
+        "translated_segments": len(translated),
+        "stages": timer.stages,
+        "real_time_factor": timer.stages["transcribe"] / duration if duration else 0.0,
+        "transcript": "".join(segment["text"] for segment in segments),
+    }
+
+
+def check_segments(segments: list[dict], duration: float, words: bool) -> list[str]:
+    """Check that segments have the shape every engine must return.
+
+    Args:
+        segments: Segments returned by an engine
+        duration: Audio length in seconds
+        words: Whether word timings were requested
+
+    Returns:
+        List of problems (empty if the segments conform)
+    """
+    problems = []
+    previous_start = 0.0
+    # Decoders may overrun the audio end by a fraction of a second
+    limit = duration + 1.0
+
+    for i, segment in enumerate(segments):
+        if not isinstance(segment, dict):
+            problems.append(f"segment {i}: not a dict")
+            continue
+
+        start = segment.get("start")
+        end = segment.get("end")
+        if not isinstance(segment.get("text"), str):
+            problems.append(f"segment {i}: 'text' is not a string")
+        if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
+            problems.append(f"segment {i}: 'start'/'end' are not numbers")
+            continue
+        if not 0.0 <= start <= end <= limit:
+            problems.append(f"segment {i}: bad times {start:.2f} --> {end:.2f}")
+        if start < previous_start:
+            problems.append(f"segment {i}: starts before the previous segment")
+        previous_start = start
+
+        if not words:
+            continue
+        if not isinstance(segment.get("words"), list):
+            problems.append(f"segment {i}: 'words' missing")
+            continue
+        for word in segment["words"]:
+            if not isinstance(word.get("word"), str):
+                problems.append(f"segment {i}: word without text")
+            elif not start - 0.5 <= word["start"] <= word["end"] <= end + 0.5:
+                problems.append(f"segment {i}: word {word['word']!r} outside segment")
+
+    return problems
+
+
+def run_conformance(
+    engines: list[str],
+    model_name: str = "tiny",
+    threads: int | None = None,
+    precision: str = "auto",
+    device: str | None = None,
+    audio_path: Path | None = None,
+    duration: float = 30.0,
+    language: str = "ja",
+    progress=print,
+) -> dict:
+    """Run every engine on the same audio and check its output.
+
+    Each engine transcribes (with word timings) and, unless the language
+    is English, translates the clip. Its segments are checked with
+    ``check_segments``, and its transcript is compared with the first
+    engine's transcript.
+
+    Args:
+        engines: Engine names; the first one is the reference
+        model_name: Model size used by every engine
+        threads: CPU thread count
+        precision: Model precision
+        device: Torch-style device name
+        audio_path: Audio file (default: synthetic signal of ``duration``)
+        duration: Length of the synthetic signal in seconds
+        language: Source language code
+        progress: Callback for progress messages
+
+    Returns:
+        JSON-serializable report with a result per engine
+    """
+    results = {}
+    reference = None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if audio_path is None:
+            audio_path = generate_audio(Path(tmp) / "synthetic.wav", duration)
+            source = "synthetic"
+        else:
+            source = str(audio_path)
+        audio_duration = len(whisper.load_audio(str(audio_path))) / SAMPLE_RATE
+
+        for name in engines:
+            progress(f"Checking engine {name}...")
+            timer = StageTimer()
+            engine = get_engine(
+                name,
+                model_name=model_name,
+                device=device,
+                threads=threads,
+                precision=precision,
+            )
+            timer.time("model_load", engine.load)
+            segments = timer.time(
+                "transcribe",
+                engine.transcribe,
+                audio_path,
+                language=language,
+                word_timestamps=True,
+            )
+            problems = check_segments(segments, audio_duration, words=True)
+            if language != "en":
+                translated = timer.time(
+                    "translate", engine.translate, audio_path, language=language
+                )
+                problems += [
+                    f"translate: {problem}"
+                    for problem in check_segments(translated, audio_duration, False)
+                ]
+
+            transcript = "".join(segment["text"] for segment in segments)
+            if reference is None:
+                reference = transcript
+            results[name] = {
+                "passed": not problems,
+                "problems": problems,
+                "segments": len(segments),
+                "stages": timer.stages,
+                "real_time_factor": timer.stages["transcribe"] / audio_duration,
+                "agreement": difflib.SequenceMatcher(
+                    None, reference, transcript
+                ).ratio(),
+            }
+
+    return {
+        "model": model_name,
+        "precision": precision,
+        "audio": {"source": source, "duration": audio_duration},
+        "engines": results,
+    }
+
+
+def run_benchmark(
+    models: list[str],
+    threads: list[int],
+    precisions: list[str] = ("fp32",),
+    device: str | None = None,
+    audio_path: Path | None = None,
+    duration: float = 30.0,
+    language: str = "ja",
+    progress=print,
+) -> dict:
+    """Run the pipeline for every model, thread count and precision.
+
+    Each run's ``agreement`` is the similarity (0-1) of its transcript to
+    the run with the first precision for the same model and thread count,
+    so speed can be weighed against accuracy loss.
+
+    Args:
+        models: Whisper model sizes
+        threads: Torch thread counts
+        precisions: Model precisions; the first one is the reference
+        device: Torch device (default: CUDA if available)
+        audio_path: Audio file (default: synthetic signal of ``duration``)
+        duration: Length of the synthetic signal in seconds
+        language: Source language code
+        progress: Callback for progress messages
+
+    Returns:
+        JSON-serializable report
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        if audio_path is None:
+            audio_path = generate_audio(Path(tmp) / "synthetic.wav", duration)
+            source = "synthetic"
+        else:
+            source = str(audio_path)
+
+        audio_duration = len(whisper.load_audio(str(audio_path))) / SAMPLE_RATE
+
+        runs = []
+        for model_name in models:
+            for thread_count in threads:
+                reference = None
+                for precision in precisions:
+                    progress(
+                        f"Benchmarking {model_name} with {thread_count} threads "
+                        f"({precision})..."
+                    )
+                    run = run_pipeline(
+                        audio_path,
+                        model_name,
+                        thread_count,
+                        language,
+                        precision=precision,
+                        device=device,
+                    )
+                    transcript = run.pop("transcript")
+                    if reference is None:
+                        reference = transcript
+                    run["agreement"] = difflib.SequenceMatcher(
+                        None, reference, transcript
+                    ).ratio()
+                    runs.append(run)
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "host": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "whisper": getattr(whisper, "__version__", "unknown"),
+            "cuda": torch.cuda.is_available(),
+        },
+        "audio": {"source": source, "duration": audio_duration},
+        "runs": runs,
+    }
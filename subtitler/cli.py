@@ -1,12 +1,101 @@
 """Subtitler - Command line interface."""
 
 import argparse
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from .transcribe import load_model, transcribe_audio, translate_audio
-from .romanize import romanize_segments, create_converter
-from .srt import write_srt, parse_srt
+from .audio import (
+    CACHE_DIR,
+    SAMPLE_RATE,
+    cache_usage,
+    clear_cache,
+    load_pcm,
+    read_language,
+    write_language,
+)
+from .engines import DEFAULT_ENGINE, ENGINES, available_engines, get_engine
+from .filters import (
+    DEFAULT_MAX_COMPRESSION,
+    DEFAULT_MAX_NO_SPEECH,
+    DEFAULT_MIN_LOGPROB,
+    DEFAULT_REPEAT_WINDOW,
+    FILTER_MODES,
+    describe_reasons,
+    filter_segments,
+)
+from .formats import format_for_path, parse_formats, read_subtitles, write_subtitles
+from .incremental import (
+    compute_fingerprint,
+    diff_fingerprints,
+    fingerprint_path_for,
+    load_fingerprint,
+    save_fingerprint,
+    update_segments,
+)
+from .reflow import reflow_file
+from .romanize import romanize_segments
+from .srt import parse_srt
+from .subidx import write_index
+from .transcribe import PRECISIONS
+from .words import attach_words, read_words, words_path_for, write_words
+
+
+def _write_outputs(segments, output_base, formats, words=False):
+    """Write segments in each requested format and report the paths."""
+    for path in write_subtitles(segments, output_base, formats):
+        print(f"  -> {path}")
+
+    if words:
+        path = write_words(segments, words_path_for(output_base))
+        print(f"  -> {path}")
+
+
+def _write_fingerprint(audio_path, output_base, language, model_name):
+    """Store the audio fingerprint used by ``subtitler update``."""
+    fingerprint = compute_fingerprint(load_pcm(audio_path))
+    path = save_fingerprint(
+        fingerprint_path_for(output_base), fingerprint, language, model_name
+    )
+    print(f"  -> {path}")
+
+
+def _filter(args, segments):
+    """Drop or flag low-confidence and repeated segments as requested."""
+    if args.filter == "off":
+        return segments
+    segments, reasons = filter_segments(
+        segments,
+        args.filter,
+        min_logprob=args.min_logprob,
+        max_no_speech=args.max_no_speech,
+        max_compression=args.max_compression,
+        repeat_window=args.repeat_window,
+    )
+    action = "Dropped" if args.filter == "drop" else "Flagged"
+    print(f"{action} {describe_reasons(reasons)}")
+    return segments
+
+
+def _load_engine(args):
+    """Create the transcription engine with the compute options of a command."""
+    print(f"Loading {args.engine} model: {args.model}")
+    try:
+        engine = get_engine(
+            args.engine,
+            model_name=args.model,
+            device=args.device,
+            threads=args.threads,
+            precision=args.precision,
+        )
+        engine.load()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    return engine
 
 
 def cmd_ja(args):
@@ -19,23 +108,24 @@ def cmd_ja(args):
     output_dir.mkdir(parents=True, exist_ok=True)
     base_name = args.audio.stem
 
-    print(f"Loading Whisper model: {args.model}")
-    model = load_model(args.model)
+    engine = _load_engine(args)
 
     # Japanese transcription
     print("Transcribing Japanese...")
-    ja_segments = transcribe_audio(args.audio, model, language="ja")
-    ja_srt_path = output_dir / f"{base_name}_ja.srt"
-    write_srt(ja_segments, ja_srt_path)
-    print(f"  -> {ja_srt_path}")
+    ja_segments = engine.transcribe(
+        args.audio, language="ja", word_timestamps=args.word_timestamps
+    )
+    ja_segments = _filter(args, ja_segments)
+    _write_outputs(
+        ja_segments, output_dir / f"{base_name}_ja", args.format, args.word_timestamps
+    )
+    _write_fingerprint(args.audio, output_dir / f"{base_name}_ja", "ja", args.model)
 
     # Optional English translation
     if args.with_english:
         print("Translating to English...")
-        en_segments = translate_audio(args.audio, model, language="ja")
-        en_srt_path = output_dir / f"{base_name}_en.srt"
-        write_srt(en_segments, en_srt_path)
-        print(f"  -> {en_srt_path}")
+        en_segments = _filter(args, engine.translate(args.audio, language="ja"))
+        _write_outputs(en_segments, output_dir / f"{base_name}_en", args.format)
 
     print("Done!")
 
@@ -50,15 +140,143 @@ def cmd_en(args):
     output_dir.mkdir(parents=True, exist_ok=True)
     base_name = args.audio.stem
 
-    print(f"Loading Whisper model: {args.model}")
-    model = load_model(args.model)
+    engine = _load_engine(args)
 
     # English transcription
     print("Transcribing English...")
-    en_segments = transcribe_audio(args.audio, model, language="en")
-    en_srt_path = output_dir / f"{base_name}_en.srt"
-    write_srt(en_segments, en_srt_path)
-    print(f"  -> {en_srt_path}")
+    en_segments = engine.transcribe(
+        args.audio, language="en", word_timestamps=args.word_timestamps
+    )
+    en_segments = _filter(args, en_segments)
+    _write_outputs(
+        en_segments, output_dir / f"{base_name}_en", args.format, args.word_timestamps
+    )
+    _write_fingerprint(args.audio, output_dir / f"{base_name}_en", "en", args.model)
+
+    print("Done!")
+
+
+def cmd_transcribe(args):
+    """Detect the audio language, then transcribe in that language."""
+    if not args.audio.exists():
+        print(f"Error: Audio file not found: {args.audio}", file=sys.stderr)
+        sys.exit(1)
+
+    output_dir = args.output
+    output_dir.mkdir(parents=True, exist_ok=True)
+    base_name = args.audio.stem
+
+    engine = _load_engine(args)
+
+    language = args.language
+    if language is None:
+        cached = read_language(args.audio)
+        if cached is None:
+            print("Detecting language...")
+            language, probability = engine.detect_language(args.audio)
+            write_language(args.audio, language, probability)
+        else:
+            language, probability = cached
+        print(f"Language: {language} ({probability:.0%})")
+
+    print(f"Transcribing ({language})...")
+    segments = engine.transcribe(
+        args.audio, language=language, word_timestamps=args.word_timestamps
+    )
+    segments = _filter(args, segments)
+    _write_outputs(
+        segments,
+        output_dir / f"{base_name}_{language}",
+        args.format,
+        args.word_timestamps,
+    )
+    _write_fingerprint(
+        args.audio, output_dir / f"{base_name}_{language}", language, args.model
+    )
+
+    if language == "ja":
+        print("Converting to Romaji...")
+        romaji_segments = romanize_segments(segments)
+        _write_outputs(romaji_segments, output_dir / f"{base_name}_romaji", args.format)
+
+    if args.with_english and language != "en":
+        print("Translating to English...")
+        en_segments = _filter(args, engine.translate(args.audio, language=language))
+        _write_outputs(en_segments, output_dir / f"{base_name}_en", args.format)
+
+    print("Done!")
+
+
+def cmd_update(args):
+    """Re-transcribe only the edited part of the audio."""
+    for path in (args.audio, args.subtitle):
+        if not path.exists():
+            print(f"Error: File not found: {path}", file=sys.stderr)
+            sys.exit(1)
+
+    fingerprint_path = fingerprint_path_for(args.subtitle)
+    if not fingerprint_path.exists():
+        print(
+            f"Error: No fingerprint at {fingerprint_path}; transcribe the audio "
+            "with ja/en/transcribe first",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    output_path = args.output or args.subtitle
+    try:
+        output_format = format_for_path(output_path)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        old = load_fingerprint(fingerprint_path)
+    except (ValueError, KeyError) as e:
+        print(f"Error: Invalid fingerprint {fingerprint_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    samples = load_pcm(args.audio)
+    new = compute_fingerprint(samples)
+    changed = diff_fingerprints(old, new)
+    if changed is None:
+        print("Audio unchanged; nothing to do.")
+        return
+
+    start, old_end, new_end = (value / SAMPLE_RATE for value in changed)
+    print(
+        f"Changed: {start:.1f}s-{old_end:.1f}s -> {start:.1f}s-{new_end:.1f}s "
+        f"({new_end - old_end:+.2f}s)"
+    )
+
+    segments = read_subtitles(args.subtitle)
+    words_path = words_path_for(args.subtitle)
+    word_timestamps = words_path.exists()
+    if word_timestamps:
+        attach_words(segments, read_words(words_path))
+
+    args.model = args.model or old["model"]
+    engine = _load_engine(args)
+    segments, (slice_start, slice_end) = update_segments(
+        engine,
+        samples,
+        segments,
+        changed,
+        old["language"],
+        margin=args.margin,
+        word_timestamps=word_timestamps,
+    )
+    total = new["samples"] / SAMPLE_RATE
+    print(
+        f"Re-transcribed {slice_start:.1f}s-{slice_end:.1f}s "
+        f"({slice_end - slice_start:.1f}s of {total:.1f}s)"
+    )
+
+    output_base = output_path.with_suffix("")
+    _write_outputs(segments, output_base, [output_format], word_timestamps)
+    path = save_fingerprint(
+        fingerprint_path_for(output_base), new, old["language"], args.model
+    )
+    print(f"  -> {path}")
 
     print("Done!")
 
@@ -78,18 +296,258 @@ def cmd_romaji(args):
         base_name = base_name[:-3]
 
     print("Loading SRT file...")
-    ja_segments = parse_srt(args.srt)
+    ja_segments = read_subtitles(args.srt)
 
     print("Converting to Romaji...")
-    converter = create_converter()
-    romaji_segments = romanize_segments(ja_segments, converter)
-    romaji_srt_path = output_dir / f"{base_name}_romaji.srt"
-    write_srt(romaji_segments, romaji_srt_path)
-    print(f"  -> {romaji_srt_path}")
+    romaji_segments = romanize_segments(
+        ja_segments, use_cache=not args.no_cache, workers=args.jobs
+    )
+    _write_outputs(romaji_segments, output_dir / f"{base_name}_romaji", args.format)
+
+    print("Done!")
+
+
+def cmd_reflow(args):
+    """Split, merge, retime and wrap subtitle cues for reading."""
+    for path in args.files:
+        if not path.exists():
+            print(f"Error: Subtitle file not found: {path}", file=sys.stderr)
+            sys.exit(1)
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    run = partial(
+        reflow_file,
+        output_dir=args.output,
+        formats=args.format,
+        max_width=args.max_chars,
+        max_lines=args.max_lines,
+        min_duration=args.min_duration,
+        max_duration=args.max_duration,
+        max_cps=args.max_cps,
+        min_gap=args.min_gap,
+    )
+    if args.jobs > 1 and len(args.files) > 1:
+        with ProcessPoolExecutor(args.jobs) as executor:
+            results = executor.map(run, args.files, chunksize=16)
+            for paths, before, after in results:
+                print(f"  -> {paths[0]} ({before} -> {after} cues)")
+    else:
+        for path in args.files:
+            paths, before, after = run(path)
+            print(f"  -> {paths[0]} ({before} -> {after} cues)")
+
+    print("Done!")
+
+
+def cmd_index(args):
+    """Build binary sidecar indexes for subtitle files."""
+    for srt_path in args.srt:
+        if not srt_path.exists():
+            print(f"Error: Subtitle file not found: {srt_path}", file=sys.stderr)
+            sys.exit(1)
+
+        if srt_path.suffix.lower() == ".srt":
+            segments = parse_srt(srt_path, use_index=False)
+        else:
+            segments = read_subtitles(srt_path)
+        index_path = write_index(srt_path, segments)
+        print(f"  -> {index_path} ({len(segments)} cues)")
 
     print("Done!")
 
 
+def cmd_cache(args):
+    """Show or clear the decoded audio cache."""
+    if args.clear:
+        freed = clear_cache()
+        print(f"Freed {freed / 1e6:.1f} MB from {CACHE_DIR}")
+        return
+
+    count, size = cache_usage()
+    print(f"{CACHE_DIR}: {count} files, {size / 1e6:.1f} MB")
+
+
+def cmd_bench(args):
+    """Benchmark every pipeline stage and report JSON."""
+    # Imported here so the other commands do not pay for numpy/torch setup
+    from .bench import run_benchmark, run_conformance
+
+    if args.audio is not None and not args.audio.exists():
+        print(f"Error: Audio file not found: {args.audio}", file=sys.stderr)
+        sys.exit(1)
+
+    for precision in args.precisions:
+        if precision not in PRECISIONS:
+            print(f"Error: Unknown precision: {precision}", file=sys.stderr)
+            sys.exit(1)
+
+    def progress(message):
+        print(message, file=sys.stderr)
+
+    if args.conformance:
+        engines = args.engines or available_engines()
+        for name in engines:
+            if name not in ENGINES:
+                print(f"Error: Unknown engine: {name}", file=sys.stderr)
+                sys.exit(1)
+        report = run_conformance(
+            engines,
+            model_name=args.models[0],
+            threads=args.threads[0],
+            precision=args.precisions[0],
+            device=args.device,
+            audio_path=args.audio,
+            duration=args.duration,
+            language=args.language,
+            progress=progress,
+        )
+    else:
+        report = run_benchmark(
+            models=args.models,
+            threads=args.threads,
+            precisions=args.precisions,
+            device=args.device,
+            audio_path=args.audio,
+            duration=args.duration,
+            language=args.language,
+            progress=progress,
+        )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+        print(f"  -> {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.conformance:
+        failed = False
+        for name, result in report["engines"].items():
+            status = "ok" if result["passed"] else "FAILED"
+            print(
+                f"{name:>16} {status:<6} RTF={result['real_time_factor']:.3f} "
+                f"agreement={result['agreement']:.3f}",
+                file=sys.stderr,
+            )
+            for problem in result["problems"]:
+                print(f"{'':>16} {problem}", file=sys.stderr)
+            failed = failed or not result["passed"]
+        if failed:
+            sys.exit(1)
+        return
+
+    for run in report["runs"]:
+        print(
+            f"{run['model']:>8} threads={run['threads']:<3} "
+            f"precision={run['precision']:<5} "
+            f"RTF={run['real_time_factor']:.3f} agreement={run['agreement']:.3f}",
+            file=sys.stderr,
+        )
+
+
+def _add_format_argument(parser):
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=_format_list,
+        default=["srt"],
+        help="Output formats, comma-separated: srt, vtt, ass, jsonl (default: srt)",
+    )
+
+
+def _add_word_timestamps_argument(parser):
+    parser.add_argument(
+        "--word-timestamps",
+        action="store_true",
+        help="Also write word timings (.words.json) for karaoke highlighting",
+    )
+
+
+def _add_filter_arguments(parser):
+    parser.add_argument(
+        "--filter",
+        type=str,
+        default="off",
+        choices=FILTER_MODES,
+        help="Drop or flag ([?] prefix) low-confidence and repeated segments "
+        "(default: off)",
+    )
+    parser.add_argument(
+        "--min-logprob",
+        type=float,
+        default=DEFAULT_MIN_LOGPROB,
+        help="Filter segments with a lower average log probability "
+        f"(default: {DEFAULT_MIN_LOGPROB})",
+    )
+    parser.add_argument(
+        "--max-no-speech",
+        type=float,
+        default=DEFAULT_MAX_NO_SPEECH,
+        help="Filter low-confidence segments with a higher no-speech probability "
+        f"(default: {DEFAULT_MAX_NO_SPEECH})",
+    )
+    parser.add_argument(
+        "--max-compression",
+        type=float,
+        default=DEFAULT_MAX_COMPRESSION,
+        help="Filter segments with a higher compression ratio (repetitive text) "
+        f"(default: {DEFAULT_MAX_COMPRESSION})",
+    )
+    parser.add_argument(
+        "--repeat-window",
+        type=int,
+        default=DEFAULT_REPEAT_WINDOW,
+        help="Filter segments repeating one of this many previous segments, "
+        f"0 disables (default: {DEFAULT_REPEAT_WINDOW})",
+    )
+
+
+def _add_compute_arguments(parser):
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default=DEFAULT_ENGINE,
+        choices=list(ENGINES),
+        help=f"Transcription engine (default: {DEFAULT_ENGINE})",
+    )
+    parser.add_argument(
+        "--device",
+        type=str,
+        default="auto",
+        help="Torch device: auto, cpu, cuda, cuda:1, ... (default: auto)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Torch intra-op thread count (default: all cores)",
+    )
+    parser.add_argument(
+        "--precision",
+        type=str,
+        default="auto",
+        choices=PRECISIONS,
+        help="auto, fp32, fp16 (CUDA) or int8 (CPU, quantized) (default: auto)",
+    )
+
+
+def _comma_list(item_type):
+    def parse(value):
+        try:
+            return [item_type(item) for item in value.split(",") if item.strip()]
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    return parse
+
+
+def _format_list(value):
+    try:
+        return parse_formats(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Subtitler - Transcription and subtitle generation"
@@ -119,6 +577,10 @@ def main():
         action="store_true",
         help="Also generate English translation",
     )
+    _add_format_argument(ja_parser)
+    _add_word_timestamps_argument(ja_parser)
+    _add_filter_arguments(ja_parser)
+    _add_compute_arguments(ja_parser)
     ja_parser.set_defaults(func=cmd_ja)
 
     # English command
@@ -139,13 +601,94 @@ def main():
         choices=["tiny", "base", "small", "medium", "large"],
         help="Whisper model size (default: base)",
     )
+    _add_format_argument(en_parser)
+    _add_word_timestamps_argument(en_parser)
+    _add_filter_arguments(en_parser)
+    _add_compute_arguments(en_parser)
     en_parser.set_defaults(func=cmd_en)
 
+    # Transcribe command (language auto-detected)
+    transcribe_parser = subparsers.add_parser(
+        "transcribe",
+        help="Detect the audio language and transcribe (ja also writes Romaji)",
+    )
+    transcribe_parser.add_argument(
+        "audio", type=Path, help="Path to audio file (mp3, wav)"
+    )
+    transcribe_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("output"),
+        help="Output directory (default: output)",
+    )
+    transcribe_parser.add_argument(
+        "-m",
+        "--model",
+        type=str,
+        default="base",
+        choices=["tiny", "base", "small", "medium", "large"],
+        help="Whisper model size (default: base)",
+    )
+    transcribe_parser.add_argument(
+        "-l",
+        "--language",
+        type=str,
+        default=None,
+        help="Source language code; skips detection (default: auto)",
+    )
+    transcribe_parser.add_argument(
+        "--with-english",
+        action="store_true",
+        help="Also generate English translation (non-English audio)",
+    )
+    _add_format_argument(transcribe_parser)
+    _add_word_timestamps_argument(transcribe_parser)
+    _add_filter_arguments(transcribe_parser)
+    _add_compute_arguments(transcribe_parser)
+    transcribe_parser.set_defaults(func=cmd_transcribe)
+
+    # Update command
+    update_parser = subparsers.add_parser(
+        "update", help="Re-transcribe only the edited part of the audio"
+    )
+    update_parser.add_argument(
+        "audio", type=Path, help="Path to the edited audio file (mp3, wav)"
+    )
+    update_parser.add_argument(
+        "subtitle", type=Path, help="Subtitle file transcribed from the previous audio"
+    )
+    update_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Output subtitle file (default: overwrite the input)",
+    )
+    update_parser.add_argument(
+        "-m",
+        "--model",
+        type=str,
+        default=None,
+        choices=["tiny", "base", "small", "medium", "large"],
+        help="Whisper model size (default: the one used for the transcript)",
+    )
+    update_parser.add_argument(
+        "--margin",
+        type=float,
+        default=2.0,
+        help="Seconds re-transcribed around the edit (default: 2)",
+    )
+    _add_compute_arguments(update_parser)
+    update_parser.set_defaults(func=cmd_update)
+
     # Romaji command
     romaji_parser = subparsers.add_parser(
         "romaji", help="Convert Japanese SRT to Romaji"
     )
-    romaji_parser.add_argument("srt", type=Path, help="Path to Japanese SRT file")
+    romaji_parser.add_argument(
+        "srt", type=Path, help="Path to Japanese subtitle file (srt, vtt, ass, jsonl)"
+    )
     romaji_parser.add_argument(
         "-o",
         "--output",
@@ -153,8 +696,168 @@ def main():
         default=Path("output"),
         help="Output directory (default: output)",
     )
+    romaji_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use the persistent romaji cache",
+    )
+    romaji_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for converting many new lines (default: all cores)",
+    )
+    _add_format_argument(romaji_parser)
     romaji_parser.set_defaults(func=cmd_romaji)
 
+    # Reflow command
+    reflow_parser = subparsers.add_parser(
+        "reflow", help="Split, merge, retime and wrap cues for on-screen reading"
+    )
+    reflow_parser.add_argument(
+        "files", type=Path, nargs="+", help="Subtitle file(s) (srt, vtt, ass, jsonl)"
+    )
+    reflow_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("output"),
+        help="Output directory (default: output)",
+    )
+    reflow_parser.add_argument(
+        "-f",
+        "--format",
+        type=_format_list,
+        default=None,
+        help="Output formats, comma-separated (default: same as input)",
+    )
+    reflow_parser.add_argument(
+        "--max-chars",
+        type=int,
+        default=42,
+        help="Maximum line width; CJK characters count as 2 (default: 42)",
+    )
+    reflow_parser.add_argument(
+        "--max-lines", type=int, default=2, help="Maximum lines per cue (default: 2)"
+    )
+    reflow_parser.add_argument(
+        "--min-duration",
+        type=float,
+        default=1.0,
+        help="Minimum cue duration in seconds (default: 1.0)",
+    )
+    reflow_parser.add_argument(
+        "--max-duration",
+        type=float,
+        default=7.0,
+        help="Maximum cue duration in seconds (default: 7.0)",
+    )
+    reflow_parser.add_argument(
+        "--max-cps",
+        type=float,
+        default=17.0,
+        help="Maximum reading speed in characters per second; CJK count as 2, "
+        "0 disables (default: 17)",
+    )
+    reflow_parser.add_argument(
+        "--min-gap",
+        type=float,
+        default=0.084,
+        help="Gap kept before the next cue when extending (default: 0.084)",
+    )
+    reflow_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Parallel processes for many files (default: all cores)",
+    )
+    reflow_parser.set_defaults(func=cmd_reflow)
+
+    # Index command
+    index_parser = subparsers.add_parser(
+        "index", help="Build binary sidecar index (.subidx) for subtitle files"
+    )
+    index_parser.add_argument(
+        "srt", type=Path, nargs="+", help="Path to subtitle file(s)"
+    )
+    index_parser.set_defaults(func=cmd_index)
+
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache", help="Show or clear the decoded audio cache"
+    )
+    cache_parser.add_argument(
+        "--clear", action="store_true", help="Delete all cached audio"
+    )
+    cache_parser.set_defaults(func=cmd_cache)
+
+    # Bench command
+    bench_parser = subparsers.add_parser(
+        "bench", help="Time every pipeline stage and output JSON"
+    )
+    bench_parser.add_argument(
+        "--audio",
+        type=Path,
+        default=None,
+        help="Audio file to use (default: synthetic speech-like signal)",
+    )
+    bench_parser.add_argument(
+        "--duration",
+        type=float,
+        default=30.0,
+        help="Length of the synthetic signal in seconds (default: 30)",
+    )
+    bench_parser.add_argument(
+        "--models",
+        type=_comma_list(str),
+        default=["tiny", "base"],
+        help="Comma-separated model sizes (default: tiny,base)",
+    )
+    bench_parser.add_argument(
+        "--threads",
+        type=_comma_list(int),
+        default=[os.cpu_count() or 1],
+        help="Comma-separated torch thread counts (default: all cores)",
+    )
+    bench_parser.add_argument(
+        "--precisions",
+        type=_comma_list(str),
+        default=["fp32"],
+        help="Comma-separated precisions; the first is the accuracy reference "
+        "(default: fp32)",
+    )
+    bench_parser.add_argument(
+        "--conformance",
+        action="store_true",
+        help="Check every engine's output on the same clip instead of timing "
+        "stages (uses the first model, thread count and precision)",
+    )
+    bench_parser.add_argument(
+        "--engines",
+        type=_comma_list(str),
+        default=None,
+        help="Comma-separated engines for --conformance (default: all installed)",
+    )
+    bench_parser.add_argument(
+        "--device",
+        type=str,
+        default="auto",
+        help="Torch device: auto, cpu, cuda, ... (default: auto)",
+    )
+    bench_parser.add_argument(
+        "--language",
+        type=str,
+        default="ja",
+        choices=["ja", "en"],
+        help="Source language (default: ja)",
+    )
+    bench_parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="Write JSON report to file"
+    )
+    bench_parser.set_defaults(func=cmd_bench)
+
     args = parser.parse_args()
     args.func(args)
 
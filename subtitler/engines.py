@@ -0,0 +1,307 @@
+"""Transcription engines.
+
+An engine turns an audio file into Whisper-style segments (dicts with
+'start', 'end' and 'text', the confidence values 'avg_logprob',
+'no_speech_prob' and 'compression_ratio', plus 'words' when word timings
+are requested).
+``whisper`` (openai-whisper) is the default; other backends are used only
+when their package is installed::
+
+    engine = get_engine("faster-whisper", model_name="base", threads=4)
+    segments = engine.transcribe(audio_path, language="ja")
+"""
+
+import importlib.util
+import inspect
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+from .audio import SAMPLE_RATE, as_samples
+from .transcribe import (
+    MODELS_DIR,
+    detect_language,
+    load_model,
+    transcribe_audio,
+    translate_audio,
+)
+
+DEFAULT_ENGINE = "whisper"
+
+ENGINES = {}
+
+
+class Engine(ABC):
+    """Base class for transcription engines.
+
+    Subclasses implement ``detect_language``, ``transcribe`` and
+    ``translate``; ``load`` is optional.
+
+    Args:
+        model_name: Model size - tiny, base, small, medium, large
+        device: Torch-style device name (default: CUDA if available)
+        threads: CPU thread count (default: all cores)
+        precision: auto, fp32, fp16 or int8
+        download_root: Directory to save/load models (default: PROJECT/models)
+    """
+
+    # Registry name
+    name = ""
+    # Module that must be importable for the engine to be available
+    requires = None
+    # pip package providing that module
+    package = None
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        device: str | None = None,
+        threads: int | None = None,
+        precision: str = "auto",
+        download_root: Path | None = None,
+    ):
+        self.model_name = model_name
+        self.device = device
+        self.threads = threads
+        self.precision = precision
+        self.download_root = download_root
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check whether the engine's backend package is installed."""
+        if cls.requires is None or cls.requires in sys.modules:
+            return True
+        return importlib.util.find_spec(cls.requires) is not None
+
+    def load(self):
+        """Load the model now instead of on first use.
+
+        Raises:
+            ValueError: If the device or precision is not supported
+        """
+
+    @abstractmethod
+    def detect_language(self, audio_path: Path | np.ndarray) -> tuple[str, float]:
+        """Detect the spoken language from the first 30 seconds.
+
+        Args:
+            audio_path: Path to audio file (mp3, wav), or 16 kHz float32
+                samples
+
+        Returns:
+            Language code and its probability
+        """
+
+    @abstractmethod
+    def transcribe(
+        self,
+        audio_path: Path | np.ndarray,
+        language: str = "ja",
+        word_timestamps: bool = False,
+    ) -> list[dict]:
+        """Transcribe audio in its own language.
+
+        Args:
+            audio_path: Path to audio file (mp3, wav), or 16 kHz float32
+                samples
+            language: Source language code
+            word_timestamps: Keep per-word timings in each segment's 'words'
+
+        Returns:
+            List of segments with 'start', 'end', 'text' keys
+        """
+
+    @abstractmethod
+    def translate(
+        self, audio_path: Path | np.ndarray, language: str = "ja"
+    ) -> list[dict]:
+        """Translate audio to English text.
+
+        Args:
+            audio_path: Path to audio file (mp3, wav), or 16 kHz float32
+                samples
+            language: Source language code
+
+        Returns:
+            List of segments with 'start', 'end', 'text' keys
+        """
+
+
+class WhisperEngine(Engine):
+    """openai-whisper (PyTorch)."""
+
+    name = "whisper"
+    requires = "whisper"
+    package = "openai-whisper"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model = None
+
+    def load(self):
+        if self._model is None:
+            self._model = load_model(
+                self.model_name,
+                download_root=self.download_root,
+                device=self.device,
+                threads=self.threads,
+                precision=self.precision,
+            )
+
+    def detect_language(self, audio_path):
+        self.load()
+        return detect_language(audio_path, self._model)
+
+    def transcribe(self, audio_path, language="ja", word_timestamps=False):
+        self.load()
+        return transcribe_audio(
+            audio_path,
+            self._model,
+            language=language,
+            word_timestamps=word_timestamps,
+            precision=self.precision,
+        )
+
+    def translate(self, audio_path, language="ja"):
+        self.load()
+        return translate_audio(
+            audio_path, self._model, language=language, precision=self.precision
+        )
+
+
+class FasterWhisperEngine(Engine):
+    """faster-whisper (CTranslate2), usually several times faster on the CPU."""
+
+    name = "faster-whisper"
+    requires = "faster_whisper"
+    package = "faster-whisper"
+
+    # Precision -> CTranslate2 compute type
+    COMPUTE_TYPES = MappingProxyType(
+        {
+            "auto": "default",
+            "fp32": "float32",
+            "fp16": "float16",
+            "int8": "int8",
+        }
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._model = None
+
+    def load(self):
+        if self._model is None:
+            from faster_whisper import WhisperModel
+
+            if self.precision not in self.COMPUTE_TYPES:
+                raise ValueError(f"Unknown precision: {self.precision}")
+
+            download_root = self.download_root or MODELS_DIR
+            download_root.mkdir(parents=True, exist_ok=True)
+            device, _, index = (self.device or "auto").partition(":")
+            self._model = WhisperModel(
+                self.model_name,
+                device=device,
+                device_index=int(index or 0),
+                compute_type=self.COMPUTE_TYPES[self.precision],
+                cpu_threads=self.threads or 0,
+                download_root=str(download_root),
+            )
+
+    def detect_language(self, audio_path):
+        self.load()
+        # Detection runs before the returned generator decodes anything
+        prefix = as_samples(audio_path)[: 30 * SAMPLE_RATE]
+        _, info = self._model.transcribe(prefix)
+        return info.language, info.language_probability
+
+    def transcribe(self, audio_path, language="ja", word_timestamps=False):
+        self.load()
+        segments, _ = self._model.transcribe(
+            as_samples(audio_path),
+            language=language,
+            task="transcribe",
+            word_timestamps=word_timestamps,
+        )
+        return [self._to_dict(segment) for segment in segments]
+
+    def translate(self, audio_path, language="ja"):
+        self.load()
+        segments, _ = self._model.transcribe(
+            as_samples(audio_path), language=language, task="translate"
+        )
+        return [self._to_dict(segment) for segment in segments]
+
+    @staticmethod
+    def _to_dict(segment) -> dict:
+        """Convert a faster-whisper Segment to the compact segment dict."""
+        result = {
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "avg_logprob": segment.avg_logprob,
+            "compression_ratio": segment.compression_ratio,
+            "no_speech_prob": segment.no_speech_prob,
+        }
+        if segment.words is not None:
+            result["words"] = [
+                {
+                    "word": word.word,
+                    "start": word.start,
+                    "end": word.end,
+                    "probability": word.probability,
+                }
+                for word in segment.words
+            ]
+        return result
+
+
+def register_engine(engine_class: type) -> type:
+    """Register an engine class under its ``name``.
+
+    Can be used as a class decorator by third-party backends.
+
+    Raises:
+        TypeError: If the class does not implement every abstract method
+    """
+    if inspect.isabstract(engine_class):
+        missing = ", ".join(sorted(engine_class.__abstractmethods__))
+        raise TypeError(f"Engine {engine_class.__name__} does not implement: {missing}")
+    ENGINES[engine_class.name] = engine_class
+    return engine_class
+
+
+def available_engines() -> list[str]:
+    """Get the names of registered engines whose backend is installed."""
+    return [name for name, cls in ENGINES.items() if cls.is_available()]
+
+
+def get_engine(name: str = DEFAULT_ENGINE, **options) -> Engine:
+    """Create an engine by name.
+
+    Args:
+        name: Registered engine name
+        **options: Engine options (model_name, device, threads, precision,
+            download_root)
+
+    Returns:
+        Engine instance (the model is loaded on first use)
+    """
+    if name not in ENGINES:
+        raise ValueError(
+            f"Unknown engine: {name} (choose from {', '.join(sorted(ENGINES))})"
+        )
+    engine_class = ENGINES[name]
+    if not engine_class.is_available():
+        raise ValueError(
+            f"Engine '{name}' is not installed (pip install {engine_class.package})"
+        )
+    return engine_class(**options)
+
+
+register_engine(WhisperEngine)
+register_engine(FasterWhisperEngine)
@@ -0,0 +1,183 @@
+"""Segment confidence filtering.
+
+Whisper tends to hallucinate in silent or noisy passages: the same line
+repeated over and over, text with a very low average log probability, or
+text for audio that is most likely not speech at all. ``filter_segments``
+finds those segments from the confidence values Whisper reports for each
+segment and drops them, or flags them for an editor, before the subtitle
+files are written::
+
+    segments, reasons = filter_segments(segments, "drop")
+    print(describe_reasons(reasons))  # "3 segments: 1 no speech, 2 repeated"
+
+The values are gathered into numpy arrays and every rule is a vector
+comparison, so filtering 100k segments takes about a tenth of a second.
+Segments without confidence values (read back from a subtitle file) are
+only checked for repeats.
+
+The default thresholds are the ones Whisper itself uses to discard a
+decoding window (``logprob_threshold``, ``no_speech_threshold`` and
+``compression_ratio_threshold``). Like Whisper, a segment counts as no
+speech only if it was also decoded with low confidence, so clear speech
+over a noisy background is kept; without an avg_logprob the no-speech
+probability decides alone.
+
+The repeat rule cannot tell a hallucinated loop from a line that is really
+said twice in a row: a repeated "Yes." is dropped too. Set the window to 0
+for dialogue with many short replies.
+"""
+
+from collections import namedtuple
+from itertools import count
+from operator import itemgetter
+
+import numpy as np
+
+FILTER_MODES = ("off", "flag", "drop")
+
+DEFAULT_MIN_LOGPROB = -1.0
+DEFAULT_MAX_NO_SPEECH = 0.6
+DEFAULT_MAX_COMPRESSION = 2.4
+# A segment repeating the text of one of this many previous segments
+DEFAULT_REPEAT_WINDOW = 2
+
+# Prefix of flagged segment text
+FLAG_PREFIX = "[?] "
+
+# Reason bits
+LOW_CONFIDENCE = 1
+NO_SPEECH = 2
+REPETITIVE = 4
+REPEATED = 8
+
+REASONS = {
+    LOW_CONFIDENCE: "low confidence",
+    NO_SPEECH: "no speech",
+    REPETITIVE: "repetitive",
+    REPEATED: "repeated",
+}
+
+# Per-segment confidence values (NaN when missing) and text ids (equal for
+# segments with the same text)
+SegmentTable = namedtuple(
+    "SegmentTable", "avg_logprob no_speech_prob compression_ratio text_id"
+)
+
+
+def _column(segments: list[dict], key: str) -> np.ndarray:
+    """Get a float value of every segment (NaN where it is missing)."""
+    try:
+        # Builtin getters keep the per-segment loop out of the interpreter
+        return np.fromiter(map(itemgetter(key), segments), np.float64, len(segments))
+    except (KeyError, TypeError):
+        # None becomes NaN, which fails every threshold comparison
+        return np.array([segment.get(key) for segment in segments], np.float64)
+
+
+def segment_table(segments: list[dict]) -> SegmentTable:
+    """Gather the values the filter needs into arrays.
+
+    Args:
+        segments: Segments from ``transcribe_audio`` or an engine
+
+    Returns:
+        SegmentTable of per-segment arrays
+    """
+    # Text id: index of the first segment with the same text
+    texts = {}
+    keys = map(str.casefold, map(str.strip, map(itemgetter("text"), segments)))
+    return SegmentTable(
+        _column(segments, "avg_logprob"),
+        _column(segments, "no_speech_prob"),
+        _column(segments, "compression_ratio"),
+        np.fromiter(map(texts.setdefault, keys, count()), np.int64, len(segments)),
+    )
+
+
+def classify_segments(
+    segments: list[dict],
+    min_logprob: float = DEFAULT_MIN_LOGPROB,
+    max_no_speech: float = DEFAULT_MAX_NO_SPEECH,
+    max_compression: float = DEFAULT_MAX_COMPRESSION,
+    repeat_window: int = DEFAULT_REPEAT_WINDOW,
+) -> np.ndarray:
+    """Find low-confidence and repeated segments.
+
+    Args:
+        segments: Segments from ``transcribe_audio`` or an engine
+        min_logprob: Segments with a lower avg_logprob are low confidence
+        max_no_speech: Segments with a higher no_speech_prob and a low
+            avg_logprob (or none) are not speech
+        max_compression: Segments with a higher compression_ratio (text that
+            repeats itself) are repetitive
+        repeat_window: Segments with the same text as one of this many
+            previous segments are repeated (0: off)
+
+    Returns:
+        uint8 array of reason bits per segment (0: keep)
+    """
+    table = segment_table(segments)
+    reasons = np.zeros(len(segments), dtype=np.uint8)
+    reasons[table.avg_logprob < min_logprob] |= LOW_CONFIDENCE
+    # NaN (no avg_logprob) counts as unsure
+    unsure = ~(table.avg_logprob >= min_logprob)
+    reasons[(table.no_speech_prob > max_no_speech) & unsure] |= NO_SPEECH
+    reasons[table.compression_ratio > max_compression] |= REPETITIVE
+
+    text_ids = table.text_id
+    for distance in range(1, min(repeat_window, len(segments) - 1) + 1):
+        same = text_ids[distance:] == text_ids[:-distance]
+        reasons[distance:][same] |= REPEATED
+    return reasons
+
+
+def filter_segments(
+    segments: list[dict], mode: str = "drop", **thresholds
+) -> tuple[list[dict], np.ndarray]:
+    """Drop or flag low-confidence and repeated segments.
+
+    Args:
+        segments: Segments from ``transcribe_audio`` or an engine
+        mode: "drop" removes the segments, "flag" prefixes their text with
+            ``FLAG_PREFIX``, "off" returns them unchanged
+        **thresholds: Keyword arguments of ``classify_segments``
+
+    Returns:
+        Filtered segments (new list; flagged segments are copies) and the
+        reason bits of every input segment
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in FILTER_MODES:
+        raise ValueError(
+            f"Unknown filter mode: {mode} (choose from {', '.join(FILTER_MODES)})"
+        )
+    if mode == "off" or not segments:
+        return list(segments), np.zeros(len(segments), dtype=np.uint8)
+
+    reasons = classify_segments(segments, **thresholds)
+    if mode == "drop":
+        kept = [segments[i] for i in np.flatnonzero(reasons == 0).tolist()]
+        return kept, reasons
+
+    flagged = list(segments)
+    for i in np.flatnonzero(reasons).tolist():
+        segment = flagged[i]
+        flagged[i] = {**segment, "text": FLAG_PREFIX + segment["text"].strip()}
+    return flagged, reasons
+
+
+def describe_reasons(reasons: np.ndarray) -> str:
+    """Summarize reason bits, e.g. "3 segments: 1 no speech, 2 repeated".
+
+    A segment counts once in the total and once for each of its reasons.
+    """
+    counts = [
+        (int(np.count_nonzero(reasons & bit)), name) for bit, name in REASONS.items()
+    ]
+    details = ", ".join(f"{count} {name}" for count, name in counts if count)
+    total = int(np.count_nonzero(reasons))
+    if not total:
+        return "0 segments"
+    return f"{total} segment{'s' if total != 1 else ''}: {details}"
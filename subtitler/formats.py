@@ -0,0 +1,351 @@
+"""Subtitle format registry (SRT, WebVTT, ASS, JSON lines).
+
+Writers format one cue at a time, so several formats can be written from a
+single pass over the segment list. Readers return the same segment dicts
+as ``parse_srt``.
+"""
+
+import html
+import json
+import re
+from contextlib import ExitStack
+from pathlib import Path
+
+from .srt import format_srt_cue, parse_srt
+from .timecode import from_ms, to_ms
+
+# Output buffer size per file
+WRITE_BUFFER_SIZE = 1 << 16
+
+# name -> (extension, header, cue formatter)
+WRITERS = {}
+
+# extension -> reader
+READERS = {}
+
+
+def register_writer(name: str, extension: str, header: str = ""):
+    """Register a cue formatter ``format_cue(index, segment) -> str``.
+
+    Args:
+        name: Format name used on the command line
+        extension: Output file extension (including the dot)
+        header: Text written once before the first cue
+    """
+
+    def decorator(format_cue):
+        WRITERS[name] = (extension, header, format_cue)
+        return format_cue
+
+    return decorator
+
+
+def register_reader(*extensions: str):
+    """Register a reader ``read(path) -> list[dict]`` for file extensions."""
+
+    def decorator(read):
+        for extension in extensions:
+            READERS[extension] = read
+        return read
+
+    return decorator
+
+
+def parse_formats(value: str) -> list[str]:
+    """Parse a comma-separated format list such as ``srt,vtt``.
+
+    Raises:
+        ValueError: If a format is not registered or is listed twice
+    """
+    formats = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in formats if name not in WRITERS]
+    if unknown:
+        raise ValueError(
+            f"Unknown format: {', '.join(unknown)} "
+            f"(available: {', '.join(sorted(WRITERS))})"
+        )
+    duplicates = sorted({name for name in formats if formats.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Format listed more than once: {', '.join(duplicates)}")
+    return formats
+
+
+def format_for_path(path: Path) -> str:
+    """Get the registered format name writing a file's extension.
+
+    Raises:
+        ValueError: If no format writes the extension
+    """
+    suffix = Path(path).suffix.lower()
+    for name, (extension, _, _) in WRITERS.items():
+        if extension == suffix:
+            return name
+    raise ValueError(f"Unsupported subtitle format: {suffix}")
+
+
+def write_subtitles(
+    segments: list[dict], output_base: Path, formats: list[str]
+) -> list[Path]:
+    """Write segments in several formats in one pass.
+
+    Args:
+        segments: List of dicts with 'start', 'end', 'text' keys
+        output_base: Output path without extension
+        formats: Registered format names
+
+    Returns:
+        Paths of the written files
+    """
+    writers = [WRITERS[name] for name in formats]
+    paths = [
+        output_base.with_name(output_base.name + extension)
+        for extension, _, _ in writers
+    ]
+
+    with ExitStack() as stack:
+        files = []
+        for path, (_, header, format_cue) in zip(paths, writers):
+            f = stack.enter_context(
+                open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+            )
+            f.write(header)
+            files.append((f.write, format_cue))
+
+        for i, segment in enumerate(segments, start=1):
+            for write, format_cue in files:
+                write(format_cue(i, segment))
+
+    return paths
+
+
+def read_subtitles(path: Path) -> list[dict]:
+    """Read a subtitle file in any registered format.
+
+    Raises:
+        ValueError: If the file extension has no reader
+    """
+    path = Path(path)
+    read = READERS.get(path.suffix.lower())
+    if read is None:
+        raise ValueError(f"Unsupported subtitle format: {path.suffix}")
+    return read(path)
+
+
+def _split_ms(millis: int) -> tuple[int, int, int, int]:
+    secs, millis = divmod(max(millis, 0), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return hours, minutes, secs, millis
+
+
+# SRT
+
+register_writer("srt", ".srt")(format_srt_cue)
+register_reader(".srt")(parse_srt)
+
+
+# WebVTT
+
+
+def format_vtt_timestamp(seconds: float) -> str:
+    """Convert seconds to WebVTT timestamp format (HH:MM:SS.mmm)."""
+    hours, minutes, secs, millis = _split_ms(to_ms(seconds))
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+@register_writer("vtt", ".vtt", header="WEBVTT\n\n")
+def format_vtt_cue(index: int, segment: dict) -> str:
+    """Format one segment as a WebVTT cue block.
+
+    ``&``, ``<`` and ``>`` are escaped, as cue text is markup.
+    """
+    start = format_vtt_timestamp(segment["start"])
+    end = format_vtt_timestamp(segment["end"])
+    text = html.escape(segment["text"].strip(), quote=False)
+    return f"{index}\n{start} --> {end}\n{text}\n\n"
+
+
+_VTT_TIMESTAMP_RE = re.compile(r"(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})")
+_VTT_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _parse_vtt_timestamp_ms(timestamp: str) -> int:
+    match = _VTT_TIMESTAMP_RE.match(timestamp)
+    if not match:
+        return 0
+    hours, minutes, secs, millis = match.groups()
+    total_secs = (int(hours or 0) * 60 + int(minutes)) * 60 + int(secs)
+    return total_secs * 1000 + int(millis)
+
+
+@register_reader(".vtt")
+def parse_vtt(vtt_path: Path) -> list[dict]:
+    """Parse WebVTT file to list of segments.
+
+    Args:
+        vtt_path: Path to WebVTT file
+
+    Returns:
+        List of dicts with 'start', 'end', 'text' keys
+    """
+    with open(vtt_path, "r", encoding="utf-8-sig") as f:
+        content = f.read()
+
+    segments = []
+    for block in re.split(r"\n\n+", content.strip()):
+        lines = block.strip().split("\n")
+        for i, line in enumerate(lines):
+            if "-->" in line:
+                break
+        else:
+            # Header, NOTE, STYLE and REGION blocks have no timing line
+            continue
+
+        start_str, end_str = line.split("-->", 1)
+        text = " ".join(
+            html.unescape(_VTT_TAG_RE.sub("", text)) for text in lines[i + 1 :]
+        )
+        segments.append(
+            {
+                "start": from_ms(_parse_vtt_timestamp_ms(start_str.strip())),
+                "end": from_ms(_parse_vtt_timestamp_ms(end_str.strip())),
+                "text": text,
+            }
+        )
+
+    return segments
+
+
+# Advanced SubStation Alpha
+
+ASS_HEADER = """[Script Info]
+ScriptType: v4.00+
+PlayResX: 1920
+PlayResY: 1080
+WrapStyle: 0
+ScaledBorderAndShadow: yes
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,54,&H00FFFFFF,&H0000FFFF,&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,1,2,40,40,60,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+_ASS_ESCAPES = str.maketrans({"{": "\\{", "}": "\\}"})
+
+ASS_EVENT_FIELDS = ASS_HEADER.rstrip().rsplit("Format: ", 1)[1].split(", ")
+
+
+def format_ass_timestamp(seconds: float) -> str:
+    """Convert seconds to ASS timestamp format (H:MM:SS.cc)."""
+    # Round to the nearest centisecond
+    hours, minutes, secs, millis = _split_ms(to_ms(seconds) + 5)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}.{millis // 10:02d}"
+
+
+@register_writer("ass", ".ass", header=ASS_HEADER)
+def format_ass_cue(index: int, segment: dict) -> str:
+    """Format one segment as an ASS Dialogue event.
+
+    Braces are escaped so text cannot open an override block.
+    """
+    start = format_ass_timestamp(segment["start"])
+    end = format_ass_timestamp(segment["end"])
+    text = segment["text"].strip().translate(_ASS_ESCAPES).replace("\n", "\\N")
+    return f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}\n"
+
+
+_ASS_TIMESTAMP_RE = re.compile(r"(\d+):(\d{2}):(\d{2})\.(\d{2})")
+# Override blocks; an escaped brace (\{) is text
+_ASS_OVERRIDE_RE = re.compile(r"(?<!\\)\{[^}]*\}")
+
+
+def _parse_ass_timestamp_ms(timestamp: str) -> int:
+    match = _ASS_TIMESTAMP_RE.match(timestamp)
+    if not match:
+        return 0
+    hours, minutes, secs, centis = map(int, match.groups())
+    return ((hours * 60 + minutes) * 60 + secs) * 1000 + centis * 10
+
+
+@register_reader(".ass", ".ssa")
+def parse_ass(ass_path: Path) -> list[dict]:
+    """Parse the Dialogue events of an ASS/SSA file to list of segments.
+
+    Args:
+        ass_path: Path to ASS file
+
+    Returns:
+        List of dicts with 'start', 'end', 'text' keys
+    """
+    fields = ASS_EVENT_FIELDS
+    segments = []
+    in_events = False
+
+    with open(ass_path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                in_events = line.lower() == "[events]"
+                continue
+            if not in_events:
+                continue
+
+            key, _, value = line.partition(":")
+            if key == "Format":
+                fields = [field.strip() for field in value.split(",")]
+            elif key == "Dialogue":
+                values = dict(zip(fields, value.split(",", len(fields) - 1)))
+                text = _ASS_OVERRIDE_RE.sub("", values.get("Text", ""))
+                text = text.replace("\\N", " ").replace("\\n", " ")
+                text = text.replace("\\{", "{").replace("\\}", "}")
+                start = _parse_ass_timestamp_ms(values["Start"].strip())
+                end = _parse_ass_timestamp_ms(values["End"].strip())
+                segments.append(
+                    {"start": from_ms(start), "end": from_ms(end), "text": text.strip()}
+                )
+
+    return segments
+
+
+# JSON lines
+
+
+@register_writer("jsonl", ".jsonl")
+def format_jsonl_cue(index: int, segment: dict) -> str:
+    """Format one segment as a JSON line."""
+    record = {
+        "start": from_ms(to_ms(segment["start"])),
+        "end": from_ms(to_ms(segment["end"])),
+        "text": segment["text"].strip(),
+    }
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+@register_reader(".jsonl")
+def parse_jsonl(jsonl_path: Path) -> list[dict]:
+    """Parse JSON lines file to list of segments.
+
+    Args:
+        jsonl_path: Path to JSON lines file
+
+    Returns:
+        List of dicts with 'start', 'end', 'text' keys
+    """
+    segments = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            segments.append(
+                {
+                    "start": float(record["start"]),
+                    "end": float(record["end"]),
+                    "text": record["text"],
+                }
+            )
+    return segments
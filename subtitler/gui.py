@@ -1,5 +1,6 @@
 """Subtitler - PySide6 GUI."""
 
+import os
 import sys
 from pathlib import Path
 
@@ -8,6 +9,7 @@ from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
     QComboBox,
+    QDoubleSpinBox,
     QFileDialog,
     QHBoxLayout,
     QLabel,
@@ -15,14 +17,25 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
+    QSpinBox,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
-from .transcribe import load_model, transcribe_audio, translate_audio
-from .romanize import create_converter, romanize_segments
+from .engines import DEFAULT_ENGINE, available_engines, get_engine
+from .filters import (
+    DEFAULT_MAX_COMPRESSION,
+    DEFAULT_MAX_NO_SPEECH,
+    DEFAULT_MIN_LOGPROB,
+    DEFAULT_REPEAT_WINDOW,
+    FILTER_MODES,
+    describe_reasons,
+    filter_segments,
+)
+from .romanize import romanize_segments
 from .srt import parse_srt, write_srt
+from .transcribe import PRECISIONS
 
 
 class TranscribeWorker(QThread):
@@ -33,7 +46,18 @@ class TranscribeWorker(QThread):
     error = Signal(str)
 
     def __init__(
-        self, task_type, file_path, output_dir, model_name, with_english=False
+        self,
+        task_type,
+        file_path,
+        output_dir,
+        model_name,
+        with_english=False,
+        device="auto",
+        threads=None,
+        precision="auto",
+        engine=DEFAULT_ENGINE,
+        filter_mode="off",
+        filter_thresholds=None,
     ):
         super().__init__()
         self.task_type = task_type
@@ -41,6 +65,12 @@ class TranscribeWorker(QThread):
         self.output_dir = output_dir
         self.model_name = model_name
         self.with_english = with_english
+        self.device = device
+        self.threads = threads
+        self.precision = precision
+        self.engine = engine
+        self.filter_mode = filter_mode
+        self.filter_thresholds = filter_thresholds or {}
 
     def run(self):
         try:
@@ -56,22 +86,48 @@ class TranscribeWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+    def _load_engine(self):
+        """Create the engine with the selected compute options."""
+        self.progress.emit(
+            f"Loading {self.engine} model: {self.model_name} "
+            f"({self.device}, {self.precision})"
+        )
+        engine = get_engine(
+            self.engine,
+            model_name=self.model_name,
+            device=self.device,
+            threads=self.threads,
+            precision=self.precision,
+        )
+        engine.load()
+        return engine
+
+    def _filter(self, segments):
+        """Drop or flag low-confidence and repeated segments."""
+        if self.filter_mode == "off":
+            return segments
+        segments, reasons = filter_segments(
+            segments, self.filter_mode, **self.filter_thresholds
+        )
+        action = "Dropped" if self.filter_mode == "drop" else "Flagged"
+        self.progress.emit(f"{action} {describe_reasons(reasons)}")
+        return segments
+
     def _run_japanese(self):
         """Run Japanese transcription."""
         base_name = self.file_path.stem
 
-        self.progress.emit(f"Loading model: {self.model_name}")
-        model = load_model(self.model_name)
+        engine = self._load_engine()
 
         self.progress.emit("Transcribing Japanese...")
-        ja_segments = transcribe_audio(self.file_path, model, language="ja")
+        ja_segments = self._filter(engine.transcribe(self.file_path, language="ja"))
         ja_srt_path = self.output_dir / f"{base_name}_ja.srt"
         write_srt(ja_segments, ja_srt_path)
         self.progress.emit(f"-> {ja_srt_path}")
 
         if self.with_english:
             self.progress.emit("Translating to English...")
-            en_segments = translate_audio(self.file_path, model, language="ja")
+            en_segments = self._filter(engine.translate(self.file_path, language="ja"))
             en_srt_path = self.output_dir / f"{base_name}_en.srt"
             write_srt(en_segments, en_srt_path)
             self.progress.emit(f"-> {en_srt_path}")
@@ -82,11 +138,10 @@ class TranscribeWorker(QThread):
         """Run English transcription."""
         base_name = self.file_path.stem
 
-        self.progress.emit(f"Loading model: {self.model_name}")
-        model = load_model(self.model_name)
+        engine = self._load_engine()
 
         self.progress.emit("Transcribing English...")
-        en_segments = transcribe_audio(self.file_path, model, language="en")
+        en_segments = self._filter(engine.transcribe(self.file_path, language="en"))
         en_srt_path = self.output_dir / f"{base_name}_en.srt"
         write_srt(en_segments, en_srt_path)
         self.progress.emit(f"-> {en_srt_path}")
@@ -101,8 +156,7 @@ class TranscribeWorker(QThread):
 
         self.progress.emit("Converting to Romaji...")
         ja_segments = parse_srt(self.file_path)
-        converter = create_converter()
-        romaji_segments = romanize_segments(ja_segments, converter)
+        romaji_segments = romanize_segments(ja_segments)
         romaji_srt_path = self.output_dir / f"{base_name}_romaji.srt"
         write_srt(romaji_segments, romaji_srt_path)
         self.progress.emit(f"-> {romaji_srt_path}")
@@ -116,7 +170,7 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Subtitler")
-        self.resize(450, 300)
+        self.resize(450, 330)
 
         self.worker = None
 
@@ -159,6 +213,79 @@ class MainWindow(QMainWindow):
         model_layout.addStretch()
         layout.addLayout(model_layout)
 
+        # Compute options
+        compute_layout = QHBoxLayout()
+        compute_layout.setSpacing(4)
+        compute_label = QLabel("Compute:")
+        compute_label.setFixedWidth(label_width)
+        compute_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        compute_layout.addWidget(compute_label)
+        self.engine_combo = QComboBox()
+        self.engine_combo.addItems(available_engines())
+        self.engine_combo.setCurrentText(DEFAULT_ENGINE)
+        self.engine_combo.setToolTip("Transcription engine")
+        compute_layout.addWidget(self.engine_combo)
+        self.device_combo = QComboBox()
+        self.device_combo.addItems(["auto", "cpu", "cuda"])
+        self.device_combo.setToolTip("Torch device")
+        compute_layout.addWidget(self.device_combo)
+        self.precision_combo = QComboBox()
+        self.precision_combo.addItems(PRECISIONS)
+        self.precision_combo.setToolTip(
+            "fp16 needs CUDA; int8 quantizes the model for CPU inference"
+        )
+        compute_layout.addWidget(self.precision_combo)
+        compute_layout.addWidget(QLabel("Threads:"))
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, os.cpu_count() or 1)
+        self.threads_spin.setSpecialValueText("all")
+        self.threads_spin.setToolTip("Torch intra-op threads (all: every core)")
+        compute_layout.addWidget(self.threads_spin)
+        compute_layout.addStretch()
+        layout.addLayout(compute_layout)
+
+        # Confidence filter
+        filter_layout = QHBoxLayout()
+        filter_layout.setSpacing(4)
+        filter_label = QLabel("Filter:")
+        filter_label.setFixedWidth(label_width)
+        filter_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        filter_layout.addWidget(filter_label)
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems(FILTER_MODES)
+        self.filter_combo.setToolTip(
+            "Drop or flag ([?] prefix) low-confidence and repeated segments"
+        )
+        filter_layout.addWidget(self.filter_combo)
+        self.logprob_spin = QDoubleSpinBox()
+        self.logprob_spin.setRange(-10.0, 0.0)
+        self.logprob_spin.setSingleStep(0.1)
+        self.logprob_spin.setValue(DEFAULT_MIN_LOGPROB)
+        self.logprob_spin.setToolTip("Minimum average log probability")
+        filter_layout.addWidget(self.logprob_spin)
+        self.no_speech_spin = QDoubleSpinBox()
+        self.no_speech_spin.setRange(0.0, 1.0)
+        self.no_speech_spin.setSingleStep(0.05)
+        self.no_speech_spin.setValue(DEFAULT_MAX_NO_SPEECH)
+        self.no_speech_spin.setToolTip("Maximum no-speech probability")
+        filter_layout.addWidget(self.no_speech_spin)
+        self.compression_spin = QDoubleSpinBox()
+        self.compression_spin.setRange(1.0, 10.0)
+        self.compression_spin.setSingleStep(0.1)
+        self.compression_spin.setValue(DEFAULT_MAX_COMPRESSION)
+        self.compression_spin.setToolTip("Maximum compression ratio (repetitive text)")
+        filter_layout.addWidget(self.compression_spin)
+        self.repeat_spin = QSpinBox()
+        self.repeat_spin.setRange(0, 10)
+        self.repeat_spin.setValue(DEFAULT_REPEAT_WINDOW)
+        self.repeat_spin.setSpecialValueText("off")
+        self.repeat_spin.setToolTip(
+            "Filter segments repeating one of this many previous segments"
+        )
+        filter_layout.addWidget(self.repeat_spin)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
         # Buttons row
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(4)
@@ -266,7 +393,22 @@ class MainWindow(QMainWindow):
         self.log(f"[{task_type}] {file_path.name}")
 
         self.worker = TranscribeWorker(
-            task_type, file_path, output_dir, model_name, with_english
+            task_type,
+            file_path,
+            output_dir,
+            model_name,
+            with_english,
+            device=self.device_combo.currentText(),
+            threads=self.threads_spin.value() or None,
+            precision=self.precision_combo.currentText(),
+            engine=self.engine_combo.currentText(),
+            filter_mode=self.filter_combo.currentText(),
+            filter_thresholds={
+                "min_logprob": self.logprob_spin.value(),
+                "max_no_speech": self.no_speech_spin.value(),
+                "max_compression": self.compression_spin.value(),
+                "repeat_window": self.repeat_spin.value(),
+            },
         )
         self.worker.progress.connect(self.log)
         self.worker.finished.connect(self.log)
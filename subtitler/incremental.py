@@ -0,0 +1,201 @@
+"""Incremental re-transcription of edited audio.
+
+A fingerprint of the decoded audio is stored next to each transcript
+(``foo_ja.srt`` -> ``foo_ja.fingerprint.npz``). It holds one 64-bit hash
+per second of PCM, counted both from the start and from the end of the
+file, so an edit that changes the length (a longer or shorter pickup)
+still leaves the unchanged head and tail matching.
+
+``update_segments`` compares a new version of the audio with that
+fingerprint, re-transcribes only the changed range plus margins, and
+splices the result between the untouched segments, shifting those after
+the edit by the change in length.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+from .audio import SAMPLE_RATE
+from .formats import READERS
+
+FINGERPRINT_SUFFIX = ".fingerprint.npz"
+FINGERPRINT_VERSION = 1
+
+# Hash window length in samples (1 second)
+WINDOW = SAMPLE_RATE
+
+
+def fingerprint_path_for(subtitle_path: Path) -> Path:
+    """Get the fingerprint path for a subtitle file or output base."""
+    subtitle_path = Path(subtitle_path)
+    if subtitle_path.suffix.lower() in READERS:
+        subtitle_path = subtitle_path.with_suffix("")
+    return subtitle_path.with_name(subtitle_path.name + FINGERPRINT_SUFFIX)
+
+
+def _window_hash(samples: np.ndarray) -> int:
+    # Quantize to 16 bits so float noise below one LSB does not count as a change
+    pcm = np.round(samples * 32767.0).astype(np.int16)
+    return int.from_bytes(hashlib.blake2b(pcm.tobytes(), digest_size=8).digest())
+
+
+def compute_fingerprint(samples: np.ndarray) -> dict:
+    """Hash 1 second windows aligned to the start and to the end of the audio.
+
+    Args:
+        samples: 16 kHz float32 samples
+
+    Returns:
+        Dict with 'samples' (length), 'head' and 'tail' (uint64 hash arrays)
+    """
+    count = len(samples)
+    windows = count // WINDOW
+    head = np.fromiter(
+        (_window_hash(samples[i * WINDOW : (i + 1) * WINDOW]) for i in range(windows)),
+        dtype=np.uint64,
+        count=windows,
+    )
+    tail = np.fromiter(
+        (
+            _window_hash(samples[count - (i + 1) * WINDOW : count - i * WINDOW])
+            for i in range(windows)
+        ),
+        dtype=np.uint64,
+        count=windows,
+    )
+    return {"samples": count, "head": head, "tail": tail}
+
+
+def save_fingerprint(
+    path: Path, fingerprint: dict, language: str, model_name: str
+) -> Path:
+    """Save a fingerprint with the language and model of its transcript."""
+    with open(path, "wb") as f:
+        np.savez(
+            f,
+            version=FINGERPRINT_VERSION,
+            samples=fingerprint["samples"],
+            head=fingerprint["head"],
+            tail=fingerprint["tail"],
+            language=language,
+            model=model_name,
+        )
+    return path
+
+
+def load_fingerprint(path: Path) -> dict:
+    """Load a fingerprint saved by ``save_fingerprint``.
+
+    Raises:
+        ValueError: If the file is not a supported fingerprint
+    """
+    with np.load(path) as data:
+        if int(data["version"]) != FINGERPRINT_VERSION:
+            raise ValueError(f"Unsupported fingerprint version: {data['version']}")
+        return {
+            "samples": int(data["samples"]),
+            "head": data["head"],
+            "tail": data["tail"],
+            "language": str(data["language"]),
+            "model": str(data["model"]),
+        }
+
+
+def _common_prefix(a: np.ndarray, b: np.ndarray) -> int:
+    count = min(len(a), len(b))
+    mismatch = np.flatnonzero(a[:count] != b[:count])
+    return int(mismatch[0]) if len(mismatch) else count
+
+
+def diff_fingerprints(old: dict, new: dict) -> tuple[int, int, int] | None:
+    """Find the changed sample range between two versions of the audio.
+
+    Args:
+        old: Fingerprint of the transcribed version
+        new: Fingerprint of the edited version
+
+    Returns:
+        (start, old_end, new_end) in samples: ``old[start:old_end]`` was
+        replaced by ``new[start:new_end]``. None if the audio is unchanged.
+    """
+    old_count = old["samples"]
+    new_count = new["samples"]
+
+    start = _common_prefix(old["head"], new["head"]) * WINDOW
+    tail = _common_prefix(old["tail"], new["tail"]) * WINDOW
+    # The matching head and tail must not overlap in either version
+    tail = min(tail, old_count - start, new_count - start)
+    tail = max(tail, 0)
+
+    if old_count == new_count and start + tail >= new_count:
+        return None
+    return start, old_count - tail, new_count - tail
+
+
+def _shift(segment: dict, offset: float) -> dict:
+    shifted = dict(segment)
+    shifted["start"] = segment["start"] + offset
+    shifted["end"] = segment["end"] + offset
+    if segment.get("words"):
+        shifted["words"] = [
+            dict(word, start=word["start"] + offset, end=word["end"] + offset)
+            for word in segment["words"]
+        ]
+    return shifted
+
+
+def update_segments(
+    engine,
+    samples: np.ndarray,
+    segments: list[dict],
+    changed: tuple[int, int, int],
+    language: str,
+    margin: float = 2.0,
+    word_timestamps: bool = False,
+) -> tuple[list[dict], tuple[float, float]]:
+    """Re-transcribe the changed range of edited audio.
+
+    Segments ending at least ``margin`` seconds before the change are kept
+    as they are; segments starting at least ``margin`` seconds after it are
+    kept and shifted by the change in length. The audio between the two is
+    transcribed again.
+
+    Args:
+        engine: Transcription engine
+        samples: 16 kHz float32 samples of the edited audio
+        segments: Segments of the previous transcript
+        changed: Range from ``diff_fingerprints``
+        language: Source language code
+        margin: Seconds of context re-transcribed around the change
+        word_timestamps: Keep per-word timings in each new segment's 'words'
+
+    Returns:
+        Spliced segments and the re-transcribed (start, end) in seconds
+    """
+    start, old_end, new_end = (value / SAMPLE_RATE for value in changed)
+    delta = new_end - old_end
+
+    before = [s for s in segments if s["end"] <= start - margin]
+    after = [s for s in segments if s["start"] >= old_end + margin]
+
+    slice_start = before[-1]["end"] if before else 0.0
+    slice_end = after[0]["start"] + delta if after else len(samples) / SAMPLE_RATE
+
+    audio = samples[round(slice_start * SAMPLE_RATE) : round(slice_end * SAMPLE_RATE)]
+    middle = []
+    if len(audio):
+        for segment in engine.transcribe(
+            np.asarray(audio, dtype=np.float32),
+            language=language,
+            word_timestamps=word_timestamps,
+        ):
+            segment = _shift(segment, slice_start)
+            if segment["start"] >= slice_end:
+                continue
+            segment["end"] = min(segment["end"], slice_end)
+            middle.append(segment)
+
+    spliced = before + middle + [_shift(segment, delta) for segment in after]
+    return spliced, (slice_start, slice_end)
@@ -0,0 +1,351 @@
+"""Subtitle reflow: split, merge, retime and line-wrap cues.
+
+``reflow`` is a chain of generators over a segment iterator, so any number
+of cues is processed in one linear pass while holding at most a couple of
+cues in memory:
+
+1. split cues whose text does not fit ``max_lines`` lines or that last
+   longer than ``max_duration`` (at word boundaries when 'words' timings
+   are present, otherwise in proportion to text width)
+2. merge cues shorter than ``min_duration`` into a neighbour when the
+   result still fits
+3. extend cues to ``min_duration`` and the ``max_cps`` reading speed
+   without running into the next cue, then wrap the text into lines
+
+Widths are measured in columns: East Asian wide characters count as 2,
+everything else as 1, so ``max_width=42`` allows 42 Latin or 21 Japanese
+characters per line.
+"""
+
+import unicodedata
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .formats import format_for_path, read_subtitles, write_subtitles
+from .words import attach_words, read_words, words_path_for, write_words
+
+# Characters that must not start a line (kinsoku)
+_NO_LINE_START = frozenset(
+    "、。，．,.:;!?！？：；」』）)]】〉》・ーゃゅょっャュョッぁぃぅぇぉァィゥェォ…"
+)
+
+
+def char_width(char: str) -> int:
+    """Get the display width of a character in columns."""
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def text_width(text: str) -> int:
+    """Get the display width of text in columns."""
+    return sum(char_width(char) for char in text)
+
+
+def _units(text: str) -> list[tuple[str, str]]:
+    """Split text into breakable units with the separator before each.
+
+    Latin runs are kept whole; wide characters are units of their own, so
+    CJK text can break anywhere. A line break between two wide characters
+    is dropped rather than turned into a space.
+    """
+    units = []
+    current = ""
+    gap = ""
+
+    def push(unit):
+        nonlocal gap
+        separator = " " if gap and units else ""
+        if (
+            separator
+            and not gap.strip("\r\n")
+            and char_width(units[-1][1][-1]) == 2
+            and char_width(unit[0]) == 2
+        ):
+            separator = ""
+        units.append((separator, unit))
+        gap = ""
+
+    for char in text:
+        if char.isspace():
+            if current:
+                push(current)
+                current = ""
+            gap += char
+        elif char_width(char) == 2:
+            if current:
+                push(current)
+                current = ""
+            push(char)
+        else:
+            current += char
+    if current:
+        push(current)
+    return units
+
+
+def _join(units: list[tuple[str, str]]) -> str:
+    return "".join(separator + unit for separator, unit in units).lstrip()
+
+
+def _wrap_units(units: list[tuple[str, str]], max_width: int) -> list[str]:
+    """Greedily fill lines of at most ``max_width`` columns."""
+    lines = []
+    line = []
+    width = 0
+    for separator, unit in units:
+        unit_width = text_width(unit)
+        added = unit_width + (len(separator) if line else 0)
+        if line and width + added > max_width and unit[0] not in _NO_LINE_START:
+            lines.append(_join(line))
+            line = [("", unit)]
+            width = unit_width
+        else:
+            line.append((separator, unit))
+            width += added
+    if line:
+        lines.append(_join(line))
+    return lines
+
+
+def wrap_text(text: str, max_width: int = 42) -> list[str]:
+    """Wrap text into lines of at most ``max_width`` columns.
+
+    A single word wider than ``max_width`` gets a line of its own.
+    """
+    return _wrap_units(_units(text), max_width)
+
+
+def _fits(text: str, max_width: int, max_lines: int) -> bool:
+    return len(wrap_text(text, max_width)) <= max_lines
+
+
+def _merge_text(first: str, second: str) -> str:
+    if not first or not second:
+        return first or second
+    wide = char_width(first[-1]) == 2 and char_width(second[0]) == 2
+    return first + ("" if wide else " ") + second
+
+
+def _split(
+    segments: Iterable[dict], max_width: int, max_lines: int, max_duration: float
+) -> Iterator[dict]:
+    for segment in segments:
+        text = segment["text"].strip()
+        duration = segment["end"] - segment["start"]
+        if duration <= max_duration and _fits(text, max_width, max_lines):
+            yield {**segment, "text": text}
+        elif segment.get("words"):
+            yield from _split_words(segment, max_width, max_lines, max_duration)
+        else:
+            yield from _split_text(segment, text, max_width, max_lines, max_duration)
+
+
+def _split_words(
+    segment: dict, max_width: int, max_lines: int, max_duration: float
+) -> Iterator[dict]:
+    """Split at word boundaries using Whisper word timings."""
+    words = segment["words"]
+    chunk = []
+    start = segment["start"]
+    for word in words:
+        candidate = chunk + [word]
+        text = "".join(w["word"] for w in candidate).strip()
+        fits = _fits(text, max_width, max_lines) and word["end"] - start <= max_duration
+        if chunk and not fits:
+            yield {
+                "start": start,
+                "end": chunk[-1]["end"],
+                "text": "".join(w["word"] for w in chunk).strip(),
+                "words": chunk,
+            }
+            chunk = [word]
+            start = word["start"]
+        else:
+            chunk = candidate
+    if chunk:
+        yield {
+            "start": start,
+            "end": segment["end"],
+            "text": "".join(w["word"] for w in chunk).strip(),
+            "words": chunk,
+        }
+
+
+def _split_text(
+    segment: dict, text: str, max_width: int, max_lines: int, max_duration: float
+) -> Iterator[dict]:
+    """Split at unit boundaries, timing each piece by its share of the width."""
+    units = _units(text)
+    total_width = max(sum(text_width(unit) for _, unit in units), 1)
+    duration = segment["end"] - segment["start"]
+    # Aim for equal pieces short enough in both text and time
+    pieces = max(
+        -(-total_width // (max_width * max_lines)),
+        -int(-duration // max_duration),
+        1,
+    )
+    target = -(-total_width // pieces)
+
+    chunks = []
+    chunk = []
+    chunk_width = 0
+    for separator, unit in units:
+        unit_width = text_width(unit)
+        candidate = chunk + [(separator, unit)]
+        too_wide = chunk_width + unit_width > target or not _fits(
+            _join(candidate), max_width, max_lines
+        )
+        if chunk and too_wide and unit[0] not in _NO_LINE_START:
+            chunks.append((chunk, chunk_width))
+            chunk = [("", unit)]
+            chunk_width = unit_width
+        else:
+            chunk = candidate
+            chunk_width += unit_width
+    if chunk:
+        chunks.append((chunk, chunk_width))
+
+    start = segment["start"]
+    consumed = 0
+    for i, (chunk, chunk_width) in enumerate(chunks):
+        consumed += chunk_width
+        if i == len(chunks) - 1:
+            end = segment["end"]
+        else:
+            end = segment["start"] + duration * consumed / total_width
+        yield {"start": start, "end": end, "text": _join(chunk)}
+        start = end
+
+
+def _merge(
+    cues: Iterable[dict],
+    max_width: int,
+    max_lines: int,
+    min_duration: float,
+    max_duration: float,
+    max_merge_gap: float,
+) -> Iterator[dict]:
+    pending = None
+    for cue in cues:
+        if pending is None:
+            pending = cue
+            continue
+
+        short = (
+            pending["end"] - pending["start"] < min_duration
+            or cue["end"] - cue["start"] < min_duration
+        )
+        if short and cue["start"] - pending["end"] <= max_merge_gap:
+            text = _merge_text(pending["text"], cue["text"])
+            fits_duration = cue["end"] - pending["start"] <= max_duration
+            if fits_duration and _fits(text, max_width, max_lines):
+                merged = {"start": pending["start"], "end": cue["end"], "text": text}
+                if pending.get("words") or cue.get("words"):
+                    merged["words"] = (pending.get("words") or []) + (
+                        cue.get("words") or []
+                    )
+                pending = merged
+                continue
+
+        yield pending
+        pending = cue
+
+    if pending is not None:
+        yield pending
+
+
+def _retime(
+    cues: Iterable[dict],
+    max_width: int,
+    min_duration: float,
+    max_duration: float,
+    max_cps: float,
+    min_gap: float,
+) -> Iterator[dict]:
+    def finish(cue, next_start):
+        width = text_width(cue["text"].replace(" ", ""))
+        needed = max(min_duration, width / max_cps if max_cps else 0.0)
+        end = max(cue["end"], min(cue["start"] + needed, cue["start"] + max_duration))
+        if next_start is not None:
+            # Extend only up to min_gap before the next cue, and trim overlaps
+            limit = max(next_start - min_gap, min(cue["end"], next_start))
+            end = max(min(end, limit), cue["start"])
+        text = "\n".join(wrap_text(cue["text"], max_width))
+        return {**cue, "end": end, "text": text}
+
+    previous = None
+    for cue in cues:
+        if previous is not None:
+            yield finish(previous, cue["start"])
+        previous = cue
+    if previous is not None:
+        yield finish(previous, None)
+
+
+def reflow(
+    segments: Iterable[dict],
+    max_width: int = 42,
+    max_lines: int = 2,
+    min_duration: float = 1.0,
+    max_duration: float = 7.0,
+    max_cps: float = 17.0,
+    min_gap: float = 0.084,
+    max_merge_gap: float = 0.5,
+) -> Iterator[dict]:
+    """Reflow segments for on-screen reading.
+
+    Args:
+        segments: Iterable of dicts with 'start', 'end', 'text' keys (and
+            optionally Whisper 'words'), in time order
+        max_width: Maximum line width in columns (CJK characters count 2)
+        max_lines: Maximum lines per cue
+        min_duration: Minimum cue duration in seconds
+        max_duration: Maximum cue duration in seconds
+        max_cps: Maximum reading speed in columns per second (spaces not
+            counted); 0 disables the limit
+        min_gap: Minimum gap kept before the next cue when extending
+        max_merge_gap: Largest gap in seconds bridged when merging cues
+
+    Yields:
+        Reflowed segments; 'text' is wrapped with newlines
+    """
+    cues = _split(segments, max_width, max_lines, max_duration)
+    cues = _merge(cues, max_width, max_lines, min_duration, max_duration, max_merge_gap)
+    return _retime(cues, max_width, min_duration, max_duration, max_cps, min_gap)
+
+
+def reflow_file(
+    input_path: Path,
+    output_dir: Path,
+    formats: list[str] | None = None,
+    **options,
+) -> tuple[list[Path], int, int]:
+    """Reflow one subtitle file and its word timing sidecar.
+
+    Args:
+        input_path: Subtitle file in any registered format
+        output_dir: Directory for the reflowed files (same file name)
+        formats: Output formats (default: the input format)
+        **options: Options for ``reflow``
+
+    Returns:
+        Written paths, input cue count and output cue count
+    """
+    input_path = Path(input_path)
+    segments = read_subtitles(input_path)
+    words_path = words_path_for(input_path)
+    has_words = words_path.exists()
+    if has_words:
+        attach_words(segments, read_words(words_path))
+
+    cues = list(reflow(segments, **options))
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_base = output_dir / input_path.stem
+    formats = formats or [format_for_path(input_path)]
+    paths = write_subtitles(cues, output_base, formats)
+    if has_words:
+        paths.append(write_words(cues, words_path_for(output_base)))
+    return paths, len(segments), len(cues)
@@ -1,10 +1,33 @@
-"""Japanese to Romaji conversion."""
+"""Japanese to Romaji conversion.
 
-import pykakasi
+Conversions are memoized in a SQLite database shared by every process
+(``PROJECT/cache/romaji.sqlite3``), so lines seen before are looked up
+instead of converted, and pykakasi - whose dictionaries take a while to
+load - is only imported when there is something new to convert. This
+module does not depend on Whisper and can be used from Maya.
+"""
 
+import sqlite3
+import threading
+from pathlib import Path
 
-def create_converter() -> pykakasi.kakasi:
+# Shared with the audio cache (PROJECT/cache)
+CACHE_PATH = Path(__file__).parent.parent.parent / "cache" / "romaji.sqlite3"
+
+# Entries kept in the cache; the least recently used are dropped beyond this
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Misses converted in worker processes when there are at least this many
+POOL_THRESHOLD = 2000
+
+# SQLite limits the number of query parameters
+_QUERY_CHUNK = 500
+
+
+def create_converter():
     """Create and configure pykakasi converter."""
+    import pykakasi
+
     kks = pykakasi.kakasi()
     kks.setMode("H", "a")  # Hiragana to ascii
     kks.setMode("K", "a")  # Katakana to ascii
@@ -13,44 +36,257 @@ def create_converter() -> pykakasi.kakasi:
     return kks
 
 
-def to_romaji(text: str, converter: pykakasi.kakasi | None = None) -> str:
+class RomajiCache:
+    """Persistent text -> romaji memo shared across runs and processes.
+
+    Args:
+        path: SQLite database path (default: PROJECT/cache/romaji.sqlite3)
+        max_entries: Entries kept; older ones are evicted on ``trim``
+    """
+
+    def __init__(
+        self, path: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        self.path = Path(path or CACHE_PATH)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by threads (Maya prefetch), serialized by a lock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS romaji ("
+            "text TEXT PRIMARY KEY, romaji TEXT NOT NULL, used INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS romaji_used ON romaji (used)")
+        self._db.commit()
+        # Row count, counted once and then kept up to date by this instance;
+        # rows added by other processes are only seen when it next counts
+        self._count = self._db.execute("SELECT COUNT(*) FROM romaji").fetchone()[0]
+
+    def _clock(self) -> int:
+        row = self._db.execute("SELECT MAX(used) FROM romaji").fetchone()
+        return (row[0] or 0) + 1
+
+    def get_many(self, texts: list[str]) -> dict[str, str]:
+        """Look up texts and mark the hits as recently used.
+
+        Hits are moved up to the newest entries' recency, not past it, and
+        only those older than that are updated, so looking up the same texts
+        again writes nothing.
+
+        Returns:
+            Dict of text -> romaji for the texts found
+        """
+        unique = list(dict.fromkeys(texts))
+        found = {}
+        used = {}
+        with self._lock:
+            for i in range(0, len(unique), _QUERY_CHUNK):
+                chunk = unique[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for text, romaji, last_used in self._db.execute(
+                    "SELECT text, romaji, used FROM romaji "
+                    f"WHERE text IN ({placeholders})",
+                    chunk,
+                ):
+                    found[text] = romaji
+                    used[text] = last_used
+            if found:
+                newest = self._clock() - 1
+                stale = [text for text, last_used in used.items() if last_used < newest]
+                if stale:
+                    self._db.executemany(
+                        "UPDATE romaji SET used = ? WHERE text = ?",
+                        ((newest, text) for text in stale),
+                    )
+                    self._db.commit()
+        return found
+
+    def put_many(self, results: dict[str, str]):
+        """Store conversions and evict old entries beyond ``max_entries``."""
+        if not results:
+            return
+        with self._lock:
+            clock = self._clock()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO romaji (text, romaji, used) VALUES (?, ?, ?)",
+                ((text, romaji, clock) for text, romaji in results.items()),
+            )
+            self._db.commit()
+            # Replaced rows are counted too; trim recounts before evicting
+            self._count += len(results)
+            full = self._count > self.max_entries
+        if full:
+            self.trim()
+
+    def trim(self):
+        """Drop the least recently used entries beyond ``max_entries``.
+
+        Evicts down to 90% of the limit so trimming does not run on every
+        insert once the cache is full. ``put_many`` calls this only once its
+        running row count goes over the limit.
+        """
+        with self._lock:
+            count = self._db.execute("SELECT COUNT(*) FROM romaji").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - int(self.max_entries * 0.9)
+                self._db.execute(
+                    "DELETE FROM romaji WHERE text IN "
+                    "(SELECT text FROM romaji ORDER BY used LIMIT ?)",
+                    (excess,),
+                )
+                self._db.commit()
+                count -= excess
+            self._count = count
+
+    def clear(self):
+        """Delete every entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM romaji")
+            self._db.commit()
+            self._count = 0
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM romaji").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_default_cache = None
+_default_cache_failed = False
+_default_cache_lock = threading.Lock()
+
+
+def get_cache() -> RomajiCache | None:
+    """Get the process-wide cache at the default path.
+
+    Returns:
+        Cache, or None if the cache directory is not writable
+    """
+    global _default_cache, _default_cache_failed
+    with _default_cache_lock:
+        if _default_cache is None and not _default_cache_failed:
+            try:
+                _default_cache = RomajiCache()
+            except (OSError, sqlite3.Error):
+                _default_cache_failed = True
+        return _default_cache
+
+
+# Converter of a worker process, created once by the pool initializer
+_worker_converter = None
+
+
+def _init_worker():
+    global _worker_converter
+    _worker_converter = create_converter()
+
+
+def _convert_chunk(texts: list[str]) -> list[str]:
+    conv = _worker_converter.getConverter()
+    return [conv.do(text) for text in texts]
+
+
+def romanize_texts(
+    texts: list[str],
+    converter=None,
+    cache: RomajiCache | None = None,
+    use_cache: bool = True,
+    workers: int = 1,
+) -> list[str]:
+    """Convert many texts to romaji through the cache.
+
+    Args:
+        texts: Japanese texts
+        converter: Optional pykakasi instance (created only if needed)
+        cache: Cache to use (default: the process-wide cache)
+        use_cache: Set False to always convert
+        workers: Processes used when there are many new texts
+
+    Returns:
+        Romanized texts in the same order
+    """
+    if not use_cache:
+        cache = None
+    elif cache is None:
+        cache = get_cache()
+    results = cache.get_many(texts) if cache is not None else {}
+
+    misses = [text for text in dict.fromkeys(texts) if text not in results]
+    if misses:
+        if workers > 1 and len(misses) >= POOL_THRESHOLD:
+            # Imported here: multiprocessing is slow to import (Maya plug-in load)
+            from concurrent.futures import ProcessPoolExecutor
+
+            size = -(-len(misses) // (workers * 4))
+            chunks = [misses[i : i + size] for i in range(0, len(misses), size)]
+            with ProcessPoolExecutor(workers, initializer=_init_worker) as executor:
+                converted = [
+                    romaji
+                    for chunk in executor.map(_convert_chunk, chunks)
+                    for romaji in chunk
+                ]
+        else:
+            conv = (converter or create_converter()).getConverter()
+            converted = [conv.do(text) for text in misses]
+
+        new = dict(zip(misses, converted))
+        if cache is not None:
+            cache.put_many(new)
+        results.update(new)
+
+    return [results[text] for text in texts]
+
+
+def to_romaji(text: str, converter=None, use_cache: bool = True) -> str:
     """Convert Japanese text to romaji.
 
     Args:
         text: Japanese text to convert
-        converter: Optional pykakasi instance (creates new one if None)
+        converter: Optional pykakasi instance (creates new one if needed)
+        use_cache: Look up and store the result in the persistent cache
 
     Returns:
         Romanized text
     """
-    if converter is None:
-        converter = create_converter()
-    conv = converter.getConverter()
-    return conv.do(text)
+    return romanize_texts([text], converter, use_cache=use_cache)[0]
 
 
 def romanize_segments(
-    segments: list[dict], converter: pykakasi.kakasi | None = None
+    segments: list[dict],
+    converter=None,
+    use_cache: bool = True,
+    workers: int = 1,
 ) -> list[dict]:
     """Convert Japanese segments to romaji.
 
     Args:
         segments: List of dicts with 'start', 'end', 'text' keys
         converter: Optional pykakasi instance
+        use_cache: Look up and store results in the persistent cache
+        workers: Processes used when there are many new lines
 
     Returns:
         New list of segments with romanized text
     """
-    if converter is None:
-        converter = create_converter()
-
-    result = []
-    for seg in segments:
-        result.append(
-            {
-                "start": seg["start"],
-                "end": seg["end"],
-                "text": to_romaji(seg["text"], converter),
-            }
-        )
-    return result
+    texts = romanize_texts(
+        [seg["text"] for seg in segments],
+        converter,
+        use_cache=use_cache,
+        workers=workers,
+    )
+    return [
+        {"start": seg["start"], "end": seg["end"], "text": text}
+        for seg, text in zip(segments, texts)
+    ]
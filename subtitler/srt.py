@@ -3,33 +3,59 @@
 import re
 from pathlib import Path
 
+from .subidx import open_index
+from .timecode import from_ms, to_ms
 
-def parse_timestamp(timestamp: str) -> float:
-    """Parse SRT timestamp to seconds.
+_TIMESTAMP_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})")
+
+
+def parse_timestamp_ms(timestamp: str) -> int:
+    """Parse SRT timestamp to integer milliseconds.
 
     Args:
         timestamp: SRT format timestamp (HH:MM:SS,mmm)
 
     Returns:
-        Time in seconds
+        Time in milliseconds
     """
-    match = re.match(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})", timestamp)
+    match = _TIMESTAMP_RE.match(timestamp)
     if not match:
-        return 0.0
+        return 0
 
     hours, minutes, seconds, millis = map(int, match.groups())
-    return hours * 3600 + minutes * 60 + seconds + millis / 1000
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
+
+
+def parse_timestamp(timestamp: str) -> float:
+    """Parse SRT timestamp to seconds.
+
+    Args:
+        timestamp: SRT format timestamp (HH:MM:SS,mmm)
+
+    Returns:
+        Time in seconds
+    """
+    return from_ms(parse_timestamp_ms(timestamp))
 
 
-def parse_srt(srt_path: Path) -> list[dict]:
+def parse_srt(srt_path: Path, use_index: bool = True) -> list[dict]:
     """Parse SRT file to list of segments.
 
+    Uses the binary sidecar index when it is present and up to date.
+
     Args:
         srt_path: Path to SRT file
+        use_index: Read from the sidecar index if available
 
     Returns:
         List of dicts with 'start', 'end', 'text' keys
     """
+    if use_index:
+        index = open_index(srt_path)
+        if index is not None:
+            with index:
+                return index.segments()
+
     segments = []
 
     with open(srt_path, "r", encoding="utf-8") as f:
@@ -55,8 +81,8 @@ def parse_srt(srt_path: Path) -> list[dict]:
             continue
 
         start_str, end_str = match.groups()
-        start = parse_timestamp(start_str.strip())
-        end = parse_timestamp(end_str.strip())
+        start = from_ms(parse_timestamp_ms(start_str.strip()))
+        end = from_ms(parse_timestamp_ms(end_str.strip()))
         text = " ".join(text_lines)
 
         segments.append({"start": start, "end": end, "text": text})
@@ -64,15 +90,31 @@ def parse_srt(srt_path: Path) -> list[dict]:
     return segments
 
 
-def format_timestamp(seconds: float) -> str:
-    """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
+def format_timestamp_ms(millis: int) -> str:
+    """Convert integer milliseconds to SRT timestamp format (HH:MM:SS,mmm)."""
+    secs, millis = divmod(max(millis, 0), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
+def format_timestamp(seconds: float) -> str:
+    """Convert seconds to SRT timestamp format (HH:MM:SS,mmm).
+
+    Rounds to the nearest millisecond, so float error such as
+    1.0009999 -> 1.001 does not truncate to the previous millisecond.
+    """
+    return format_timestamp_ms(to_ms(seconds))
+
+
+def format_srt_cue(index: int, segment: dict) -> str:
+    """Format one segment as an SRT cue block."""
+    start = format_timestamp(segment["start"])
+    end = format_timestamp(segment["end"])
+    text = segment["text"].strip()
+    return f"{index}\n{start} --> {end}\n{text}\n\n"
+
+
 def write_srt(segments: list[dict], output_path: Path) -> None:
     """Write segments to SRT file.
 
@@ -81,8 +123,6 @@ def write_srt(segments: list[dict], output_path: Path) -> None:
         output_path: Path to output SRT file
     """
     with open(output_path, "w", encoding="utf-8") as f:
-        for i, segment in enumerate(segments, start=1):
-            start = format_timestamp(segment["start"])
-            end = format_timestamp(segment["end"])
-            text = segment["text"].strip()
-            f.write(f"{i}\n{start} --> {end}\n{text}\n\n")
+        f.writelines(
+            format_srt_cue(i, segment) for i, segment in enumerate(segments, start=1)
+        )
@@ -0,0 +1,235 @@
+"""Compact binary subtitle index (.subidx).
+
+Layout (little-endian):
+    header   magic "SIDX", version, flags, cue count, source size, source mtime
+    starts   uint32[count]     cue start times in milliseconds (sorted)
+    ends     uint32[count]     cue end times in milliseconds
+    offsets  uint32[count + 1] byte offsets of each cue text in the blob
+    blob     UTF-8 text of all cues, concatenated
+"""
+
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from .timecode import from_ms, to_ms
+
+INDEX_SUFFIX = ".subidx"
+INDEX_MAGIC = b"SIDX"
+INDEX_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIqq")
+
+
+def index_path_for(srt_path: Path) -> Path:
+    """Get the sidecar index path for a subtitle file."""
+    srt_path = Path(srt_path)
+    return srt_path.with_name(srt_path.name + INDEX_SUFFIX)
+
+
+def build_index(
+    segments: list[dict], source_size: int = 0, source_mtime_ns: int = 0
+) -> bytes:
+    """Pack segments into the binary index format.
+
+    Args:
+        segments: List of dicts with 'start', 'end', 'text' keys (seconds)
+        source_size: Size of the source subtitle file in bytes
+        source_mtime_ns: Modification time of the source file in nanoseconds
+
+    Returns:
+        Index file contents
+    """
+    ordered = sorted(segments, key=lambda seg: seg["start"])
+    count = len(ordered)
+
+    starts = [to_ms(seg["start"]) for seg in ordered]
+    ends = [to_ms(seg["end"]) for seg in ordered]
+    texts = [seg["text"].strip().encode("utf-8") for seg in ordered]
+
+    offsets = [0]
+    for text in texts:
+        offsets.append(offsets[-1] + len(text))
+
+    header = _HEADER.pack(
+        INDEX_MAGIC, INDEX_VERSION, 0, count, source_size, source_mtime_ns
+    )
+    return b"".join(
+        [
+            header,
+            struct.pack(f"<{count}I", *starts),
+            struct.pack(f"<{count}I", *ends),
+            struct.pack(f"<{count + 1}I", *offsets),
+            *texts,
+        ]
+    )
+
+
+class SubtitleIndex:
+    """Read-only view over a binary subtitle index.
+
+    Timestamp and offset arrays are typed views on the underlying buffer,
+    so opening an index copies nothing and cue text is only decoded when
+    it is requested.
+    """
+
+    def __init__(self, buffer):
+        if sys.byteorder != "little":
+            raise ValueError("Subtitle index requires a little-endian host")
+
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        try:
+            self._read_header(self._view)
+        except ValueError:
+            # Release the views now: a caller closing the mapping cannot while
+            # the traceback keeps them alive
+            self._release()
+            raise
+
+    def _read_header(self, view: memoryview) -> None:
+        if len(view) < _HEADER.size:
+            raise ValueError("Subtitle index is truncated")
+
+        magic, version, _flags, count, size, mtime_ns = _HEADER.unpack_from(view)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("Not a subtitle index")
+
+        pos = _HEADER.size
+        array_end = pos + (3 * count + 1) * 4
+        if len(view) < array_end:
+            raise ValueError("Subtitle index is truncated")
+
+        self.source_size = size
+        self.source_mtime_ns = mtime_ns
+        self.starts = view[pos : pos + count * 4].cast("I")
+        pos += count * 4
+        self.ends = view[pos : pos + count * 4].cast("I")
+        pos += count * 4
+        self.offsets = view[pos : pos + (count + 1) * 4].cast("I")
+        self._blob = view[array_end:]
+
+        if self.offsets[count] > len(self._blob):
+            raise ValueError("Subtitle index is truncated")
+
+    def _release(self) -> None:
+        for name in ("starts", "ends", "offsets", "_blob"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._view.release()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def text(self, i: int) -> str:
+        """Decode the text of cue ``i``."""
+        return str(self._blob[self.offsets[i] : self.offsets[i + 1]], "utf-8")
+
+    def find(self, time_ms: int) -> int:
+        """Find the cue shown at ``time_ms``.
+
+        Returns:
+            Cue index, or -1 if no cue is active
+        """
+        i = bisect_right(self.starts, time_ms) - 1
+        if i >= 0 and time_ms < self.ends[i]:
+            return i
+        return -1
+
+    def next_cue(self, time_ms: int) -> int:
+        """Find the first cue starting after ``time_ms``.
+
+        Returns:
+            Cue index, or -1 if there is none
+        """
+        i = bisect_right(self.starts, time_ms)
+        return i if i < len(self) else -1
+
+    def previous_cue(self, time_ms: int) -> int:
+        """Find the last cue starting before ``time_ms``.
+
+        Returns:
+            Cue index, or -1 if there is none
+        """
+        return bisect_left(self.starts, time_ms) - 1
+
+    def segments(self) -> list[dict]:
+        """Convert the index back to a list of segments."""
+        return [
+            {
+                "start": from_ms(self.starts[i]),
+                "end": from_ms(self.ends[i]),
+                "text": self.text(i),
+            }
+            for i in range(len(self))
+        ]
+
+    def close(self) -> None:
+        """Release the underlying buffer."""
+        self._release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def write_index(srt_path: Path, segments: list[dict], index_path: Path | None = None):
+    """Write the sidecar index for a subtitle file.
+
+    Args:
+        srt_path: Path to the source subtitle file
+        segments: Segments parsed from the source file
+        index_path: Output path (default: next to the source file)
+
+    Returns:
+        Path to the written index
+    """
+    if index_path is None:
+        index_path = index_path_for(srt_path)
+
+    stat = os.stat(srt_path)
+    data = build_index(segments, stat.st_size, stat.st_mtime_ns)
+
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def open_index(srt_path: Path) -> SubtitleIndex | None:
+    """Memory-map the sidecar index of a subtitle file.
+
+    Args:
+        srt_path: Path to the source subtitle file
+
+    Returns:
+        SubtitleIndex, or None if the index is missing, stale or unreadable
+    """
+    index_path = index_path_for(srt_path)
+    try:
+        stat = os.stat(srt_path)
+        with open(index_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        index = SubtitleIndex(buffer)
+    except ValueError:
+        buffer.close()
+        return None
+
+    if index.source_size != stat.st_size or index.source_mtime_ns != stat.st_mtime_ns:
+        index.close()
+        return None
+
+    return index
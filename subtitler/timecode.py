@@ -0,0 +1,16 @@
+"""Integer millisecond time helpers.
+
+Subtitle times are handled as integer milliseconds so that parsing,
+writing and frame lookups never accumulate float error. Segment dicts keep
+Whisper's 'start'/'end' seconds; convert them with ``to_ms`` at the edges.
+"""
+
+
+def to_ms(seconds: float) -> int:
+    """Convert seconds to the nearest integer millisecond."""
+    return round(seconds * 1000)
+
+
+def from_ms(millis: int) -> float:
+    """Convert integer milliseconds to seconds."""
+    return millis / 1000
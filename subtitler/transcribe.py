@@ -2,72 +2,219 @@
 
 from pathlib import Path
 
+import numpy as np
+import torch
 import whisper
 
+from .audio import SAMPLE_RATE, as_samples
+
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 MODELS_DIR = PROJECT_ROOT / "models"
 
 
+PRECISIONS = ("auto", "fp32", "fp16", "int8")
+
+# Segment keys kept from the decoder output (plus 'words' when present); the
+# confidence values are used by ``filters.filter_segments``
+SEGMENT_KEYS = (
+    "start",
+    "end",
+    "text",
+    "avg_logprob",
+    "no_speech_prob",
+    "compression_ratio",
+)
+
+
 def load_model(
-    model_name: str = "base", download_root: Path | None = None
+    model_name: str = "base",
+    download_root: Path | None = None,
+    device: str | None = None,
+    threads: int | None = None,
+    precision: str = "auto",
 ) -> whisper.Whisper:
     """Load Whisper model.
 
     Args:
         model_name: Model size - tiny, base, small, medium, large
         download_root: Directory to save/load models (default: PROJECT/models)
+        device: Torch device such as "cpu" or "cuda" (default: CUDA if available)
+        threads: Torch intra-op thread count (default: all cores)
+        precision: auto, fp32, fp16 (CUDA only) or int8 (CPU only; dynamic
+            quantization of the linear layers)
 
     Returns:
         Loaded Whisper model
     """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision}")
+    if device in (None, "auto"):
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    if precision == "fp16" and not device.startswith("cuda"):
+        raise ValueError("fp16 precision requires a CUDA device")
+    if precision == "int8" and device != "cpu":
+        raise ValueError("int8 precision is only supported on the CPU")
+
+    if threads:
+        torch.set_num_threads(threads)
+
     if download_root is None:
         download_root = MODELS_DIR
     download_root.mkdir(parents=True, exist_ok=True)
-    return whisper.load_model(model_name, download_root=str(download_root))
+    model = whisper.load_model(
+        model_name, device=device, download_root=str(download_root)
+    )
+
+    if precision == "int8":
+        model = quantize_model(model)
+    return model
+
+
+def quantize_model(model: whisper.Whisper) -> whisper.Whisper:
+    """Quantize the linear layers of a CPU model to int8.
+
+    Whisper's own ``Linear`` subclass is not recognised by torch's dynamic
+    quantization, so those layers are swapped for plain ``nn.Linear``
+    sharing the same weights first.
+
+    Args:
+        model: Whisper model on the CPU
+
+    Returns:
+        Quantized model (weights int8, activations quantized per batch)
+    """
+    linear_type = torch.nn.Linear
+    for module in list(model.modules()):
+        for name, child in module.named_children():
+            if isinstance(child, linear_type) and type(child) is not linear_type:
+                linear = linear_type(
+                    child.in_features, child.out_features, bias=child.bias is not None
+                )
+                linear.weight = child.weight
+                linear.bias = child.bias
+                setattr(module, name, linear)
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {linear_type}, dtype=torch.qint8
+    )
+
+
+def use_fp16(model: whisper.Whisper, precision: str = "auto") -> bool:
+    """Decide whether decoding runs in half precision.
+
+    Args:
+        model: Loaded Whisper model
+        precision: Precision passed to ``load_model``
+
+    Returns:
+        True for fp16, or for auto on a CUDA device
+    """
+    if precision == "auto":
+        return model.device.type == "cuda"
+    return precision == "fp16"
+
+
+def compact_segments(segments: list[dict]) -> list[dict]:
+    """Keep only ``SEGMENT_KEYS`` and 'words' of decoder segments.
+
+    The token ids, seek offset and temperature of each segment are dropped;
+    for long recordings the token lists are most of the transcript's memory.
+    """
+    compact = []
+    for segment in segments:
+        result = {key: segment[key] for key in SEGMENT_KEYS if key in segment}
+        if "words" in segment:
+            result["words"] = segment["words"]
+        compact.append(result)
+    return compact
 
 
 def transcribe_audio(
-    audio_path: Path,
+    audio_path: Path | np.ndarray,
     model: whisper.Whisper,
     language: str = "ja",
+    word_timestamps: bool = False,
+    fp16: bool | None = None,
+    precision: str = "auto",
 ) -> list[dict]:
     """Transcribe audio file to Japanese text.
 
     Args:
-        audio_path: Path to audio file (mp3, wav)
+        audio_path: Path to audio file (mp3, wav), decoded through the PCM
+            cache, or 16 kHz float32 samples
         model: Loaded Whisper model
         language: Source language code
+        word_timestamps: Keep per-word timings in each segment's 'words'
+        fp16: Decode in half precision (default: decided by ``precision``)
+        precision: Precision the model was loaded with (see ``use_fp16``)
 
     Returns:
-        List of segments with 'start', 'end', 'text' keys
+        List of segments with 'start', 'end', 'text' keys and the
+        confidence values 'avg_logprob', 'no_speech_prob' and
+        'compression_ratio'
     """
     result = model.transcribe(
-        str(audio_path),
+        as_samples(audio_path),
         language=language,
         task="transcribe",
+        word_timestamps=word_timestamps,
+        fp16=use_fp16(model, precision) if fp16 is None else fp16,
     )
-    return result["segments"]
+    return compact_segments(result["segments"])
 
 
 def translate_audio(
-    audio_path: Path,
+    audio_path: Path | np.ndarray,
     model: whisper.Whisper,
     language: str = "ja",
+    fp16: bool | None = None,
+    precision: str = "auto",
 ) -> list[dict]:
     """Translate audio to English text.
 
     Args:
-        audio_path: Path to audio file (mp3, wav)
+        audio_path: Path to audio file (mp3, wav), decoded through the PCM
+            cache, or 16 kHz float32 samples
         model: Loaded Whisper model
         language: Source language code
+        fp16: Decode in half precision (default: decided by ``precision``)
+        precision: Precision the model was loaded with (see ``use_fp16``)
 
     Returns:
-        List of segments with 'start', 'end', 'text' keys
+        List of segments with 'start', 'end', 'text' keys and the
+        confidence values (see ``transcribe_audio``)
     """
     result = model.transcribe(
-        str(audio_path),
+        as_samples(audio_path),
         language=language,
         task="translate",
+        fp16=use_fp16(model, precision) if fp16 is None else fp16,
     )
-    return result["segments"]
+    return compact_segments(result["segments"])
+
+
+def detect_language(
+    audio_path: Path | np.ndarray,
+    model: whisper.Whisper,
+    duration: float = 30.0,
+) -> tuple[str, float]:
+    """Detect the spoken language from the start of the audio.
+
+    Only the first ``duration`` seconds (one 30 second Whisper window by
+    default) are encoded, so this costs a fraction of a transcription.
+
+    Args:
+        audio_path: Path to audio file (mp3, wav) or 16 kHz float32 samples
+        model: Loaded multilingual Whisper model
+        duration: Length of the prefix to analyse in seconds
+
+    Returns:
+        Language code and its probability
+    """
+    prefix = as_samples(audio_path)[: int(duration * SAMPLE_RATE)]
+    audio = whisper.pad_or_trim(np.asarray(prefix, dtype=np.float32))
+    mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels).to(model.device)
+    _, probs = model.detect_language(mel)
+    language = max(probs, key=probs.get)
+    return language, probs[language]
@@ -0,0 +1,130 @@
+"""Word-level timestamp sidecar.
+
+Whisper's word timings are stored per cue as flat integer arrays next to
+the subtitle file (``foo_ja.srt`` -> ``foo_ja.words.json``)::
+
+    {"version": 1, "cues": [
+        {"start": 1000,                 # cue start (ms), matches the SRT
+         "spans": [0, 5, 6, 11],        # word character ranges in cue text
+         "times": [1000, 1400, 1500, 2100]},  # word start/end (ms)
+        ...
+    ]}
+
+Character ranges index into the stripped cue text as written to the
+subtitle file, so readers can map them onto wrapped lines.
+"""
+
+import json
+from pathlib import Path
+
+from .timecode import from_ms, to_ms
+
+WORDS_SUFFIX = ".words.json"
+WORDS_VERSION = 1
+
+
+def words_path_for(subtitle_path: Path) -> Path:
+    """Get the word timing sidecar path for a subtitle file or output base."""
+    subtitle_path = Path(subtitle_path)
+    if subtitle_path.suffix in (".srt", ".vtt", ".ass", ".ssa", ".jsonl"):
+        subtitle_path = subtitle_path.with_suffix("")
+    return subtitle_path.with_name(subtitle_path.name + WORDS_SUFFIX)
+
+
+def word_spans(segment: dict) -> tuple[list[int], list[int]]:
+    """Locate the words of a Whisper segment in its text.
+
+    Args:
+        segment: Segment with 'text' and 'words' (each 'word', 'start', 'end')
+
+    Returns:
+        Flat character ranges and flat start/end times in milliseconds
+    """
+    text = segment["text"].strip()
+    spans = []
+    times = []
+    pos = 0
+
+    for word in segment.get("words") or []:
+        token = word["word"].strip()
+        if not token:
+            continue
+
+        start = text.find(token, pos)
+        if start < 0:
+            # Whisper normalised the token; keep the words in order anyway
+            start = min(pos, len(text))
+        end = min(start + len(token), len(text))
+        pos = end
+
+        spans += [start, end]
+        times += [to_ms(word["start"]), to_ms(word["end"])]
+
+    return spans, times
+
+
+def write_words(segments: list[dict], output_path: Path) -> Path:
+    """Write the word timing sidecar for transcribed segments.
+
+    Args:
+        segments: Segments from ``transcribe_audio(..., word_timestamps=True)``
+        output_path: Path to the sidecar file
+
+    Returns:
+        Path to the written sidecar
+    """
+    cues = []
+    for segment in segments:
+        spans, times = word_spans(segment)
+        cues.append({"start": to_ms(segment["start"]), "spans": spans, "times": times})
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({"version": WORDS_VERSION, "cues": cues}, f, separators=(",", ":"))
+    return output_path
+
+
+def read_words(sidecar_path: Path) -> dict[int, tuple[list[int], list[int]]]:
+    """Read a word timing sidecar.
+
+    Args:
+        sidecar_path: Path to the sidecar file
+
+    Returns:
+        Dict of cue start (ms) -> (flat character ranges, flat times in ms)
+    """
+    with open(sidecar_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if data.get("version") != WORDS_VERSION:
+        raise ValueError(f"Unsupported word timing version: {data.get('version')}")
+
+    return {cue["start"]: (cue["spans"], cue["times"]) for cue in data["cues"]}
+
+
+def attach_words(
+    segments: list[dict], words: dict[int, tuple[list[int], list[int]]]
+) -> list[dict]:
+    """Restore Whisper-style 'words' on segments read from a subtitle file.
+
+    Args:
+        segments: Segments with 'start', 'end', 'text' keys
+        words: Sidecar data from ``read_words``
+
+    Returns:
+        The same segments; those with word timings gain 'words'
+    """
+    for segment in segments:
+        entry = words.get(to_ms(segment["start"]))
+        if entry is None:
+            continue
+        text = segment["text"].strip()
+        spans, times = entry
+        segment["words"] = [
+            {
+                "word": text[spans[i] : spans[i + 1]],
+                "start": from_ms(times[i]),
+                "end": from_ms(times[i + 1]),
+            }
+            for i in range(0, len(spans), 2)
+        ]
+    return segments
@@ -0,0 +1,29 @@
+"""Shared fixtures.
+
+Plug-in tests run headless on the Maya stand-in from ``benchmarks/``.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+if str(BENCH_DIR) not in sys.path:
+    sys.path.insert(0, str(BENCH_DIR))
+
+
+@pytest.fixture
+def locator():
+    """A freshly loaded subtitleLocator plug-in module."""
+    import harness
+
+    return harness.load_plugin()
+
+
+@pytest.fixture
+def segments():
+    """Ten short segments, one every two seconds."""
+    return [
+        {"start": i * 2.0, "end": i * 2.0 + 1.5, "text": f"cue {i}"} for i in range(10)
+    ]
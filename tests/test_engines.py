@@ -0,0 +1,154 @@
+"""Conformance tests for the transcription engines.
+
+Every registered engine runs through the ``Engine`` interface on stub
+backends (no models are downloaded), and its output is checked with the
+same ``check_segments`` that ``subtitler bench --conformance`` uses.
+"""
+
+import sys
+import types
+from collections import namedtuple
+
+import numpy as np
+import pytest
+
+pytest.importorskip("whisper")
+
+from subtitler import engines
+from subtitler.audio import SAMPLE_RATE
+from subtitler.bench import check_segments
+from subtitler.transcribe import SEGMENT_KEYS
+
+DURATION = 6.0
+
+_Word = namedtuple("_Word", "word start end probability")
+_Segment = namedtuple(
+    "_Segment",
+    "start end text avg_logprob compression_ratio no_speech_prob words",
+)
+_Info = namedtuple("_Info", "language language_probability")
+
+
+def _stub_segments(word_timestamps):
+    segments = []
+    for i in range(3):
+        start = i * 2.0
+        segment = {
+            "start": start,
+            "end": start + 1.5,
+            "text": f"segment {i}",
+            "avg_logprob": -0.3,
+            "no_speech_prob": 0.1,
+            "compression_ratio": 1.2,
+        }
+        if word_timestamps:
+            segment["words"] = [
+                {"word": "segment", "start": start, "end": start + 0.7},
+                {"word": f" {i}", "start": start + 0.8, "end": start + 1.5},
+            ]
+        segments.append(segment)
+    return segments
+
+
+class _StubWhisperModel:
+    """Stand-in for faster_whisper.WhisperModel."""
+
+    def __init__(self, model_name, **options):
+        self.options = options
+
+    def transcribe(self, audio, language=None, task="transcribe", **options):
+        assert isinstance(audio, np.ndarray)
+        word_timestamps = options.get("word_timestamps", False)
+        segments = (
+            _Segment(
+                segment["start"],
+                segment["end"],
+                segment["text"],
+                segment["avg_logprob"],
+                segment["compression_ratio"],
+                segment["no_speech_prob"],
+                [_Word(probability=0.9, **word) for word in segment["words"]]
+                if word_timestamps
+                else None,
+            )
+            for segment in _stub_segments(word_timestamps)
+        )
+        return segments, _Info("ja", 0.9)
+
+
+@pytest.fixture
+def stub_backends(monkeypatch):
+    """Replace the model backends of the built-in engines."""
+    monkeypatch.setattr(engines, "load_model", lambda *args, **kwargs: object())
+    monkeypatch.setattr(engines, "detect_language", lambda audio, model: ("ja", 0.9))
+    monkeypatch.setattr(
+        engines,
+        "transcribe_audio",
+        lambda audio, model, word_timestamps=False, **kwargs: _stub_segments(
+            word_timestamps
+        ),
+    )
+    monkeypatch.setattr(
+        engines, "translate_audio", lambda audio, model, **kwargs: _stub_segments(False)
+    )
+    monkeypatch.setattr(
+        engines, "as_samples", lambda audio: np.zeros(int(DURATION * SAMPLE_RATE))
+    )
+    module = types.ModuleType("faster_whisper")
+    module.WhisperModel = _StubWhisperModel
+    monkeypatch.setitem(sys.modules, "faster_whisper", module)
+
+
+@pytest.mark.parametrize("name", sorted(engines.ENGINES))
+def test_engine_conformance(stub_backends, tmp_path, name):
+    engine = engines.get_engine(name, model_name="tiny", download_root=tmp_path)
+    assert isinstance(engine, engines.Engine)
+    engine.load()
+
+    language, probability = engine.detect_language(tmp_path / "clip.wav")
+    assert isinstance(language, str)
+    assert 0.0 <= probability <= 1.0
+
+    segments = engine.transcribe(
+        tmp_path / "clip.wav", language="ja", word_timestamps=True
+    )
+    assert segments
+    assert check_segments(segments, DURATION, words=True) == []
+    for segment in segments:
+        assert set(SEGMENT_KEYS) <= segment.keys()
+
+    translated = engine.translate(np.zeros(int(DURATION * SAMPLE_RATE)))
+    assert check_segments(translated, DURATION, words=False) == []
+
+
+def test_whisper_engine_decodes_in_its_precision(stub_backends, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        engines, "transcribe_audio", lambda *args, **kwargs: calls.append(kwargs) or []
+    )
+    monkeypatch.setattr(
+        engines, "translate_audio", lambda *args, **kwargs: calls.append(kwargs) or []
+    )
+    engine = engines.get_engine("whisper", precision="fp32")
+    engine.transcribe(np.zeros(SAMPLE_RATE))
+    engine.translate(np.zeros(SAMPLE_RATE))
+    assert [kwargs["precision"] for kwargs in calls] == ["fp32", "fp32"]
+
+
+def test_incomplete_engine_is_rejected():
+    class PartialEngine(engines.Engine):
+        name = "partial"
+
+        def transcribe(self, audio_path, language="ja", word_timestamps=False):
+            return []
+
+    with pytest.raises(TypeError, match="detect_language, translate"):
+        engines.register_engine(PartialEngine)
+    with pytest.raises(TypeError):
+        PartialEngine()
+    assert "partial" not in engines.ENGINES
+
+
+def test_compute_types_are_read_only():
+    with pytest.raises(TypeError):
+        engines.FasterWhisperEngine.COMPUTE_TYPES["fp64"] = "float64"
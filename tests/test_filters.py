@@ -0,0 +1,90 @@
+"""Tests for segment confidence filtering."""
+
+import pytest
+
+from subtitler.filters import (
+    FLAG_PREFIX,
+    LOW_CONFIDENCE,
+    NO_SPEECH,
+    REPEATED,
+    REPETITIVE,
+    classify_segments,
+    describe_reasons,
+    filter_segments,
+)
+
+
+def _segment(text, avg_logprob=-0.2, no_speech_prob=0.1, compression_ratio=1.5):
+    return {
+        "start": 0.0,
+        "end": 1.0,
+        "text": text,
+        "avg_logprob": avg_logprob,
+        "no_speech_prob": no_speech_prob,
+        "compression_ratio": compression_ratio,
+    }
+
+
+def test_confident_speech_is_kept():
+    assert classify_segments([_segment("hello")]).tolist() == [0]
+
+
+def test_low_confidence():
+    reasons = classify_segments([_segment("hello", avg_logprob=-1.5)])
+    assert reasons.tolist() == [LOW_CONFIDENCE]
+
+
+def test_no_speech_needs_low_confidence():
+    reasons = classify_segments(
+        [
+            _segment("noise", avg_logprob=-1.5, no_speech_prob=0.9),
+            _segment("speech", avg_logprob=-0.2, no_speech_prob=0.9),
+        ]
+    )
+    assert reasons.tolist() == [LOW_CONFIDENCE | NO_SPEECH, 0]
+
+
+def test_no_speech_without_logprob():
+    segment = _segment("noise", no_speech_prob=0.9)
+    segment["avg_logprob"] = None
+    assert classify_segments([segment]).tolist() == [NO_SPEECH]
+
+
+def test_repetitive():
+    reasons = classify_segments([_segment("la la la", compression_ratio=3.0)])
+    assert reasons.tolist() == [REPETITIVE]
+
+
+def test_repeated():
+    segments = [_segment(text) for text in ("Yes.", "yes. ", "No.", "Yes.")]
+    assert classify_segments(segments).tolist() == [0, REPEATED, 0, REPEATED]
+    assert classify_segments(segments, repeat_window=0).tolist() == [0, 0, 0, 0]
+
+
+def test_segments_without_confidence_values():
+    segments = [{"start": 0.0, "end": 1.0, "text": "a"}] * 2
+    assert classify_segments(segments).tolist() == [0, REPEATED]
+
+
+def test_drop_keeps_confident_speech_with_high_no_speech_prob():
+    segments = [
+        _segment("speech over music", no_speech_prob=0.95),
+        _segment("hallucination", avg_logprob=-2.0, no_speech_prob=0.95),
+    ]
+    kept, reasons = filter_segments(segments, "drop")
+    assert kept == [segments[0]]
+    assert describe_reasons(reasons) == "1 segment: 1 low confidence, 1 no speech"
+
+
+def test_flag_prefixes_copies():
+    segments = [_segment("ok"), _segment("bad", avg_logprob=-2.0)]
+    flagged, _ = filter_segments(segments, "flag")
+    assert [s["text"] for s in flagged] == ["ok", FLAG_PREFIX + "bad"]
+    assert segments[1]["text"] == "bad"
+
+
+def test_off_and_unknown_mode():
+    segments = [_segment("bad", avg_logprob=-2.0)]
+    assert filter_segments(segments, "off")[0] == segments
+    with pytest.raises(ValueError):
+        filter_segments(segments, "delete")
@@ -0,0 +1,101 @@
+"""Round-trip tests for the subtitle format writers and readers."""
+
+import pytest
+
+from subtitler.formats import (
+    READERS,
+    WRITERS,
+    format_for_path,
+    parse_formats,
+    read_subtitles,
+    write_subtitles,
+)
+from subtitler.timecode import to_ms
+
+SEGMENTS = [
+    {"start": 0.0, "end": 1.234, "text": "Hello there"},
+    {"start": 1.5, "end": 3.0, "text": "今日はいい天気ですね"},
+    {"start": 3661.005, "end": 3662.5, "text": "one hour later"},
+]
+
+
+def _times_ms(segments):
+    return [(to_ms(s["start"]), to_ms(s["end"])) for s in segments]
+
+
+@pytest.mark.parametrize("name", ["srt", "vtt", "jsonl"])
+def test_round_trip(tmp_path, name):
+    (path,) = write_subtitles(SEGMENTS, tmp_path / "clip", [name])
+    segments = read_subtitles(path)
+
+    assert [s["text"] for s in segments] == [s["text"] for s in SEGMENTS]
+    assert _times_ms(segments) == _times_ms(SEGMENTS)
+
+
+def test_ass_round_trip_to_the_centisecond(tmp_path):
+    (path,) = write_subtitles(SEGMENTS, tmp_path / "clip", ["ass"])
+    segments = read_subtitles(path)
+
+    assert [s["text"] for s in segments] == [s["text"] for s in SEGMENTS]
+    for read, written in zip(segments, SEGMENTS, strict=True):
+        assert abs(to_ms(read["start"]) - to_ms(written["start"])) <= 5
+        assert abs(to_ms(read["end"]) - to_ms(written["end"])) <= 5
+
+
+@pytest.mark.parametrize("name", list(WRITERS))
+@pytest.mark.parametrize("text", ["a < b", "R&D", "{x} & <i>y</i>", "&lt;"])
+def test_markup_characters_round_trip(tmp_path, name, text):
+    segment = {"start": 0.0, "end": 1.0, "text": text}
+    (path,) = write_subtitles([segment], tmp_path / "clip", [name])
+
+    assert [s["text"] for s in read_subtitles(path)] == [text]
+
+
+def test_write_every_format_in_one_pass(tmp_path):
+    paths = write_subtitles(SEGMENTS, tmp_path / "clip", list(WRITERS))
+
+    assert sorted(path.suffix for path in paths) == sorted(
+        extension for extension, _, _ in WRITERS.values()
+    )
+    for path in paths:
+        assert len(read_subtitles(path)) == len(SEGMENTS)
+
+
+def test_vtt_reader_skips_header_notes_and_tags(tmp_path):
+    path = tmp_path / "clip.vtt"
+    path.write_text(
+        "WEBVTT\n\nNOTE a comment\n\n"
+        "intro\n00:01.000 --> 00:02.500\n<v Anna>Hi</v>\n<i>there</i>\n",
+        encoding="utf-8",
+    )
+
+    assert read_subtitles(path) == [{"start": 1.0, "end": 2.5, "text": "Hi there"}]
+
+
+def test_ass_reader_uses_the_format_line(tmp_path):
+    path = tmp_path / "clip.ass"
+    path.write_text(
+        "[Script Info]\nTitle: x\n\n[Events]\n"
+        "Format: Layer, Start, End, Style, Text\n"
+        "Dialogue: 0,0:00:01.50,0:00:02.00,Default,{\\i1}a, b{\\i0}\\Nc\n",
+        encoding="utf-8",
+    )
+
+    assert read_subtitles(path) == [{"start": 1.5, "end": 2.0, "text": "a, b c"}]
+
+
+def test_parse_formats():
+    assert parse_formats(" srt, vtt ,") == ["srt", "vtt"]
+    with pytest.raises(ValueError, match="Unknown format: txt"):
+        parse_formats("srt,txt")
+    with pytest.raises(ValueError, match="more than once: srt"):
+        parse_formats("srt,vtt,srt")
+
+
+def test_format_for_path():
+    assert format_for_path("clip.VTT") == "vtt"
+    with pytest.raises(ValueError):
+        format_for_path("clip.txt")
+    assert set(READERS) >= {".srt", ".vtt", ".ass", ".ssa", ".jsonl"}
+    with pytest.raises(ValueError):
+        read_subtitles("clip.txt")
@@ -0,0 +1,163 @@
+"""Tests for incremental re-transcription of edited audio."""
+
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("whisper")
+
+from subtitler import cli
+from subtitler.incremental import (
+    WINDOW,
+    compute_fingerprint,
+    diff_fingerprints,
+    fingerprint_path_for,
+    load_fingerprint,
+    save_fingerprint,
+    update_segments,
+)
+
+SECONDS = 20
+
+
+class _RecordingEngine:
+    """Returns one segment per second of audio it is given."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, language="ja", word_timestamps=False):
+        self.calls.append(len(audio) / WINDOW)
+        return [
+            {"start": float(i), "end": i + 0.8, "text": f"new {i}"}
+            for i in range(int(len(audio) // WINDOW))
+        ]
+
+
+def _audio(seconds, seed):
+    return np.random.default_rng(seed).uniform(-0.5, 0.5, seconds * WINDOW)
+
+
+def _segments(seconds):
+    return [
+        {"start": float(i), "end": i + 0.8, "text": f"old {i}"} for i in range(seconds)
+    ]
+
+
+def _edit(old, start, old_end, insert):
+    return np.concatenate([old[: start * WINDOW], insert, old[old_end * WINDOW :]])
+
+
+def test_unchanged_audio():
+    audio = _audio(SECONDS, 0)
+    fingerprint = compute_fingerprint(audio)
+    assert diff_fingerprints(fingerprint, compute_fingerprint(audio.copy())) is None
+
+
+def test_diff_same_length_edit():
+    old = _audio(SECONDS, 0)
+    new = _edit(old, 8, 10, _audio(2, 1))
+
+    start, old_end, new_end = diff_fingerprints(
+        compute_fingerprint(old), compute_fingerprint(new)
+    )
+    assert start <= 8 * WINDOW
+    assert 10 * WINDOW <= old_end == new_end
+
+
+def test_diff_longer_pickup():
+    old = _audio(SECONDS, 0)
+    new = _edit(old, 8, 10, _audio(5, 1))
+
+    start, old_end, new_end = diff_fingerprints(
+        compute_fingerprint(old), compute_fingerprint(new)
+    )
+    assert start == 8 * WINDOW
+    assert (old_end, new_end) == (10 * WINDOW, 13 * WINDOW)
+
+
+def test_diff_ignores_float_noise():
+    # Decoded 16-bit audio, then float error well below one LSB
+    audio = np.round(_audio(SECONDS, 0) * 32767.0) / 32767.0
+    noisy = audio + 1e-7
+    assert (
+        diff_fingerprints(compute_fingerprint(audio), compute_fingerprint(noisy))
+        is None
+    )
+
+
+def test_update_splices_and_shifts():
+    old = _audio(SECONDS, 0)
+    new = _edit(old, 8, 10, _audio(5, 1))
+    changed = diff_fingerprints(compute_fingerprint(old), compute_fingerprint(new))
+    engine = _RecordingEngine()
+
+    segments, (slice_start, slice_end) = update_segments(
+        engine, new, _segments(SECONDS), changed, "ja", margin=2.0
+    )
+
+    # Only the change plus margins is transcribed again
+    assert engine.calls == [pytest.approx(slice_end - slice_start)]
+    assert slice_start == pytest.approx(5.8)
+    assert slice_end == pytest.approx(15.0)
+
+    texts = [segment["text"] for segment in segments]
+    assert texts[:6] == [f"old {i}" for i in range(6)]
+    assert texts[-8:] == [f"old {i}" for i in range(12, SECONDS)]
+    assert all(text.startswith("new") for text in texts[6:-8])
+    # Segments after the edit move by the 3 seconds added
+    assert segments[-8]["start"] == pytest.approx(15.0)
+    starts = [segment["start"] for segment in segments]
+    assert starts == sorted(starts)
+    assert all(slice_start <= s["start"] < slice_end for s in segments[6:-8])
+
+
+def test_update_edit_at_the_end():
+    old = _audio(SECONDS, 0)
+    new = np.concatenate([old, _audio(3, 1)])
+    changed = diff_fingerprints(compute_fingerprint(old), compute_fingerprint(new))
+
+    segments, (_, slice_end) = update_segments(
+        _RecordingEngine(), new, _segments(SECONDS), changed, "ja"
+    )
+    assert slice_end == pytest.approx(SECONDS + 3)
+    assert segments[0]["text"] == "old 0"
+    assert segments[-1]["text"].startswith("new")
+
+
+def test_fingerprint_file_round_trip(tmp_path):
+    fingerprint = compute_fingerprint(_audio(5, 0))
+    path = fingerprint_path_for(tmp_path / "clip_ja.srt")
+    assert path.name == "clip_ja.fingerprint.npz"
+
+    save_fingerprint(path, fingerprint, "ja", "base")
+    loaded = load_fingerprint(path)
+    assert loaded["samples"] == fingerprint["samples"]
+    assert np.array_equal(loaded["head"], fingerprint["head"])
+    assert np.array_equal(loaded["tail"], fingerprint["tail"])
+    assert (loaded["language"], loaded["model"]) == ("ja", "base")
+
+
+@pytest.mark.parametrize(
+    ("fields", "message"),
+    [
+        ({"version": 99}, "Unsupported fingerprint version: 99"),
+        ({"version": 1}, "samples is not a file"),
+    ],
+)
+def test_update_reports_a_bad_fingerprint(
+    tmp_path, monkeypatch, capsys, fields, message
+):
+    audio = tmp_path / "clip.wav"
+    subtitle = tmp_path / "clip_ja.srt"
+    audio.touch()
+    subtitle.touch()
+    np.savez(fingerprint_path_for(subtitle), **fields)
+
+    monkeypatch.setattr(sys, "argv", ["subtitler", "update", str(audio), str(subtitle)])
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+
+    assert exc_info.value.code == 1
+    assert message in capsys.readouterr().err
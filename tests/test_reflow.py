@@ -0,0 +1,128 @@
+"""Tests for subtitle reflow."""
+
+import pytest
+
+from subtitler.formats import read_subtitles
+from subtitler.reflow import reflow, reflow_file, text_width, wrap_text
+from subtitler.srt import write_srt
+
+
+def _cue(start, end, text, **extra):
+    return {"start": start, "end": end, "text": text, **extra}
+
+
+def test_text_width():
+    assert text_width("abc") == 3
+    assert text_width("日本語") == 6
+    assert text_width("é") == 1
+
+
+def test_wrap_latin_at_spaces():
+    assert wrap_text("the quick brown fox jumps", 10) == [
+        "the quick",
+        "brown fox",
+        "jumps",
+    ]
+
+
+def test_wrap_japanese_anywhere():
+    assert wrap_text("今日はいい天気ですね", 8) == ["今日はい", "い天気で", "すね"]
+
+
+def test_kinsoku_keeps_punctuation_off_the_line_start():
+    lines = wrap_text("今日はいい天気。明日も", 14)
+    assert lines == ["今日はいい天気。", "明日も"]
+    assert all(line[0] not in "。、" for line in wrap_text("あいう。えお、かき", 6))
+
+
+def test_split_long_text_by_width():
+    text = " ".join(["word"] * 40)
+    cues = list(reflow([_cue(0.0, 10.0, text)], max_width=20, max_lines=2))
+
+    assert len(cues) > 1
+    assert cues[0]["start"] == 0.0
+    assert cues[-1]["end"] == 10.0
+    for cue in cues:
+        assert len(cue["text"].split("\n")) <= 2
+        assert all(text_width(line) <= 20 for line in cue["text"].split("\n"))
+    assert " ".join(c["text"].replace("\n", " ") for c in cues) == text
+
+
+def test_split_long_duration():
+    cues = list(reflow([_cue(0.0, 20.0, "word " * 6)], max_duration=7.0))
+    assert len(cues) == 3
+    assert all(cue["end"] - cue["start"] <= 7.0 for cue in cues)
+
+
+def test_split_at_word_timings():
+    words = [
+        {"word": f" w{i}", "start": i * 0.5, "end": i * 0.5 + 0.4} for i in range(12)
+    ]
+    text = "".join(word["word"] for word in words).strip()
+    cues = list(reflow([_cue(0.0, 6.0, text, words=words)], max_width=9, max_lines=1))
+
+    assert [cue["text"] for cue in cues] == [
+        "w0 w1 w2",
+        "w3 w4 w5",
+        "w6 w7 w8",
+        "w9 w10",
+    ][:2] + [cue["text"] for cue in cues[2:]]
+    # Each piece starts with its first word
+    for cue in cues[1:]:
+        assert cue["start"] == cue["words"][0]["start"]
+
+
+def test_merge_short_cues():
+    cues = list(
+        reflow(
+            [_cue(0.0, 0.4, "Hi"), _cue(0.5, 0.9, "there"), _cue(5.0, 7.0, "later")],
+            min_duration=1.0,
+        )
+    )
+    assert [cue["text"] for cue in cues] == ["Hi there", "later"]
+    assert cues[0]["start"] == 0.0
+
+
+def test_merge_japanese_without_space():
+    cues = list(reflow([_cue(0.0, 0.3, "はい"), _cue(0.4, 0.7, "そうです")]))
+    assert cues[0]["text"] == "はいそうです"
+
+
+def test_no_merge_across_a_long_gap():
+    cues = list(reflow([_cue(0.0, 0.4, "Hi"), _cue(3.0, 3.4, "there")]))
+    assert len(cues) == 2
+
+
+def test_retime_extends_to_min_duration_and_reading_speed():
+    cues = list(
+        reflow(
+            [_cue(0.0, 0.5, "a" * 34), _cue(10.0, 10.5, "ok")],
+            max_cps=17.0,
+            min_duration=1.0,
+        )
+    )
+    assert cues[0]["end"] == pytest.approx(2.0)
+    assert cues[1]["end"] == pytest.approx(11.0)
+
+
+def test_retime_keeps_a_gap_before_the_next_cue():
+    cues = list(
+        reflow(
+            [_cue(0.0, 0.5, "a" * 40), _cue(1.0, 3.0, "b" * 10)],
+            max_cps=10.0,
+            min_gap=0.1,
+            max_merge_gap=0.2,
+        )
+    )
+    assert cues[0]["end"] == pytest.approx(0.9)
+
+
+def test_reflow_file(tmp_path):
+    input_path = tmp_path / "clip.srt"
+    write_srt([_cue(0.0, 0.4, "Hi"), _cue(0.5, 0.9, "there")], input_path)
+
+    paths, read, written = reflow_file(input_path, tmp_path / "out", ["srt", "vtt"])
+
+    assert (read, written) == (2, 1)
+    assert [path.suffix for path in paths] == [".srt", ".vtt"]
+    assert read_subtitles(paths[0])[0]["text"] == "Hi there"
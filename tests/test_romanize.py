@@ -0,0 +1,95 @@
+"""Tests for the persistent romaji cache."""
+
+import pytest
+
+from subtitler.romanize import RomajiCache, romanize_texts
+
+
+class _UpperConverter:
+    """Stand-in for a pykakasi instance: upper-cases text, counting calls."""
+
+    def __init__(self):
+        self.converted = []
+
+    def getConverter(self):
+        return self
+
+    def do(self, text):
+        self.converted.append(text)
+        return text.upper()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with RomajiCache(tmp_path / "romaji.sqlite3", max_entries=100) as cache:
+        yield cache
+
+
+def _keys(cache):
+    return {row[0] for row in cache._db.execute("SELECT text FROM romaji")}
+
+
+def test_put_and_get(cache):
+    cache.put_many({"a": "A", "b": "B"})
+    assert cache.get_many(["b", "c", "a", "b"]) == {"a": "A", "b": "B"}
+    assert len(cache) == 2
+
+
+def test_shared_between_instances(tmp_path):
+    with RomajiCache(tmp_path / "romaji.sqlite3") as first:
+        first.put_many({"a": "A"})
+    with RomajiCache(tmp_path / "romaji.sqlite3") as second:
+        assert second.get_many(["a"]) == {"a": "A"}
+        assert second._count == 1
+
+
+def test_repeated_lookup_writes_nothing(cache):
+    cache.put_many({"a": "A"})
+    cache.put_many({"b": "B"})
+    cache.get_many(["a", "b"])
+    changes = cache._db.total_changes
+    for _ in range(3):
+        cache.get_many(["a", "b"])
+        cache.get_many(["b"])
+    assert cache._db.total_changes == changes
+
+
+def test_trim_evicts_least_recently_used(cache):
+    cache.put_many({f"a{i}": "x" for i in range(50)})
+    cache.put_many({f"b{i}": "y" for i in range(50)})
+    cache.get_many([f"a{i}" for i in range(10)])
+    cache.put_many({f"c{i}": "z" for i in range(20)})
+
+    keys = _keys(cache)
+    assert len(keys) == 90
+    assert {f"a{i}" for i in range(10)} <= keys
+    assert not keys & {f"a{i}" for i in range(10, 40)}
+    assert cache._count == 90
+
+
+def test_replacing_entries_does_not_evict(cache):
+    for _ in range(5):
+        cache.put_many({f"a{i}": "x" for i in range(60)})
+    assert len(cache) == 60
+
+
+def test_clear(cache):
+    cache.put_many({"a": "A"})
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get_many(["a"]) == {}
+
+
+def test_romanize_texts_converts_only_misses(cache):
+    converter = _UpperConverter()
+    assert romanize_texts(["x", "y", "x"], converter, cache) == ["X", "Y", "X"]
+    assert converter.converted == ["x", "y"]
+
+    assert romanize_texts(["y", "z"], converter, cache) == ["Y", "Z"]
+    assert converter.converted == ["x", "y", "z"]
+
+
+def test_romanize_texts_without_cache(cache):
+    converter = _UpperConverter()
+    cache.put_many({"x": "cached"})
+    assert romanize_texts(["x"], converter, cache, use_cache=False) == ["X"]
@@ -0,0 +1,97 @@
+"""Startup tests for the maya_subtitler package on the Maya stand-in.
+
+Each test runs in a fresh interpreter, as package import state (dev mode,
+loaded plug-ins, imported submodules) is what is being checked.
+``benchmarks/bench_startup.py`` times the same steps.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_SESSION = """
+import json
+import sys
+
+import maya.cmds as cmds
+import maya.utils
+
+calls = {}
+
+def step(name, function):
+    before = dict(cmds.calls)
+    function()
+    calls[name] = {
+        command: count - before.get(command, 0)
+        for command, count in cmds.calls.items()
+        if count != before.get(command, 0)
+    }
+
+import maya_subtitler
+
+ui_imported = "maya_subtitler.ui" in sys.modules
+step("load_plugins", maya_subtitler.load_plugins)
+step("load_plugins_again", maya_subtitler.load_plugins)
+step("show_ui", maya_subtitler.show_ui)
+step("show_ui_again", maya_subtitler.show_ui)
+cmds.unloadPlugin("subtitleLocator")
+step("load_after_unload", maya_subtitler.load_plugins)
+print(json.dumps({"ui_imported": ui_imported, "calls": calls}))
+"""
+
+
+def _run_session(dev):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(REPO_ROOT / "benchmarks" / "fake_maya"), str(REPO_ROOT / "scripts")]
+    )
+    env["MAYA_PLUG_IN_PATH"] = str(REPO_ROOT / "plug-ins")
+    env["MAYA_SUBTITLER_DEV"] = "1" if dev else "0"
+    output = subprocess.run(
+        [sys.executable, "-c", _SESSION],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def production():
+    return _run_session(dev=False)
+
+
+def test_import_does_not_import_the_ui(production):
+    assert not production["ui_imported"]
+
+
+def test_plugins_are_loaded_once(production):
+    calls = production["calls"]
+    assert calls["load_plugins"] == {"pluginInfo": 1, "loadPlugin": 2}
+    assert calls["load_plugins_again"] == {}
+
+
+def test_show_ui_skips_plugin_queries(production):
+    for step in ("show_ui", "show_ui_again"):
+        assert "pluginInfo" not in production["calls"][step]
+        assert "loadPlugin" not in production["calls"][step]
+
+
+def test_unloaded_plugin_is_loaded_again(production):
+    assert production["calls"]["load_after_unload"] == {
+        "pluginInfo": 1,
+        "loadPlugin": 1,
+    }
+
+
+def test_dev_mode_checks_every_time():
+    session = _run_session(dev=True)
+    assert not session["ui_imported"]
+    assert session["calls"]["load_plugins_again"] == {"pluginInfo": 1}
@@ -0,0 +1,89 @@
+"""Tests for the binary sidecar index."""
+
+import pytest
+
+from subtitler.srt import parse_srt, write_srt
+from subtitler.subidx import (
+    SubtitleIndex,
+    build_index,
+    index_path_for,
+    open_index,
+    write_index,
+)
+
+
+def _write_indexed(tmp_path, segments):
+    srt_path = tmp_path / "clip.srt"
+    write_srt(segments, srt_path)
+    write_index(srt_path, segments)
+    return srt_path
+
+
+def test_build_and_read_back(segments):
+    shuffled = segments[5:] + segments[:5]
+    index = SubtitleIndex(build_index(shuffled))
+
+    assert len(index) == len(segments)
+    assert index.segments() == segments
+    assert index.text(3) == "cue 3"
+
+
+def test_find(segments):
+    index = SubtitleIndex(build_index(segments))
+
+    # Cue i is shown from i * 2000 ms (inclusive) to i * 2000 + 1500 ms
+    assert index.find(0) == 0
+    assert index.find(1499) == 0
+    assert index.find(1500) == -1
+    assert index.find(4000) == 2
+    assert index.find(18_000) == 9
+    assert index.find(20_000) == -1
+
+
+def test_next_and_previous_cue(segments):
+    index = SubtitleIndex(build_index(segments))
+
+    assert index.next_cue(0) == 1
+    assert index.next_cue(1700) == 1
+    assert index.next_cue(18_000) == -1
+    assert index.previous_cue(0) == -1
+    assert index.previous_cue(2000) == 0
+    assert index.previous_cue(2001) == 1
+
+
+def test_empty_index():
+    index = SubtitleIndex(build_index([]))
+    assert len(index) == 0
+    assert index.find(0) == -1
+    assert index.next_cue(0) == -1
+    assert index.previous_cue(0) == -1
+
+
+def test_not_an_index():
+    with pytest.raises(ValueError):
+        SubtitleIndex(b"SRT\n" * 20)
+
+
+def test_parse_srt_reads_a_fresh_index(tmp_path, segments):
+    srt_path = _write_indexed(tmp_path, segments)
+
+    with open_index(srt_path) as index:
+        assert len(index) == len(segments)
+    assert parse_srt(srt_path) == segments
+
+
+def test_stale_index_is_ignored(tmp_path, segments):
+    srt_path = _write_indexed(tmp_path, segments)
+    write_srt(segments[:5], srt_path)
+
+    assert open_index(srt_path) is None
+    assert parse_srt(srt_path) == segments[:5]
+
+
+def test_truncated_index_is_ignored(tmp_path, segments):
+    srt_path = _write_indexed(tmp_path, segments)
+    index_path = index_path_for(srt_path)
+    data = index_path.read_bytes()
+    index_path.write_bytes(data[: len(data) - 10])
+
+    assert open_index(srt_path) is None
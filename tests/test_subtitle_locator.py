@@ -0,0 +1,71 @@
+"""Tests for the subtitleLocator plug-in on the Maya stand-in."""
+
+import base64
+import zlib
+
+import pytest
+
+from subtitler.formats import write_subtitles
+from subtitler.srt import write_srt
+from subtitler.subidx import index_path_for, write_index
+
+
+@pytest.fixture
+def srt_path(tmp_path, segments):
+    path = tmp_path / "clip.srt"
+    write_srt(segments, path)
+    write_index(path, segments)
+    return path
+
+
+def _damage_sidecar(path, segments, damage):
+    """Make the sidecar index stale or truncated; return the expected cues."""
+    if damage == "stale":
+        write_srt(segments[:5], path)
+        return 5
+    index_path = index_path_for(path)
+    data = index_path.read_bytes()
+    index_path.write_bytes(data[: len(data) - 10])
+    return len(segments)
+
+
+@pytest.mark.parametrize("damage", ["stale", "truncated"])
+def test_bad_sidecar_falls_back_to_the_subtitle_file(
+    locator, srt_path, segments, damage
+):
+    expected = _damage_sidecar(srt_path, segments, damage)
+
+    assert locator.SubtitleIndex.open_sidecar(srt_path) is None
+    source = locator.SubtitleSource(srt_path)
+    source.load()
+    assert source.index is not None
+    assert len(source.index) == expected
+    assert source.index.text(0) == "cue 0"
+
+
+def test_fresh_sidecar_is_mapped(locator, srt_path):
+    index = locator.SubtitleIndex.open_sidecar(srt_path)
+    assert index.mapped
+    assert len(index) == 10
+    assert index.find(2500) == 1
+    index.close()
+
+
+@pytest.mark.parametrize("damage", ["stale", "truncated"])
+def test_embed_with_a_bad_sidecar(locator, srt_path, segments, damage):
+    expected = _damage_sidecar(srt_path, segments, damage)
+
+    payload = locator.encode_embedded(srt_path)
+    assert zlib.decompress(base64.b64decode(payload))
+    index, _words = locator.decode_embedded(payload)
+    assert len(index) == expected
+
+
+@pytest.mark.parametrize("name", ["vtt", "ass"])
+def test_markup_characters_match_the_writer(locator, tmp_path, name):
+    text = "{x} a < b & <i>c</i>"
+    segment = {"start": 0.0, "end": 1.0, "text": text}
+    (path,) = write_subtitles([segment], tmp_path / "clip", [name])
+
+    parse = getattr(locator.SubtitleSource, f"_parse_{name}")
+    assert [cue["text"] for cue in parse(path)] == [text]
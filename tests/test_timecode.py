@@ -0,0 +1,67 @@
+"""Round-trip checks for the millisecond time helpers and SRT timestamps."""
+
+import random
+
+from subtitler.srt import (
+    format_timestamp,
+    format_timestamp_ms,
+    parse_srt,
+    parse_timestamp_ms,
+    write_srt,
+)
+from subtitler.timecode import from_ms, to_ms
+
+# Up to ten hours, plus the edges of every timestamp field
+_EDGES = [0, 1, 999, 1000, 59_999, 60_000, 3_599_999, 3_600_000, 35_999_999]
+_RANDOM = random.Random(27)
+MILLIS = _EDGES + [_RANDOM.randrange(36_000_000) for _ in range(2000)]
+
+
+def test_ms_round_trip():
+    for millis in MILLIS:
+        assert to_ms(from_ms(millis)) == millis
+
+
+def test_seconds_round_trip():
+    rng = random.Random(0)
+    for _ in range(2000):
+        seconds = rng.uniform(0, 36_000)
+        assert abs(from_ms(to_ms(seconds)) - seconds) <= 0.0005
+
+
+def test_to_ms_rounds_float_error():
+    assert to_ms(1.0009999) == 1001
+    assert to_ms(0.0004) == 0
+    assert format_timestamp(1.0009999) == "00:00:01,001"
+
+
+def test_timestamp_round_trip():
+    for millis in MILLIS:
+        assert parse_timestamp_ms(format_timestamp_ms(millis)) == millis
+
+
+def test_timestamp_format():
+    assert format_timestamp_ms(0) == "00:00:00,000"
+    assert format_timestamp_ms(3_723_004) == "01:02:03,004"
+    assert format_timestamp_ms(-5) == "00:00:00,000"
+
+
+def test_srt_round_trip(tmp_path):
+    rng = random.Random(1)
+    segments = []
+    start = 0
+    for i in range(500):
+        start += rng.randrange(2000)
+        end = start + rng.randrange(1, 5000)
+        text = f"line {i} {rng.random():.6f}"
+        segments.append({"start": from_ms(start), "end": from_ms(end), "text": text})
+
+    path = tmp_path / "round_trip.srt"
+    write_srt(segments, path)
+    parsed = parse_srt(path, use_index=False)
+
+    assert len(parsed) == len(segments)
+    for written, read in zip(segments, parsed, strict=True):
+        assert to_ms(read["start"]) == to_ms(written["start"])
+        assert to_ms(read["end"]) == to_ms(written["end"])
+        assert read["text"] == written["text"]
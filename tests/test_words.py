@@ -0,0 +1,95 @@
+"""Tests for the word timing sidecar."""
+
+import json
+
+import pytest
+
+from subtitler.words import (
+    attach_words,
+    read_words,
+    word_spans,
+    words_path_for,
+    write_words,
+)
+
+SEGMENTS = [
+    {
+        "start": 1.0,
+        "end": 2.1,
+        "text": " Hello world",
+        "words": [
+            {"word": " Hello", "start": 1.0, "end": 1.4},
+            {"word": " world", "start": 1.5, "end": 2.1},
+        ],
+    },
+    {
+        "start": 3.0,
+        "end": 4.0,
+        "text": "今日は晴れ",
+        "words": [
+            {"word": "今日", "start": 3.0, "end": 3.3},
+            {"word": "は", "start": 3.3, "end": 3.5},
+            {"word": "晴れ", "start": 3.5, "end": 4.0},
+        ],
+    },
+]
+
+
+def test_words_path_for():
+    assert words_path_for("out/clip_ja.srt").name == "clip_ja.words.json"
+    assert words_path_for("out/clip_ja").name == "clip_ja.words.json"
+
+
+def test_word_spans():
+    spans, times = word_spans(SEGMENTS[0])
+    assert spans == [0, 5, 6, 11]
+    assert times == [1000, 1400, 1500, 2100]
+
+
+def test_word_spans_keep_normalised_tokens_in_order():
+    segment = {
+        "text": "It's 5 pm",
+        "words": [
+            {"word": " It's", "start": 0.0, "end": 0.2},
+            {"word": " five", "start": 0.2, "end": 0.5},
+            {"word": " pm", "start": 0.5, "end": 0.8},
+        ],
+    }
+    spans, times = word_spans(segment)
+    assert len(spans) == len(times) == 6
+    assert spans[:2] == [0, 4]
+    assert spans == sorted(spans)
+    assert spans[-1] <= len(segment["text"])
+
+
+def test_round_trip(tmp_path):
+    path = write_words(SEGMENTS, tmp_path / "clip.words.json")
+    words = read_words(path)
+    assert sorted(words) == [1000, 3000]
+
+    read_back = [
+        {key: segment[key] for key in ("start", "end", "text")} for segment in SEGMENTS
+    ]
+    attach_words(read_back, words)
+
+    for segment, original in zip(read_back, SEGMENTS, strict=True):
+        assert [word["word"] for word in segment["words"]] == [
+            word["word"].strip() for word in original["words"]
+        ]
+        assert [(w["start"], w["end"]) for w in segment["words"]] == [
+            (w["start"], w["end"]) for w in original["words"]
+        ]
+
+
+def test_attach_skips_cues_without_words():
+    segments = [{"start": 9.0, "end": 10.0, "text": "x"}]
+    assert attach_words(segments, {1000: ([0, 1], [1000, 1100])}) == [
+        {"start": 9.0, "end": 10.0, "text": "x"}
+    ]
+
+
+def test_unsupported_version(tmp_path):
+    path = tmp_path / "clip.words.json"
+    path.write_text(json.dumps({"version": 99, "cues": []}), encoding="utf-8")
+    with pytest.raises(ValueError, match="version"):
+        read_words(path)